@@ -1,17 +1,21 @@
 from django.core.management.base import BaseCommand
 
+# rows rebuilt per call of the set-based rebuild functions
+REBUILD_CHUNK_SIZE = 500
+
 
 def rebuild_teams_projection():
     from apps.teams.selectors import get_teams_table
 
     from ...models import TeamDetailView
-    from ...service import rebuild_team_projection
+    from ...service import rebuild_team_projections
 
     TeamDetailView.objects.all().delete()
 
-    for team in get_teams_table().all():
-        rebuild_team_projection(team.id)
-        print(f"Team [{team.id}] OK.")
+    ids = list(get_teams_table().prefetch_related(None).values_list("id", flat=True))
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        rebuild_team_projections(ids[i : i + REBUILD_CHUNK_SIZE])
+        print(f"Teams [{i + 1}-{min(i + REBUILD_CHUNK_SIZE, len(ids))}/{len(ids)}] OK.")
     print("Rebuild of all team projections triggered successfully")
 
 
@@ -19,13 +23,16 @@ def rebuild_students_projection():
     from apps.athletes.selectors import get_athletes_table
 
     from ...models import StudentDetailView
-    from ...service import rebuild_student_projection
+    from ...service import rebuild_student_projections
 
     StudentDetailView.objects.all().delete()
 
-    for student in get_athletes_table().all():
-        rebuild_student_projection(student.id)
-        print(f"Student [{student.id}] OK.")
+    ids = list(get_athletes_table().prefetch_related(None).values_list("id", flat=True))
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        rebuild_student_projections(ids[i : i + REBUILD_CHUNK_SIZE])
+        print(
+            f"Students [{i + 1}-{min(i + REBUILD_CHUNK_SIZE, len(ids))}/{len(ids)}] OK."
+        )
     print("Rebuild of all student projections triggered successfully")
 
 
@@ -33,13 +40,18 @@ def rebuild_tournaments_projection():
     from apps.tournaments.selectors import get_tournaments_table
 
     from ...models import TournamentDetailView
-    from ...service import rebuild_tournament_projection
+    from ...service import rebuild_tournament_projections
 
     TournamentDetailView.objects.all().delete()
 
-    for tournament in get_tournaments_table().all():
-        rebuild_tournament_projection(tournament.id)
-        print(f"Tournament [{tournament.id}] OK.")
+    ids = list(
+        get_tournaments_table().prefetch_related(None).values_list("id", flat=True)
+    )
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        rebuild_tournament_projections(ids[i : i + REBUILD_CHUNK_SIZE])
+        print(
+            f"Tournaments [{i + 1}-{min(i + REBUILD_CHUNK_SIZE, len(ids))}/{len(ids)}] OK."
+        )
     print("Rebuild of all tournament projections triggered successfully")
 
 
@@ -47,13 +59,16 @@ def rebuild_matches_projection():
     from apps.matches.selectors import get_matches_table
 
     from ...models import MatchDetailView
-    from ...service import rebuild_match_projection
+    from ...service import rebuild_match_projections
 
     MatchDetailView.objects.all().delete()
 
-    for match in get_matches_table().all():
-        rebuild_match_projection(match.id)
-        print(f"Match [{match.id}] OK.")
+    ids = list(get_matches_table().prefetch_related(None).values_list("id", flat=True))
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        rebuild_match_projections(ids[i : i + REBUILD_CHUNK_SIZE])
+        print(
+            f"Matches [{i + 1}-{min(i + REBUILD_CHUNK_SIZE, len(ids))}/{len(ids)}] OK."
+        )
     print("Rebuild of all match projections triggered successfully")
 
 
@@ -144,6 +159,36 @@ def rebuild_regulations_projection():
     print("Rebuild of all regulations projections triggered successfully")
 
 
+def refresh_public_cache():
+    from shared.cache.delayed import public_cache_tasks
+    from shared.cache.invalidation import cache_invalidation_publisher
+    from shared.cache.proxy_purge import proxy_cache_purger
+    from workers.projections_updater.models import ProjectionUpdateRequestTypes
+
+    projection_types = (
+        ProjectionUpdateRequestTypes.TEAM,
+        ProjectionUpdateRequestTypes.ATHLETE,
+        ProjectionUpdateRequestTypes.TOURNAMENT,
+        ProjectionUpdateRequestTypes.MATCH,
+        ProjectionUpdateRequestTypes.TOURNAMENT_STANDING,
+        ProjectionUpdateRequestTypes.GENERAL_RANKING,
+        ProjectionUpdateRequestTypes.MODALITY_RANKING,
+        ProjectionUpdateRequestTypes.NUCLEO,
+        ProjectionUpdateRequestTypes.SEASON,
+        ProjectionUpdateRequestTypes.REGULATION,
+    )
+    for projection_type in projection_types:
+        cache_invalidation_publisher.publish(projection_type)
+    cache_invalidation_publisher.request_warmup()
+    proxy_cache_purger.purge(
+        {projection_type: None for projection_type in projection_types}
+    )
+    # invalidations and refreshes run in the background (after the public API
+    # read replica's lag, if any)
+    public_cache_tasks.join()
+    print("Public API cache invalidated and warm-up requested")
+
+
 class Command(BaseCommand):
     def handle(self, *args, **kwargs):
 
@@ -157,4 +202,4 @@ class Command(BaseCommand):
         rebuild_nuclei_projection()
         rebuild_seasons_projection()
         rebuild_regulations_projection()
-        pass
+        refresh_public_cache()
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.5 on 2026-10-17 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projections", "0010_matchdetailview_courses_ids_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="matchdetailview",
+            name="projections_start_t_0990f5_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="tournamentdetailview",
+            name="projections_start_d_cd61ec_idx",
+        ),
+        migrations.AddIndex(
+            model_name="matchdetailview",
+            index=models.Index(
+                fields=["start_time", "match_id"], name="projections_start_t_143b25_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="matchdetailview",
+            index=models.Index(
+                fields=["tournament_id", "start_time", "match_id"],
+                name="projections_tournam_0ca2f3_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentdetailview",
+            index=models.Index(
+                fields=["full_name", "student_id"],
+                name="projections_full_na_9df380_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teamdetailview",
+            index=models.Index(
+                fields=["team_name", "team_id"], name="projections_team_na_34dba7_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tournamentdetailview",
+            index=models.Index(
+                fields=["start_date", "tournament_id"],
+                name="projections_start_d_6e4c6f_idx",
+            ),
+        ),
+    ]
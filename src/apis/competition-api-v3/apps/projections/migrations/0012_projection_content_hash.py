@@ -0,0 +1,33 @@
+# Generated by Django 6.0.5 on 2026-10-17 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projections", "0011_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="matchdetailview",
+            name="content_hash",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="studentdetailview",
+            name="content_hash",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="teamdetailview",
+            name="content_hash",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="tournamentdetailview",
+            name="content_hash",
+            field=models.CharField(default="", max_length=64),
+        ),
+    ]
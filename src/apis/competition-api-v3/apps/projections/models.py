@@ -27,11 +27,15 @@ class TeamDetailView(models.Model):
     player_count = models.IntegerField()
     players = models.JSONField()
 
+    # hash of the other columns: rebuilds only rewrite rows whose content changed
+    content_hash = models.CharField(max_length=64, default="")
+
     class Meta:
         indexes = [
             models.Index(fields=["course_id"]),
             models.Index(fields=["nucleo_id"]),
             models.Index(fields=["modality_id"]),
+            models.Index(fields=["team_name", "team_id"]),  # Keyset pagination
         ]
 
 
@@ -53,11 +57,15 @@ class StudentDetailView(models.Model):
 
     team_count = models.IntegerField()
 
+    # hash of the other columns: rebuilds only rewrite rows whose content changed
+    content_hash = models.CharField(max_length=64, default="")
+
     class Meta:
         indexes = [
             models.Index(fields=["course_id"]),
             models.Index(fields=["nucleo_id"]),
             models.Index(fields=["student_number"]),
+            models.Index(fields=["full_name", "student_id"]),  # Keyset pagination
         ]
 
 
@@ -78,10 +86,13 @@ class TournamentDetailView(models.Model):
     competitor_count = models.IntegerField()
     match_count = models.IntegerField()
 
+    # hash of the other columns: rebuilds only rewrite rows whose content changed
+    content_hash = models.CharField(max_length=64, default="")
+
     class Meta:
         indexes = [
             models.Index(fields=["status"]),
-            models.Index(fields=["start_date"]),
+            models.Index(fields=["start_date", "tournament_id"]),  # Keyset pagination
             models.Index(fields=["modality_id"]),
         ]
 
@@ -114,11 +125,15 @@ class MatchDetailView(models.Model):
         models.UUIDField(), blank=True, default=list
     )  # List of course IDs involved in the match
 
+    # hash of the other columns: rebuilds only rewrite rows whose content changed
+    content_hash = models.CharField(max_length=64, default="")
+
     class Meta:
         indexes = [
             models.Index(fields=["status"]),
-            models.Index(fields=["start_time"]),
+            models.Index(fields=["start_time", "match_id"]),  # Keyset pagination
             models.Index(fields=["tournament_id"]),
+            models.Index(fields=["tournament_id", "start_time", "match_id"]),
             models.Index(fields=["modality_id"]),
             GinIndex(fields=["nucleos_ids"]),  # GIN index for array field
             GinIndex(fields=["courses_ids"]),  # GIN index for array field
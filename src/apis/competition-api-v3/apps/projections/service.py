@@ -1,18 +1,18 @@
+import hashlib
+import json
 from uuid import UUID
 
-from apps.athletes.selectors import get_athlete_by_id
 from apps.courses.selectors import get_course_by_id
-from apps.matches.selectors import get_match_by_id
 from apps.modalities.selectors import get_modality_by_id
 from apps.nucleus.selectors import get_nucleus_by_id
 from apps.ranking.selectors import get_general_ranking, get_modality_ranking
 from apps.regulations.selectors import get_regulation_by_id
 from apps.seasons.selectors import get_season_by_id
-from apps.teams.selectors import get_team_by_id
 from apps.tournaments.formats import FormatRegistry
 from apps.tournaments.models import TournamentStatus
 from apps.tournaments.selectors import get_tournament_by_id, get_tournament_results
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Count, Prefetch
 
 from .models import (
     CourseDetailView,
@@ -30,175 +30,327 @@ from .models import (
 )
 
 
-@transaction.atomic(savepoint=False)
-def rebuild_team_projection(team_id: UUID):
-    from apps.teams.models import Team
-
-    # delete existing projection for the team before creating a new one
-    TeamDetailView.objects.filter(team_id=team_id).delete()
-
-    try:
-        team = get_team_by_id(team_id)
-    except Team.DoesNotExist:
-        return None
+def _modality_types(modality_seasons: set) -> dict:
+    """Modality type of each (modality_id, season_id) pair, as Modality.modality_type does."""
+    from apps.modalities.models import SeasonModality
 
-    modality_type = team.modality.modality_type(team.season_id)
-    if not modality_type:
-        return None
+    if not modality_seasons:
+        return {}
 
-    # create a new projection for the team
-    projection = TeamDetailView.objects.create(
-        team_id=team.id,
-        team_name=team.name,
-        team_season_id=team.season_id,
-        course_id=team.course_id,
-        course_name=team.course.name,
-        course_abbreviation=team.course.abbreviation,
-        nucleo_id=team.course.nucleus.id,
-        nucleo_name=team.course.nucleus.name,
-        nucleo_abbreviation=team.course.nucleus.abbreviation,
-        nucleo_logo_url=team.course.nucleus.logo_url,
-        modality_id=team.modality_id,
-        modality_name=team.modality.name,
-        modality_type_id=modality_type.id,
-        modality_type_name=modality_type.name,
-        player_count=team.athletes.count(),
-        players=[
-            {
-                "student_id": str(player.id) if player.id else None,
-                "student_number": player.student_number,
-                "full_name": player.name,
-                "is_member": player.is_member,
-            }
-            for player in team.athletes.all()
-        ],
+    season_modalities = (
+        SeasonModality.objects.filter(
+            modality_id__in={modality_id for modality_id, _ in modality_seasons},
+            season_id__in={season_id for _, season_id in modality_seasons},
+        )
+        .select_related("modality_type")
+        .order_by("id")
     )
 
-    return projection
+    modality_types = {}
+    for season_modality in season_modalities:
+        modality_types.setdefault(
+            (season_modality.modality_id, season_modality.season_id),
+            season_modality.modality_type,
+        )
+    return modality_types
+
+
+def _content_hash(projection) -> str:
+    """Hash of the content of a projection row (every column but the hash itself)."""
+    content = {
+        field.attname: getattr(projection, field.attname)
+        for field in projection._meta.concrete_fields
+        if field.attname != "content_hash"
+    }
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _upsert_projections(model, ids: list, projections: list) -> list:
+    """
+    Write the rebuilt projections of `ids`, returning the ids of the rows that changed.
+
+    Rows are upserted (INSERT ... ON CONFLICT DO UPDATE) only when their content
+    hash differs from the stored one, so unchanged rows are not rewritten (no dead
+    tuples, index churn or WAL for them). Rows of `ids` that were not rebuilt are
+    deleted, as their source no longer exists.
+    """
+    pk = model._meta.pk
+    table = connection.ops.quote_name(model._meta.db_table)
+    pk_column = connection.ops.quote_name(pk.column)
+
+    changed_ids = []
+
+    rebuilt_ids = {projection.pk for projection in projections}
+    stale_rows = model.objects.filter(pk__in=ids).exclude(pk__in=rebuilt_ids)
+    stale_ids = list(stale_rows.values_list("pk", flat=True))
+    if stale_ids:
+        model.objects.filter(pk__in=stale_ids).delete()
+        changed_ids += stale_ids
+
+    if not projections:
+        return changed_ids
+
+    fields = model._meta.concrete_fields
+    columns = [connection.ops.quote_name(field.column) for field in fields]
+    updates = [
+        f"{column} = EXCLUDED.{column}" for column in columns if column != pk_column
+    ]
+
+    params = []
+    for projection in projections:
+        projection.content_hash = _content_hash(projection)
+        params += [
+            field.get_db_prep_save(getattr(projection, field.attname), connection)
+            for field in fields
+        ]
+    row = f"({', '.join(['%s'] * len(fields))})"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES {', '.join([row] * len(projections))} "
+            f"ON CONFLICT ({pk_column}) DO UPDATE SET {', '.join(updates)} "
+            f"WHERE {table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+            f"RETURNING {pk_column}",
+            params,
+        )
+        changed_ids += [pk.to_python(row_id) for (row_id,) in cursor.fetchall()]
+
+    return changed_ids
 
 
 @transaction.atomic(savepoint=False)
-def rebuild_student_projection(student_id: UUID):
+def rebuild_team_projections(team_ids: list) -> list:
+    """
+    Rebuild the projections of a set of teams with a fixed number of queries.
+
+    Returns the ids of the projections that changed.
+    """
     from apps.athletes.models import Athlete
+    from apps.teams.models import Team
 
-    # delete existing projection for the student before creating a new one
-    StudentDetailView.objects.filter(student_id=student_id).delete()
+    teams = list(
+        Team.objects.filter(id__in=team_ids)
+        .select_related("modality", "course__nucleus")
+        .prefetch_related(Prefetch("athletes", queryset=Athlete.objects.order_by("id")))
+    )
+    modality_types = _modality_types({(t.modality_id, t.season_id) for t in teams})
+
+    projections = []
+    for team in teams:
+        modality_type = modality_types.get((team.modality_id, team.season_id))
+        if not modality_type:
+            continue
+
+        players = list(team.athletes.all())
+        projections.append(
+            TeamDetailView(
+                team_id=team.id,
+                team_name=team.name,
+                team_season_id=team.season_id,
+                course_id=team.course_id,
+                course_name=team.course.name,
+                course_abbreviation=team.course.abbreviation,
+                nucleo_id=team.course.nucleus.id,
+                nucleo_name=team.course.nucleus.name,
+                nucleo_abbreviation=team.course.nucleus.abbreviation,
+                nucleo_logo_url=team.course.nucleus.logo_url,
+                modality_id=team.modality_id,
+                modality_name=team.modality.name,
+                modality_type_id=modality_type.id,
+                modality_type_name=modality_type.name,
+                player_count=len(players),
+                players=[
+                    {
+                        "student_id": str(player.id) if player.id else None,
+                        "student_number": player.student_number,
+                        "full_name": player.name,
+                        "is_member": player.is_member,
+                    }
+                    for player in players
+                ],
+            )
+        )
 
-    try:
-        student = get_athlete_by_id(student_id)
-    except Athlete.DoesNotExist:
-        return None
+    return _upsert_projections(TeamDetailView, team_ids, projections)
 
-    # create a new projection for the student
-    projection = StudentDetailView.objects.create(
-        student_id=student.id,
-        student_number=student.student_number,
-        full_name=student.name,
-        is_member=student.is_member,
-        course_id=student.course.id,
-        course_name=student.course.name,
-        course_abbreviation=student.course.abbreviation,
-        nucleo_id=student.course.nucleus.id,
-        nucleo_name=student.course.nucleus.name,
-        nucleo_abbreviation=student.course.nucleus.abbreviation,
-        team_count=student.teams.count(),
-    )
 
-    return projection
+def rebuild_team_projection(team_id: UUID) -> bool:
+    """Rebuild the projection of a team, returning whether it changed."""
+    return bool(rebuild_team_projections([team_id]))
 
 
 @transaction.atomic(savepoint=False)
-def rebuild_tournament_projection(tournament_id: UUID):
-    from apps.tournaments.models import Tournament
+def rebuild_student_projections(student_ids: list) -> list:
+    """
+    Rebuild the projections of a set of students with a fixed number of queries.
 
-    # delete existing projection for the tournament before creating a new one
-    TournamentDetailView.objects.filter(tournament_id=tournament_id).delete()
+    Returns the ids of the projections that changed.
+    """
+    from apps.athletes.models import Athlete
 
-    try:
-        tournament = get_tournament_by_id(tournament_id)
-    except Tournament.DoesNotExist:
-        return None
+    students = (
+        Athlete.objects.filter(id__in=student_ids)
+        .select_related("course__nucleus")
+        .annotate(team_count=Count("teams"))
+    )
 
-    # create a new projection for the tournament
-    projection = TournamentDetailView.objects.create(
-        tournament_id=tournament.id,
-        tournament_name=tournament.name,
-        tournament_season_id=tournament.season_id,
-        start_date=tournament.start_date,
-        status=tournament.status,
-        modality_id=tournament.modality_id,
-        modality_name=tournament.modality.name,
-        modality_type_id=tournament.modality.modality_type(tournament.season_id).id,
-        modality_type_name=tournament.modality.modality_type(tournament.season_id).name,
-        competitor_count=tournament.competitors.count(),
-        match_count=tournament.matches.count(),
+    return _upsert_projections(
+        StudentDetailView,
+        student_ids,
+        [
+            StudentDetailView(
+                student_id=student.id,
+                student_number=student.student_number,
+                full_name=student.name,
+                is_member=student.is_member,
+                course_id=student.course.id,
+                course_name=student.course.name,
+                course_abbreviation=student.course.abbreviation,
+                nucleo_id=student.course.nucleus.id,
+                nucleo_name=student.course.nucleus.name,
+                nucleo_abbreviation=student.course.nucleus.abbreviation,
+                team_count=student.team_count,
+            )
+            for student in students
+        ],
     )
 
-    return projection
 
+def rebuild_student_projection(student_id: UUID) -> bool:
+    """Rebuild the projection of a student, returning whether it changed."""
+    return bool(rebuild_student_projections([student_id]))
 
-@transaction.atomic(savepoint=False)
-def rebuild_match_projection(match_id: UUID):
-    from apps.matches.models import Match
 
-    # delete existing projection for the match before creating a new one
-    MatchDetailView.objects.filter(match_id=match_id).delete()
+@transaction.atomic(savepoint=False)
+def rebuild_tournament_projections(tournament_ids: list) -> list:
+    """
+    Rebuild the projections of a set of tournaments with a fixed number of queries.
 
-    # get the match data
-    try:
-        match = get_match_by_id(match_id)
-    except Match.DoesNotExist:
-        return None
+    Returns the ids of the projections that changed.
+    """
+    from apps.tournaments.models import Tournament
 
-    if match.scheduled_time is None:
-        # if the match does not have location or scheduled time, we cannot build the projection
-        return None
+    tournaments = list(
+        Tournament.objects.filter(id__in=tournament_ids)
+        .select_related("modality")
+        .annotate(
+            competitor_count=Count("competitors", distinct=True),
+            match_count=Count("matches", distinct=True),
+        )
+    )
+    modality_types = _modality_types(
+        {(t.modality_id, t.season_id) for t in tournaments}
+    )
 
-    # create a new projection for the match
-    projection = MatchDetailView.objects.create(
-        match_id=match.id,
-        location=match.location or "TBD",
-        status=match.status,
-        start_time=match.scheduled_time,
-        tournament_id=match.tournament.id,
-        tournament_name=match.tournament.name,
-        modality_id=match.tournament.modality_id,
-        modality_name=match.tournament.modality.name,
-        participants=[
-            {
-                "participant_id": str(participant.id),
-                "competitor_id": str(participant.competitor.id),
-                "participant_type": participant.participant_type,
-                "competitor_entity_id": str(participant.entity_id),
-                "participant_name": participant.name,
-            }
-            for participant in match.participants.all()
-        ],
-        results=[
-            {
-                "participant_id": str(participant.id),
-                "score": participant.score,
-                "position": participant.position,
-            }
-            for participant in match.participants.all()
-        ],
-        participant_count=match.participants.count(),
-        comment_count=match.comments.count(),
-        nucleos_ids=list(
-            set(
-                participant.competitor.entity.course.nucleus.id
-                for participant in match.participants.all()
+    projections = []
+    for tournament in tournaments:
+        modality_type = modality_types.get(
+            (tournament.modality_id, tournament.season_id)
+        )
+        if not modality_type:
+            continue
+
+        projections.append(
+            TournamentDetailView(
+                tournament_id=tournament.id,
+                tournament_name=tournament.name,
+                tournament_season_id=tournament.season_id,
+                start_date=tournament.start_date,
+                status=tournament.status,
+                modality_id=tournament.modality_id,
+                modality_name=tournament.modality.name,
+                modality_type_id=modality_type.id,
+                modality_type_name=modality_type.name,
+                competitor_count=tournament.competitor_count,
+                match_count=tournament.match_count,
             )
-        ),
-        courses_ids=list(
-            set(
-                participant.competitor.entity.course.id
-                for participant in match.participants.all()
+        )
+
+    return _upsert_projections(TournamentDetailView, tournament_ids, projections)
+
+
+def rebuild_tournament_projection(tournament_id: UUID) -> bool:
+    """Rebuild the projection of a tournament, returning whether it changed."""
+    return bool(rebuild_tournament_projections([tournament_id]))
+
+
+@transaction.atomic(savepoint=False)
+def rebuild_match_projections(match_ids: list) -> list:
+    """
+    Rebuild the projections of a set of matches with a fixed number of queries.
+
+    Returns the ids of the projections that changed.
+    """
+    from apps.matches.models import Match, MatchParticipant
+
+    # matches without a scheduled time cannot be projected
+    matches = (
+        Match.objects.filter(id__in=match_ids, scheduled_time__isnull=False)
+        .select_related("tournament__modality")
+        .annotate(comment_count=Count("comments"))
+        .prefetch_related(
+            Prefetch(
+                "participants",
+                queryset=MatchParticipant.objects.select_related(
+                    "competitor__tournament",
+                    "competitor__athlete__course__nucleus",
+                    "competitor__team__course__nucleus",
+                ).order_by("id"),
             )
-        ),
+        )
     )
 
-    return projection
+    projections = []
+    for match in matches:
+        participants = list(match.participants.all())
+        entities = [participant.competitor.entity for participant in participants]
+
+        projections.append(
+            MatchDetailView(
+                match_id=match.id,
+                location=match.location or "TBD",
+                status=match.status,
+                start_time=match.scheduled_time,
+                tournament_id=match.tournament.id,
+                tournament_name=match.tournament.name,
+                modality_id=match.tournament.modality_id,
+                modality_name=match.tournament.modality.name,
+                participants=[
+                    {
+                        "participant_id": str(participant.id),
+                        "competitor_id": str(participant.competitor.id),
+                        "participant_type": participant.participant_type,
+                        "competitor_entity_id": str(participant.entity_id),
+                        "participant_name": participant.name,
+                    }
+                    for participant in participants
+                ],
+                results=[
+                    {
+                        "participant_id": str(participant.id),
+                        "score": participant.score,
+                        "position": participant.position,
+                    }
+                    for participant in participants
+                ],
+                participant_count=len(participants),
+                comment_count=match.comment_count,
+                nucleos_ids=sorted(
+                    set(entity.course.nucleus.id for entity in entities)
+                ),
+                courses_ids=sorted(set(entity.course.id for entity in entities)),
+            )
+        )
+
+    return _upsert_projections(MatchDetailView, match_ids, projections)
+
+
+def rebuild_match_projection(match_id: UUID) -> bool:
+    """Rebuild the projection of a match, returning whether it changed."""
+    return bool(rebuild_match_projections([match_id]))
 
 
 @transaction.atomic(savepoint=False)
@@ -185,6 +185,16 @@ LOKI_LOGGING_URL = os.getenv(
 )
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Request logging (shared.logging.middleware.RequestLoggingMiddleware)
+# fraction of successful requests logged; 4xx/5xx responses are always logged
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", 1.0))
+# maximum characters of a request payload or response body kept in the log
+REQUEST_LOG_BODY_LIMIT = int(os.getenv("REQUEST_LOG_BODY_LIMIT", 1000))
+# log the body of successful GET responses (lists can be large)
+REQUEST_LOG_GET_RESPONSES = (
+    os.getenv("REQUEST_LOG_GET_RESPONSES", "false").lower() == "true"
+)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -203,7 +213,7 @@ LOGGING = {
             "filters": ["ignore_health_metrics"],
         },
         "loki": {
-            "class": "logging_loki.LokiHandler",
+            "class": "shared.logging.loki.BatchedLokiHandler",
             "url": LOKI_LOGGING_URL,
             "tags": {
                 "application": "django-api",
@@ -269,6 +279,49 @@ MINIO_PASSWORD = os.getenv("MINIO_PASSWORD", "minioadmin")
 MINIO_USE_SSL = os.getenv("MINIO_USE_SSL", "false").lower() == "true"
 
 
+# Redis settings (public API cache invalidation)
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
+PUBLIC_CACHE_INVALIDATION_ENABLED = (
+    os.getenv("PUBLIC_CACHE_INVALIDATION_ENABLED", "true").lower() == "true"
+)
+PUBLIC_CACHE_INVALIDATION_CHANNEL = os.getenv(
+    "PUBLIC_CACHE_INVALIDATION_CHANNEL", "public-api:cache-invalidation"
+)
+# Read replica of the public API (its READ_REPLICA_URL and READ_REPLICA_MAX_LAG):
+# cache entries recomputed before it replays a change would be stale, so changes
+# are invalidated once more after its maximum lag (seconds, 0 without replica)
+PUBLIC_CACHE_REPLICA_DELAY = (
+    float(os.getenv("PUBLIC_READ_REPLICA_MAX_LAG", 10))
+    if os.getenv("PUBLIC_READ_REPLICA_URL")
+    else 0
+)
+# nginx location refreshing the public API micro-cache (e.g.
+# http://nginx:8081/purge/api/public); empty to disable
+PUBLIC_PROXY_CACHE_PURGE_URL = os.getenv("PUBLIC_PROXY_CACHE_PURGE_URL", "")
+
+# Projections worker: woken up by NOTIFY when requests are created, this is only
+# the fallback poll (seconds) for notifications that could not be received
+PROJECTIONS_WORKER_POLL_INTERVAL = float(
+    os.getenv("PROJECTIONS_WORKER_POLL_INTERVAL", 10)
+)
+# threads per worker process, projection types it handles (comma-separated, empty
+# for all) and requests claimed at once by each thread
+PROJECTIONS_WORKER_THREADS = int(os.getenv("PROJECTIONS_WORKER_THREADS", 1))
+PROJECTIONS_WORKER_TYPES = os.getenv("PROJECTIONS_WORKER_TYPES", "")
+PROJECTIONS_WORKER_BATCH_SIZE = int(os.getenv("PROJECTIONS_WORKER_BATCH_SIZE", 200))
+# a request whose rebuild fails is retried after PROJECTIONS_WORKER_RETRY_DELAY
+# seconds, doubled after each failure, and marked as failed after
+# PROJECTIONS_WORKER_MAX_ATTEMPTS failures
+PROJECTIONS_WORKER_MAX_ATTEMPTS = int(os.getenv("PROJECTIONS_WORKER_MAX_ATTEMPTS", 5))
+PROJECTIONS_WORKER_RETRY_DELAY = float(os.getenv("PROJECTIONS_WORKER_RETRY_DELAY", 30))
+# touched every few seconds while all the worker threads are running
+PROJECTIONS_WORKER_HEALTH_FILE = os.getenv(
+    "PROJECTIONS_WORKER_HEALTH_FILE", "/tmp/projections-worker.health"
+)
+
+
 # Keycloak settings
 KEYCLOAK_REALM = os.getenv("KEYCLOAK_REALM", "taca-ua")
 KEYCLOAK_ADMIN_SERVER_URL = os.getenv(
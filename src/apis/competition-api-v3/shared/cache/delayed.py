@@ -0,0 +1,85 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class DelayedCalls:
+    """
+    Run calls on a background (daemon) thread, each once its delay has elapsed.
+
+    Calls run one at a time, in the order they are due, so that they never block
+    the thread scheduling them; a failing call is logged and does not stop the
+    others. The thread is only started by the first scheduled call.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # heap of (due time, sequence, function, arguments)
+        self._calls = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._flushing = False
+
+    def schedule(self, delay: float, function: Callable, *args) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._calls,
+                (time.monotonic() + delay, next(self._sequence), function, args),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def join(self, now: bool = False) -> None:
+        """
+        Wait until every scheduled call has run.
+
+        With `now`, the pending calls run right away instead of when due, e.g.
+        when the process is stopping.
+        """
+        with self._condition:
+            if now and self._calls:
+                self._flushing = True
+                self._condition.notify_all()
+            self._condition.wait_for(lambda: not self._calls and not self._running)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._flushing and (
+                    not self._calls or self._calls[0][0] > time.monotonic()
+                ):
+                    self._condition.wait(
+                        self._calls[0][0] - time.monotonic() if self._calls else None
+                    )
+                if not self._calls:
+                    self._flushing = False
+                    continue
+                _, _, function, args = heapq.heappop(self._calls)
+                self._running = True
+
+            try:
+                function(*args)
+            except Exception as e:
+                logger.error(f"Error running delayed {self.name} call: {e}")
+            finally:
+                with self._condition:
+                    self._running = False
+                    if not self._calls:
+                        self._flushing = False
+                    self._condition.notify_all()
+
+
+# background work following projection changes (delayed cache invalidations, proxy
+# cache refreshes): a single thread, so calls with the same delay run in order
+public_cache_tasks = DelayedCalls("public-cache")
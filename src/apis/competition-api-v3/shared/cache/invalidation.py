@@ -0,0 +1,239 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Iterable, Optional
+
+import redis
+from config import settings
+
+from .delayed import public_cache_tasks
+
+logger = logging.getLogger(__name__)
+
+# Generation counters of the public API cache namespaces
+GENERATION_KEY_PREFIX = "cache:gen:"
+
+# Public API cache entries affected by each projection type, mirroring
+# PROJECTION_CACHE_KEYS of the public API (app/cache.py): keep both in sync.
+# "entity" is the (key bases, id argument, namespace) of the entries deleted per
+# rebuilt id (see call_key), "scoped" the namespace bumped per id, "lists" are
+# bumped whenever ids are reported and "all" is used instead when the whole
+# projection was rebuilt.
+PROJECTION_CACHE_KEYS: dict[str, dict] = {
+    "team": {
+        "entity": (("team", "response:get_team"), "team_id", "team"),
+        "lists": ["team:list"],
+        "all": ["team", "team:list"],
+    },
+    "athlete": {
+        "entity": (("student", "response:get_student"), "student_id", "student"),
+        "lists": ["student:list", "student:number"],
+        "all": ["student", "student:list", "student:number"],
+    },
+    "tournament": {
+        "entity": (
+            ("tournament", "response:get_tournament"),
+            "tournament_id",
+            "tournament",
+        ),
+        "lists": ["tournament:list"],
+        "all": ["tournament", "tournament:list"],
+    },
+    "match": {
+        "entity": (("match", "response:get_match"), "match_id", "match"),
+        "lists": ["match:list"],
+        "all": ["match", "match:list"],
+    },
+    "tournament_standing": {
+        "scoped": "standings:{id}",
+        "lists": ["standings:competitors"],
+        "all": ["standings"],
+    },
+    "general_ranking": {
+        "scoped": "ranking:general:{id}",
+        "lists": ["ranking:course"],
+        "all": ["ranking:general", "ranking:course"],
+    },
+    "modality_ranking": {
+        "scoped": "ranking:modality:{id}",
+        "lists": ["ranking:modality:course"],
+        "all": ["ranking:modality", "ranking:modality:course"],
+    },
+    "nucleo": {
+        "entity": (("nucleo", "response:get_nucleo"), "nucleo_id", "nucleo"),
+        "lists": ["nucleo:list"],
+        "all": ["nucleo", "nucleo:list"],
+    },
+    "season": {"all": ["season:list"]},
+    "regulation": {"all": ["regulation:list"]},
+    "home_page_config": {"all": ["home_page_config"]},
+    "course": {"all": ["course:list"]},
+}
+
+
+def call_key(base: str, params: dict) -> str:
+    """
+    Unversioned public API cache key of a call, as built by its `call_key`.
+
+    The public API hashes its arguments encoded as sorted, compact JSON (with
+    orjson); for the string ids used here json produces the same bytes.
+    """
+    canonical = json.dumps(
+        params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode()
+    return f"{base}:{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+
+
+class CacheInvalidationPublisher:
+    """
+    Invalidate the public API cache entries of changed projections.
+
+    The shared (Redis) tier is invalidated here, once per change: the
+    generations of the affected namespaces are bumped and the entries of the
+    rebuilt entities deleted. The change is then published so that each public
+    API process drops its own in-process copies.
+
+    When the public API reads from a replica, entries recomputed before it has
+    replayed the change would be stale, so changes are invalidated once more
+    after PUBLIC_CACHE_REPLICA_DELAY seconds, from a background thread
+    (public_cache_tasks).
+    """
+
+    # above this number of ids the whole projection family is invalidated instead
+    MAX_IDS_PER_MESSAGE = 500
+
+    def __init__(self, channel: str):
+        self.channel = channel
+
+        self._client = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        return self._client
+
+    def publish(self, projection_type: str, ids: Optional[Iterable] = None) -> None:
+        """
+        Invalidate the public API cache of a projection type and publish the change.
+
+        `ids` are the identifiers of the rebuilt projection rows; when omitted (or
+        too many) every cached entry of that projection is invalidated.
+        """
+        if not settings.PUBLIC_CACHE_INVALIDATION_ENABLED:
+            return
+
+        if ids is not None:
+            ids = sorted({str(i) for i in ids})
+            if len(ids) > self.MAX_IDS_PER_MESSAGE:
+                ids = None
+
+        self._publish(str(projection_type), ids)
+        if settings.PUBLIC_CACHE_REPLICA_DELAY:
+            public_cache_tasks.schedule(
+                settings.PUBLIC_CACHE_REPLICA_DELAY,
+                self._publish,
+                str(projection_type),
+                ids,
+            )
+
+    def _publish(self, projection_type: str, ids: Optional[list]) -> None:
+        message = json.dumps({"projection_type": projection_type, "ids": ids})
+
+        try:
+            self._invalidate(projection_type, ids)
+            self.client.publish(self.channel, message)
+        except Exception as e:
+            # the public API cache TTLs still bound staleness, never fail the worker
+            logger.warning(
+                f"Failed to publish cache invalidation for {projection_type}: {e}"
+            )
+
+    def _invalidate(self, projection_type: str, ids: Optional[list]) -> None:
+        """Bump the generations and delete the entries of the shared cache tier."""
+        families = PROJECTION_CACHE_KEYS.get(projection_type)
+        if families is None:
+            logger.warning(f"No public API cache entries for {projection_type}")
+            return
+
+        keys = []
+        if ids is None or ("entity" not in families and "scoped" not in families):
+            namespaces = families["all"]
+        else:
+            namespaces = list(families["lists"])
+            if "scoped" in families:
+                namespaces += [families["scoped"].format(id=i) for i in ids]
+            if "entity" in families:
+                bases, argument, namespace = families["entity"]
+                (generation,) = self._generations([namespace])
+                keys = [
+                    f"{call_key(base, {argument: entity_id})}:v{generation}"
+                    for entity_id in ids
+                    for base in bases
+                ]
+
+        self._generations(namespaces)
+        pipe = self.client.pipeline()
+        for namespace in namespaces:
+            pipe.incr(f"{GENERATION_KEY_PREFIX}{namespace}")
+        if keys:
+            pipe.delete(*keys)
+        pipe.execute()
+
+    def _generations(self, namespaces: list) -> list:
+        """
+        Current generation of each namespace, as read by the public API.
+
+        Missing generations are seeded with the current time in milliseconds, so a
+        counter lost to eviction can never fall back to a value used by live entries.
+        """
+        generation_keys = [
+            f"{GENERATION_KEY_PREFIX}{namespace}" for namespace in namespaces
+        ]
+        values = self.client.mget(generation_keys)
+
+        if None in values:
+            seed = int(time.time() * 1000)
+            pipe = self.client.pipeline()
+            for generation_key, value in zip(generation_keys, values):
+                if value is None:
+                    pipe.set(generation_key, seed, nx=True)
+            pipe.execute()
+            values = self.client.mget(generation_keys)
+
+        return [int(value) for value in values]
+
+    def request_warmup(self) -> None:
+        """
+        Ask the public API to warm its hottest cache entries back up.
+
+        Sent after the invalidations of a batch, on the same channel, so the
+        public API only warms up once those have been applied (and again after
+        their delayed invalidation, when it reads from a replica).
+        """
+        if not settings.PUBLIC_CACHE_INVALIDATION_ENABLED:
+            return
+
+        self._request_warmup()
+        if settings.PUBLIC_CACHE_REPLICA_DELAY:
+            public_cache_tasks.schedule(
+                settings.PUBLIC_CACHE_REPLICA_DELAY, self._request_warmup
+            )
+
+    def _request_warmup(self) -> None:
+        try:
+            self.client.publish(self.channel, json.dumps({"action": "warmup"}))
+        except Exception as e:
+            logger.warning(f"Failed to request public cache warm-up: {e}")
+
+
+cache_invalidation_publisher = CacheInvalidationPublisher(
+    settings.PUBLIC_CACHE_INVALIDATION_CHANNEL
+)
@@ -0,0 +1,118 @@
+import logging
+import time
+from typing import Iterable, Optional
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from config import settings
+
+from .delayed import public_cache_tasks
+
+logger = logging.getLogger(__name__)
+
+# public API paths served from each projection: (paths without ids, path of one id)
+PUBLIC_API_PATHS: dict[str, tuple[tuple[str, ...], Optional[str]]] = {
+    "team": (("/teams",), "/teams/{id}"),
+    "athlete": (("/students",), "/students/{id}"),
+    "tournament": (("/tournaments",), "/tournaments/{id}"),
+    "match": (("/matches",), "/matches/{id}"),
+    "tournament_standing": ((), "/tournaments/{id}/standings"),
+    "general_ranking": (("/ranking/general",), "/ranking/general?season_id={id}"),
+    "modality_ranking": (("/ranking/modality",), "/ranking/modality?season_id={id}"),
+    "nucleo": (("/nucleos",), "/nucleos/{id}"),
+    "season": (("/seasons",), None),
+    "regulation": (("/regulations",), None),
+    "home_page_config": (("/home-page-config",), None),
+    "course": (("/courses", "/courses/menu"), None),
+}
+
+
+class ProxyCachePurger:
+    """
+    Refresh the nginx micro-cache of the public API after projections change.
+
+    nginx (open source) cannot delete cache entries, so its internal purge
+    location re-fetches a URL bypassing the cache and stores the new response in
+    place of the old one. Only known paths can be refreshed: other URLs (e.g.
+    filtered or paginated lists) expire with their few seconds of X-Accel-Expires.
+
+    Refreshes run on a background thread (public_cache_tasks), after the cache
+    invalidations of the same changes and, when the public API reads from a
+    replica, after its lag: refreshing earlier would cache the stale response
+    again.
+    """
+
+    # above this number of ids per projection type only the paths without ids are refreshed
+    MAX_IDS_PER_TYPE = 50
+    TIMEOUT = 2
+    # seconds a batch of refreshes may take, the remaining entries expire on their own
+    MAX_DURATION = 10
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def paths(self, projection_type: str, ids: Optional[Iterable] = None) -> list:
+        """Public API paths to refresh for rebuilt rows (all when `ids` is None)."""
+        list_paths, id_path = PUBLIC_API_PATHS.get(str(projection_type), ((), None))
+        paths = list(list_paths)
+
+        if id_path is not None and ids is not None:
+            ids = sorted({str(i) for i in ids})
+            if len(ids) <= self.MAX_IDS_PER_TYPE:
+                paths += [id_path.format(id=i) for i in ids]
+
+        return paths
+
+    def purge(self, changes: dict) -> None:
+        """
+        Schedule the refresh of the cached URLs of a batch of projection changes.
+
+        `changes` maps each projection type to the ids of its rebuilt rows, or to
+        None when every row may have changed.
+        """
+        if not self.base_url:
+            return
+
+        paths = [
+            path
+            for projection_type, ids in changes.items()
+            for path in self.paths(projection_type, ids)
+        ]
+        if paths:
+            public_cache_tasks.schedule(
+                settings.PUBLIC_CACHE_REPLICA_DELAY, self.refresh, paths
+            )
+
+    def refresh(self, paths: list) -> None:
+        """Refresh cached URLs, for at most MAX_DURATION seconds."""
+        deadline = time.monotonic() + self.MAX_DURATION
+        refreshed = 0
+        for path in paths:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Public API proxy cache refresh timed out, "
+                    f"[{len(paths) - refreshed}] entries left to expire."
+                )
+                return
+
+            try:
+                with urlopen(
+                    f"{self.base_url}{path}", timeout=min(self.TIMEOUT, remaining)
+                ) as response:
+                    response.read()
+            except HTTPError:
+                # e.g. a 404 for a deleted row: not cached, the old entry expires
+                pass
+            except Exception as e:
+                if time.monotonic() >= deadline:
+                    continue
+                # nginx unreachable: the remaining entries expire on their own
+                logger.warning(f"Failed to refresh public API proxy cache: {e}")
+                return
+            refreshed += 1
+
+        logger.info(f"Refreshed [{len(paths)}] public API proxy cache entries.")
+
+
+proxy_cache_purger = ProxyCachePurger(settings.PUBLIC_PROXY_CACHE_PURGE_URL)
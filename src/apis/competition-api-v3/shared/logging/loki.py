@@ -0,0 +1,156 @@
+import gzip
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import logging_loki
+from prometheus_client import Counter
+
+loki_dropped_records = Counter(
+    "loki_log_records_dropped_total",
+    "Log records dropped because the Loki shipping queue was full",
+)
+
+
+class BatchedLokiHandler(logging_loki.LokiHandler):
+    """
+    Loki handler that ships logs from a background thread.
+
+    logging_loki.LokiHandler does one HTTP push per record on the thread that
+    logs it, so every request log line adds a Loki round trip to the request
+    and a slow Loki stalls the API. This handler only formats the record and
+    puts it on a bounded queue; a daemon thread pushes the queued lines in
+    gzip-compressed batches. When the queue is full the record is dropped and
+    counted instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        tags: dict = None,
+        auth=None,
+        version: str = "1",
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        timeout: float = 5.0,
+    ):
+        super().__init__(url=url, tags=tags, auth=auth, version=version)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def emit(self, record):
+        try:
+            entry = (
+                self.emitter.build_tags(record),
+                str(time.time_ns()),
+                self.format(record),
+            )
+        except Exception:
+            self.handleError(record)
+            return
+
+        # started lazily so that forked processes (e.g. gunicorn workers) get their own thread
+        if self._pid != os.getpid():
+            self._start()
+
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            loki_dropped_records.inc()
+
+    def close(self):
+        if self._thread is not None and self._pid == os.getpid():
+            self._stop_event.set()
+            self._thread.join(self.timeout)
+            self._thread = None
+        super().close()
+
+    def _start(self):
+        with self.lock:
+            if self._pid == os.getpid():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._ship, name="loki-shipper", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _ship(self):
+        while not self._stop_event.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._push(batch)
+
+        # flush what is left on shutdown
+        while not self.queue.empty():
+            self._push(self._drain())
+
+    def _next_batch(self):
+        """Wait for a record, then collect more until the batch is full or flush_interval elapses."""
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop_event.is_set():
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self):
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _push(self, batch):
+        streams = {}
+        for labels, ts, line in batch:
+            key = tuple(sorted(labels.items()))
+            streams.setdefault(key, []).append([ts, line])
+
+        payload = {
+            "streams": [
+                {"stream": dict(key), "values": values}
+                for key, values in streams.items()
+            ]
+        }
+
+        try:
+            response = self.emitter.session.post(
+                self.emitter.url,
+                data=gzip.compress(json.dumps(payload).encode()),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+                timeout=self.timeout,
+            )
+            if response.status_code != self.emitter.success_response_code:
+                raise ValueError(
+                    f"Unexpected Loki API response status code: {response.status_code}"
+                )
+        except Exception as e:
+            # logging from the shipper thread would feed the failure back into the queue
+            sys.stderr.write(f"Failed to push {len(batch)} log records to Loki: {e}\n")
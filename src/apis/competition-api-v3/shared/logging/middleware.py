@@ -1,18 +1,34 @@
 import json
 import logging
+import random
 import time
 
+from django.conf import settings
 from shared.auth.utils import get_user
 
 logger = logging.getLogger("request_logger")
 
 
 class RequestLoggingMiddleware:
+    """
+    Logs every request as an "http_request" record.
+
+    Logging costs the same whatever the size of the request or response:
+    successful requests are sampled (REQUEST_LOG_SAMPLE_RATE) while errors are
+    always logged, bodies are serialized only up to REQUEST_LOG_BODY_LIMIT
+    characters and the bodies of successful GET responses are left out unless
+    REQUEST_LOG_GET_RESPONSES is set.
+    """
+
     EXCLUDED_PATHS = {"/metrics", "/api/admin/health/"}
-    RESPONSE_SIZE_LIMIT = 1000
+    BODY_METHODS = ("POST", "PUT", "PATCH")
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.sample_rate = settings.REQUEST_LOG_SAMPLE_RATE
+        self.body_limit = settings.REQUEST_LOG_BODY_LIMIT
+        self.log_get_responses = settings.REQUEST_LOG_GET_RESPONSES
+        self.encoder = json.JSONEncoder(default=self._serialize_value)
 
     def _serialize_value(self, value):
         if isinstance(value, (str, int, float, bool)) or value is None:
@@ -20,43 +36,63 @@ class RequestLoggingMiddleware:
 
         return str(value)  # Fallback to string representation for other types
 
-    def __call__(self, request):
-        start = time.time()
+    def _truncate(self, text):
+        if len(text) > self.body_limit:
+            return text[: self.body_limit] + "..."
+        return text
+
+    def _serialize_response(self, data):
+        """JSON of the response data, encoded only until the size limit is reached."""
+        chunks = []
+        size = 0
+        for chunk in self.encoder.iterencode(data):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.body_limit:
+                break
+        return self._truncate("".join(chunks))
+
+    def _read_payload(self, request):
+        """Raw JSON body of a write request, read before the view consumes the stream."""
+        if request.method not in self.BODY_METHODS:
+            return None
+        if request.content_type != "application/json":
+            return None  # e.g. multipart uploads
 
-        body = None
         try:
-            body = request.body
+            return request.body[: self.body_limit + 1]
         except Exception:
-            pass
+            return None
+
+    def __call__(self, request):
+        if request.path in self.EXCLUDED_PATHS:
+            return self.get_response(request)
+
+        start = time.time()
+
+        payload = self._read_payload(request)
 
         response = self.get_response(request)
-        user = get_user(request)
 
         duration_ms = round((time.time() - start) * 1000)
 
-        if request.method in ("POST", "PUT", "PATCH"):
-            try:
-                body = json.loads(body)
-            except Exception:
-                body = None
-
-        if request.path in self.EXCLUDED_PATHS:
+        is_error = response.status_code >= 400
+        if not is_error and random.random() >= self.sample_rate:
             return response
 
+        user = get_user(request)
+
         logger_func = logger.info
         if response.status_code >= 500:
             logger_func = logger.error
-        elif response.status_code >= 400:
+        elif is_error:
             logger_func = logger.warning
 
-        response_data = (
-            json.dumps(response.data, default=self._serialize_value)
-            if hasattr(response, "data")
-            else None
-        )
-        if response.status_code // 100 == 2 and response_data is not None:
-            if len(response_data) > self.RESPONSE_SIZE_LIMIT:
-                response_data = response_data[: self.RESPONSE_SIZE_LIMIT] + "..."
+        response_data = None
+        if hasattr(response, "data") and (
+            is_error or request.method != "GET" or self.log_get_responses
+        ):
+            response_data = self._serialize_response(response.data)
 
         logger_func(
             "http_request",
@@ -64,11 +100,16 @@ class RequestLoggingMiddleware:
                 "method": request.method,
                 "path": request.path,
                 "query": json.dumps(request.GET.dict()),
-                "payload": json.dumps(body) if body else None,
+                "payload": (
+                    self._truncate(payload.decode(errors="replace"))
+                    if payload
+                    else None
+                ),
                 "response": response_data,
                 "status_code": response.status_code,
                 "duration_ms": duration_ms,
                 "user": user.user_id if user else None,
+                "sample_rate": 1.0 if is_error else self.sample_rate,
             },
         )
 
@@ -0,0 +1,193 @@
+import uuid
+
+import pytest
+from workers.projections_updater.models import (
+    ProjectionUpdateRequest,
+    ProjectionUpdateRequestTypes,
+)
+from workers.projections_updater.service import coalescing
+from workers.projections_updater.service.coalescing import (
+    coalesce_projection_requests,
+)
+
+MATCH = ProjectionUpdateRequestTypes.MATCH
+TEAM = ProjectionUpdateRequestTypes.TEAM
+
+
+class FakeRows:
+    """The part of a queryset used to resolve the rows of a rebuild."""
+
+    def __init__(self, ids):
+        self.ids = [str(i) for i in ids]
+
+    def filter(self, id__in):
+        return FakeRows([i for i in self.ids if i in {str(j) for j in id__in}])
+
+    def values_list(self, field, flat=False):
+        return list(self.ids)
+
+
+class Rows(dict):
+    selector = None
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    """Rows selected by each match rebuild payload, keyed by `modality_id`."""
+    rows = Rows()
+
+    def selector(**payload):
+        selector.calls.append(payload)
+        if payload.get("modality_id") == "broken":
+            raise RuntimeError("boom")
+        return FakeRows(rows.get(payload.get("modality_id"), []))
+
+    selector.calls = []
+
+    _, ids_parameter, _ = coalescing.ROW_SCOPES[MATCH]
+    monkeypatch.setitem(
+        coalescing.ROW_SCOPES, MATCH, ("match_id", ids_parameter, selector)
+    )
+    rows.selector = selector
+    return rows
+
+
+_ids = iter(range(1, 1_000_000))
+
+
+def request(projection_type, **payload):
+    return ProjectionUpdateRequest(
+        id=next(_ids), projection_type=projection_type, payload=payload
+    )
+
+
+def rebuilds_by_payload(rebuilds):
+    return {
+        frozenset((k, str(v)) for k, v in rebuild.payload.items()): rebuild
+        for rebuild in rebuilds
+    }
+
+
+def test_identical_filters_are_rebuilt_once():
+    modality_id = str(uuid.uuid4())
+    requests = [request(TEAM, modality_id=modality_id) for _ in range(3)]
+
+    rebuilds = coalesce_projection_requests(requests)
+
+    assert len(rebuilds) == 1
+    assert rebuilds[0].payload == {"modality_id": modality_id}
+    assert rebuilds[0].requests == requests
+
+
+def test_none_filters_are_ignored():
+    requests = [request(TEAM, modality_id="m"), request(TEAM, modality_id="m", x=None)]
+
+    rebuilds = coalesce_projection_requests(requests)
+
+    assert len(rebuilds) == 1
+    assert rebuilds[0].payload == {"modality_id": "m"}
+
+
+def test_a_request_without_filters_covers_every_other(rows):
+    existing, deleted = str(uuid.uuid4()), str(uuid.uuid4())
+    rows[None] = [existing]
+    everything = request(MATCH)
+    broad = request(MATCH, modality_id="m")
+    single = request(MATCH, match_id=existing)
+    single_deleted = request(MATCH, match_id=deleted)
+
+    rebuilds = rebuilds_by_payload(
+        coalesce_projection_requests([broad, single, single_deleted, everything])
+    )
+
+    assert sorted(r.id for r in rebuilds[frozenset()].requests) == sorted(
+        r.id for r in (broad, single, everything)
+    )
+    # the rows of an unfiltered rebuild are the existing ones: a deleted row is
+    # still rebuilt by id, which removes its projection
+    assert rebuilds[frozenset({("match_id", deleted)})].requests == [single_deleted]
+    assert len(rebuilds) == 2
+
+
+def test_broader_filters_cover_narrower_ones():
+    broad = request(TEAM, modality_id="m")
+    narrow = request(TEAM, modality_id="m", course_id="c")
+    other = request(TEAM, course_id="d")
+
+    rebuilds = rebuilds_by_payload(coalesce_projection_requests([narrow, broad, other]))
+
+    assert set(rebuilds) == {
+        frozenset({("modality_id", "m")}),
+        frozenset({("course_id", "d")}),
+    }
+    assert rebuilds[frozenset({("modality_id", "m")})].requests == [broad, narrow]
+    assert rebuilds[frozenset({("course_id", "d")})].requests == [other]
+
+
+def test_single_rows_selected_by_a_broader_rebuild_are_covered(rows):
+    covered, remaining = str(uuid.uuid4()), str(uuid.uuid4())
+    rows["m"] = [covered]
+    broad = request(MATCH, modality_id="m")
+    single = request(MATCH, match_id=covered)
+    other = request(MATCH, match_id=remaining)
+
+    rebuilds = rebuilds_by_payload(coalesce_projection_requests([single, broad, other]))
+
+    assert rebuilds[frozenset({("modality_id", "m")})].requests == [broad, single]
+    assert rebuilds[frozenset({("match_id", remaining)})].requests == [other]
+    assert len(rebuilds) == 2
+
+
+def test_remaining_single_rows_are_rebuilt_together(rows):
+    match_ids = sorted(str(uuid.uuid4()) for _ in range(3))
+    requests = [request(MATCH, match_id=match_id) for match_id in match_ids]
+    # the same row twice: one rebuild for both requests
+    requests.append(request(MATCH, match_id=match_ids[0]))
+
+    rebuilds = coalesce_projection_requests(requests)
+
+    assert len(rebuilds) == 1
+    assert rebuilds[0].payload == {"match_ids": match_ids}
+    assert sorted(r.id for r in rebuilds[0].requests) == sorted(r.id for r in requests)
+    # no broader rebuild: rows are not resolved
+    assert rows.selector.calls == []
+
+
+def test_rows_are_not_covered_when_they_cannot_be_resolved(rows):
+    match_id = str(uuid.uuid4())
+    broken = request(MATCH, modality_id="broken")
+    single = request(MATCH, match_id=match_id)
+
+    rebuilds = rebuilds_by_payload(coalesce_projection_requests([broken, single]))
+
+    assert rebuilds[frozenset({("modality_id", "broken")})].requests == [broken]
+    assert rebuilds[frozenset({("match_id", match_id)})].requests == [single]
+
+
+def test_types_are_coalesced_separately(rows):
+    requests = [request(MATCH), request(TEAM), request(MATCH), request(TEAM)]
+
+    rebuilds = coalesce_projection_requests(requests)
+
+    assert sorted(rebuild.projection_type for rebuild in rebuilds) == [MATCH, TEAM]
+    for rebuild in rebuilds:
+        assert all(
+            r.projection_type == rebuild.projection_type for r in rebuild.requests
+        )
+
+
+def test_every_request_belongs_to_exactly_one_rebuild(rows):
+    rows["m"] = ["a", "b"]
+    requests = [
+        request(MATCH, modality_id="m"),
+        request(MATCH, modality_id="m", tournament_id="t"),
+        request(MATCH, match_id="a"),
+        request(MATCH, match_id="c"),
+        request(MATCH, match_id="d"),
+        request(TEAM, team_id="x"),
+    ]
+
+    rebuilds = coalesce_projection_requests(requests)
+
+    ids = [r.id for rebuild in rebuilds for r in rebuild.requests]
+    assert sorted(ids) == sorted(r.id for r in requests)
@@ -0,0 +1,89 @@
+import uuid
+
+import pytest
+from apps.projections.models import TeamDetailView
+from apps.projections.service import _upsert_projections
+
+pytestmark = pytest.mark.django_db
+
+
+def team_projection(team_id, **fields):
+    return TeamDetailView(
+        **{
+            "team_id": team_id,
+            "team_name": "Team",
+            "team_season_id": 1,
+            "course_id": uuid.UUID(int=1),
+            "course_name": "Course",
+            "course_abbreviation": "C",
+            "nucleo_id": uuid.UUID(int=2),
+            "nucleo_name": "Nucleo",
+            "nucleo_abbreviation": "N",
+            "nucleo_logo_url": "",
+            "modality_id": uuid.UUID(int=3),
+            "modality_name": "Modality",
+            "modality_type_id": uuid.UUID(int=4),
+            "modality_type_name": "Type",
+            "player_count": 1,
+            "players": [{"id": "p1", "name": "Player"}],
+            **fields,
+        }
+    )
+
+
+def upsert(ids, projections):
+    return _upsert_projections(TeamDetailView, ids, projections)
+
+
+def test_new_rows_are_inserted_and_returned():
+    a, b = uuid.uuid4(), uuid.uuid4()
+
+    changed = upsert([a, b], [team_projection(a), team_projection(b)])
+
+    assert sorted(changed) == sorted([a, b])
+    assert set(TeamDetailView.objects.values_list("team_id", flat=True)) == {a, b}
+    assert all(TeamDetailView.objects.values_list("content_hash", flat=True))
+
+
+def test_an_unchanged_rebuild_returns_nothing():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    upsert([a, b], [team_projection(a), team_projection(b)])
+
+    assert upsert([a, b], [team_projection(a), team_projection(b)]) == []
+
+
+def test_only_changed_rows_are_returned_and_rewritten():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    upsert([a, b], [team_projection(a), team_projection(b)])
+    hash_b = TeamDetailView.objects.get(team_id=b).content_hash
+
+    changed = upsert(
+        [a, b],
+        [
+            team_projection(a, team_name="Renamed", players=[]),
+            team_projection(b),
+        ],
+    )
+
+    assert changed == [a]
+    row = TeamDetailView.objects.get(team_id=a)
+    assert (row.team_name, row.players) == ("Renamed", [])
+    assert TeamDetailView.objects.get(team_id=b).content_hash == hash_b
+
+
+def test_rows_no_longer_rebuilt_are_deleted_and_returned():
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    upsert([a, b], [team_projection(a), team_projection(b)])
+
+    changed = upsert([a, b, c], [team_projection(a), team_projection(c)])
+
+    assert sorted(changed) == sorted([b, c])
+    assert set(TeamDetailView.objects.values_list("team_id", flat=True)) == {a, c}
+
+
+def test_rows_outside_the_rebuilt_ids_are_kept():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    upsert([a, b], [team_projection(a), team_projection(b)])
+
+    assert upsert([a], []) == [a]
+    assert list(TeamDetailView.objects.values_list("team_id", flat=True)) == [b]
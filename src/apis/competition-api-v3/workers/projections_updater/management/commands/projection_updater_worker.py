@@ -1,16 +1,49 @@
 import logging
-import time
 
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 
-from ...service import handle_pending_projection_requests
+from ...models import ProjectionUpdateRequestTypes
+from ...service import ProjectionsWorker
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
+    help = "Process projection update requests (run several to scale out)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=settings.PROJECTIONS_WORKER_THREADS,
+            help="Number of threads processing requests concurrently.",
+        )
+        parser.add_argument(
+            "--types",
+            default=settings.PROJECTIONS_WORKER_TYPES,
+            help="Comma-separated projection types handled by this worker (default: all).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PROJECTIONS_WORKER_BATCH_SIZE,
+            help="Maximum requests claimed at once by a thread.",
+        )
+
     def handle(self, *args, **kwargs):
+        projection_types = [t.strip() for t in kwargs["types"].split(",") if t.strip()]
+        unknown_types = set(projection_types) - set(ProjectionUpdateRequestTypes.values)
+        if unknown_types:
+            raise CommandError(f"Unknown projection types: {', '.join(unknown_types)}")
+
         logger.info("Starting projections updater worker...")
-        while True:
-            handle_pending_projection_requests()
-            time.sleep(10)  # Sleep for a short period before checking for new requests
+        worker = ProjectionsWorker(
+            threads=kwargs["threads"],
+            projection_types=projection_types or None,
+            batch_size=kwargs["batch_size"],
+            poll_interval=settings.PROJECTIONS_WORKER_POLL_INTERVAL,
+            health_file=settings.PROJECTIONS_WORKER_HEALTH_FILE,
+        )
+        if not worker.run():
+            raise CommandError("Projections worker stopped after a thread failure.")
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.5 on 2026-10-17 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projections_updater", "0004_alter_projectionupdaterequest_projection_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectionupdaterequest",
+            name="attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectionupdaterequest",
+            name="retry_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="projectionupdaterequest",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("processed", "Processed"),
+                    ("failed", "Failed"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
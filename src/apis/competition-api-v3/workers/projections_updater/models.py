@@ -21,6 +21,7 @@ class ProjectionUpdateRequest(models.Model):
         PENDING = "pending", "Pending"
         PROCESSING = "processing", "Processing"
         PROCESSED = "processed", "Processed"
+        FAILED = "failed", "Failed"
 
     projection_type = models.CharField(
         max_length=255, choices=ProjectionUpdateRequestTypes.choices
@@ -29,6 +30,9 @@ class ProjectionUpdateRequest(models.Model):
     key = models.CharField(max_length=255, null=True, blank=True)
 
     status = models.CharField(max_length=20, choices=Status.choices)
+    # failed rebuilds so far; a pending request is only claimed again after retry_at
+    attempts = models.PositiveIntegerField(default=0)
+    retry_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         constraints = [
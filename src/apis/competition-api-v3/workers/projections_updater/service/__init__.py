@@ -1,8 +1,12 @@
 from ..models import ProjectionUpdateRequestTypes
 from .base import handle_pending_projection_requests, request_projection_update
+from .listener import ProjectionRequestsListener
+from .worker import ProjectionsWorker
 
 __all__ = [
     "request_projection_update",
     "handle_pending_projection_requests",
+    "ProjectionRequestsListener",
+    "ProjectionsWorker",
     "ProjectionUpdateRequestTypes",
 ]
@@ -1,8 +1,18 @@
 import logging
+from datetime import timedelta
+from functools import partial
+from typing import Iterable, Optional
 
+from django.conf import settings
 from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from shared.cache.invalidation import cache_invalidation_publisher
+from shared.cache.proxy_purge import proxy_cache_purger
 
 from ..models import ProjectionUpdateRequest, ProjectionUpdateRequestTypes
+from .coalescing import ProjectionRebuild, coalesce_projection_requests
+from .listener import notify_projection_requests
 from .rebuild_functions import (
     update_athletes_projections,
     update_courses_projections,
@@ -54,40 +64,142 @@ def request_projection_update(
             status=ProjectionUpdateRequest.Status.PENDING,
         )
     except IntegrityError:
-        pass
+        # an equivalent request is already pending (and was announced)
+        return
 
+    # wake up the worker as soon as the request is committed
+    notify_projection_requests(projection_type)
 
-def handle_pending_projection_requests() -> None:
-    """Handle pending projection update requests and update the projections accordingly."""
 
-    # get all pending projection update requests
+def handle_pending_projection_requests(
+    projection_types: Optional[Iterable[str]] = None, batch_size: int = 200
+) -> int:
+    """
+    Handle pending projection update requests and update the projections accordingly.
+
+    Several workers (processes or threads) can run this concurrently: each claims
+    its own batch of at most `batch_size` requests, skipping those locked by the
+    others. `projection_types` restricts the claimed requests to some projection
+    types (all when None), e.g. to keep live match updates on their own worker.
+
+    Returns the number of requests processed (at most one batch): requests that
+    failed are not counted, so callers draining the queue do not spin on them.
+    They are pending again but only claimed after a delay growing with each
+    failure, and marked as failed after PROJECTIONS_WORKER_MAX_ATTEMPTS, so a
+    request that keeps failing does not hold back the others.
+    """
+
+    # get all pending projection update requests (that are not waiting for a retry)
     with transaction.atomic():
+        queryset = ProjectionUpdateRequest.objects.filter(
+            Q(retry_at__isnull=True) | Q(retry_at__lte=timezone.now()),
+            status=ProjectionUpdateRequest.Status.PENDING,
+        )
+        if projection_types is not None:
+            queryset = queryset.filter(projection_type__in=projection_types)
+
         pending_requests = list(
-            ProjectionUpdateRequest.objects.filter(
-                status=ProjectionUpdateRequest.Status.PENDING
-            ).select_for_update(skip_locked=True)[:200]
+            queryset.order_by("id").select_for_update(skip_locked=True)[:batch_size]
         )
 
         ProjectionUpdateRequest.objects.filter(
             id__in=[request.id for request in pending_requests]
         ).update(status=ProjectionUpdateRequest.Status.PROCESSING)
 
-    for request in pending_requests:
+    # rebuilt ids per projection type (None when every row may have changed)
+    changes = {}
+    processed = 0
+
+    # rebuild each set of rows once, however many requests asked for it
+    rebuilds = coalesce_projection_requests(pending_requests)
+    for rebuild in rebuilds:
+        request_ids = [request.id for request in rebuild.requests]
         try:
             # get the handler function for the projection type
-            handler_function = PROJECTION_TYPE_HANDLERS.get(request.projection_type)
+            handler_function = PROJECTION_TYPE_HANDLERS.get(rebuild.projection_type)
             if handler_function:
-                handler_function(**request.payload)
+                rebuilt_ids = handler_function(**rebuild.payload)
+
+                # an empty list means that no projection row actually changed
+                if rebuilt_ids is None or rebuilt_ids:
+                    # notify the public API once the rebuilt projections are committed
+                    transaction.on_commit(
+                        partial(
+                            cache_invalidation_publisher.publish,
+                            rebuild.projection_type,
+                            rebuilt_ids,
+                        )
+                    )
+
+                    if (
+                        rebuilt_ids is None
+                        or changes.get(rebuild.projection_type, ()) is None
+                    ):
+                        changes[rebuild.projection_type] = None
+                    else:
+                        changes.setdefault(rebuild.projection_type, set()).update(
+                            rebuilt_ids
+                        )
             else:
                 logger.warning(
-                    f"No handler function found for projection type {request.projection_type}"
+                    f"No handler function found for projection type {rebuild.projection_type}"
                 )
 
-            # mark the request as processed
-            request.status = ProjectionUpdateRequest.Status.PROCESSED
+            # mark the requests as processed
+            status = ProjectionUpdateRequest.Status.PROCESSED
+            processed += len(request_ids)
         except Exception as e:
-            request.status = ProjectionUpdateRequest.Status.PENDING
-            logger.error(
-                f"Error processing projection update request {request.id}: {e}"
-            )
-        request.save()
+            if len(rebuild.requests) > 1:
+                # retry the requests one by one (appended to the list being iterated)
+                # so that a failing one does not hold back the others
+                logger.warning(
+                    f"Error processing coalesced projection update requests {request_ids}, "
+                    f"retrying them separately: {e}"
+                )
+                rebuilds += [
+                    ProjectionRebuild(
+                        request.projection_type, request.payload, [request]
+                    )
+                    for request in rebuild.requests
+                ]
+                continue
+
+            _record_failure(rebuild.requests[0], e)
+            continue
+        ProjectionUpdateRequest.objects.filter(id__in=request_ids).update(status=status)
+
+    # refill the public API cache once the whole batch has been invalidated
+    if changes:
+        transaction.on_commit(cache_invalidation_publisher.request_warmup)
+
+    # refresh the nginx micro-cache last, in the background once the invalidations
+    # have been applied
+    if changes:
+        transaction.on_commit(partial(proxy_cache_purger.purge, changes))
+
+    return processed
+
+
+def _record_failure(request: ProjectionUpdateRequest, error: Exception) -> None:
+    """Put a failed request back in the queue after a backoff, or give up on it."""
+    attempts = request.attempts + 1
+    if attempts >= settings.PROJECTIONS_WORKER_MAX_ATTEMPTS:
+        logger.error(
+            f"Error processing projection update request {request.id}, "
+            f"giving up after [{attempts}] attempts: {error}"
+        )
+        ProjectionUpdateRequest.objects.filter(id=request.id).update(
+            status=ProjectionUpdateRequest.Status.FAILED, attempts=attempts
+        )
+        return
+
+    delay = settings.PROJECTIONS_WORKER_RETRY_DELAY * 2 ** (attempts - 1)
+    logger.error(
+        f"Error processing projection update request {request.id} "
+        f"(attempt [{attempts}]), retrying in {delay:.0f}s: {error}"
+    )
+    ProjectionUpdateRequest.objects.filter(id=request.id).update(
+        status=ProjectionUpdateRequest.Status.PENDING,
+        attempts=attempts,
+        retry_at=timezone.now() + timedelta(seconds=delay),
+    )
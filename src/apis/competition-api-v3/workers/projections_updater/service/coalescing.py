@@ -0,0 +1,188 @@
+import logging
+from dataclasses import dataclass, field
+
+from apps.athletes.selectors import get_athletes_table
+from apps.matches.selectors import get_matches_table
+from apps.nucleus.selectors import get_nucleus_table
+from apps.regulations.selectors import get_regulations_table
+from apps.seasons.selectors import get_seasons_table
+from apps.teams.selectors import get_teams_table
+from apps.tournaments.selectors import get_tournaments_table
+
+from ..models import ProjectionUpdateRequest, ProjectionUpdateRequestTypes
+
+logger = logging.getLogger(__name__)
+
+
+def _get_courses_table(course_id=None, nucleus_id=None):
+    from apps.courses.selectors import get_courses_table
+
+    return get_courses_table(course_id=course_id, nucleo_id=nucleus_id)
+
+
+# projection type -> (payload parameter of a single row, parameter of a set of rows,
+# selector of the rows rebuilt for a payload), mirroring the rebuild functions
+ROW_SCOPES: dict[str, tuple[str, str, callable]] = {
+    ProjectionUpdateRequestTypes.TEAM: ("team_id", "team_ids", get_teams_table),
+    ProjectionUpdateRequestTypes.ATHLETE: (
+        "athlete_id",
+        "athlete_ids",
+        get_athletes_table,
+    ),
+    ProjectionUpdateRequestTypes.MATCH: ("match_id", "match_ids", get_matches_table),
+    ProjectionUpdateRequestTypes.NUCLEO: (
+        "nucleus_id",
+        "nucleus_ids",
+        get_nucleus_table,
+    ),
+    ProjectionUpdateRequestTypes.TOURNAMENT: (
+        "tournament_id",
+        "tournament_ids",
+        get_tournaments_table,
+    ),
+    ProjectionUpdateRequestTypes.TOURNAMENT_STANDING: (
+        "tournament_id",
+        "tournament_ids",
+        get_tournaments_table,
+    ),
+    ProjectionUpdateRequestTypes.REGULATION: (
+        "regulation_id",
+        "regulation_ids",
+        get_regulations_table,
+    ),
+    ProjectionUpdateRequestTypes.SEASON: ("season_id", "season_ids", get_seasons_table),
+    ProjectionUpdateRequestTypes.GENERAL_RANKING: (
+        "season_id",
+        "season_ids",
+        get_seasons_table,
+    ),
+    ProjectionUpdateRequestTypes.COURSE: (
+        "course_id",
+        "course_ids",
+        _get_courses_table,
+    ),
+}
+
+
+@dataclass
+class ProjectionRebuild:
+    """One call of a rebuild function, covering one or more update requests."""
+
+    projection_type: str
+    payload: dict
+    requests: list[ProjectionUpdateRequest] = field(default_factory=list)
+
+
+def coalesce_projection_requests(
+    requests: list[ProjectionUpdateRequest],
+) -> list[ProjectionRebuild]:
+    """
+    Turn a batch of update requests into as few rebuilds as possible.
+
+    For each projection type:
+    - a request without filters rebuilds every row, so it covers all the others
+      (single-row ones as below);
+    - requests with the same filters are rebuilt once, and a request whose
+      filters include all those of another one (e.g. `{modality_id, team_id}`
+      vs `{modality_id}`) is covered by it;
+    - single-row requests (e.g. `{match_id}`) whose row is also selected by a
+      broader request (e.g. `{modality_id}`, or no filters) are covered by it,
+      but not those of deleted rows, which only a rebuild of the id removes;
+    - the remaining single-row requests are merged into one rebuild of the set
+      of rows (e.g. `{match_ids: [...]}`).
+
+    Each request belongs to exactly one rebuild, whose outcome is its own.
+    """
+    by_type: dict[str, list[ProjectionUpdateRequest]] = {}
+    for request in requests:
+        by_type.setdefault(request.projection_type, []).append(request)
+
+    rebuilds = []
+    for projection_type, type_requests in by_type.items():
+        rebuilds += _coalesce_type(projection_type, type_requests)
+
+    if len(rebuilds) < len(requests):
+        logger.info(
+            f"Coalesced [{len(requests)}] projection update requests into "
+            f"[{len(rebuilds)}] rebuilds ([{len(requests) - len(rebuilds)}] saved)."
+        )
+
+    return rebuilds
+
+
+def _coalesce_type(
+    projection_type: str, requests: list[ProjectionUpdateRequest]
+) -> list[ProjectionRebuild]:
+    # same filters, same rebuild
+    groups: dict[frozenset, ProjectionRebuild] = {}
+    for request in requests:
+        payload = {k: v for k, v in (request.payload or {}).items() if v is not None}
+        filters = frozenset((k, str(v)) for k, v in payload.items())
+        group = groups.setdefault(filters, ProjectionRebuild(projection_type, payload))
+        group.requests.append(request)
+
+    # a group is covered by any group with a strict subset of its filters
+    # (in particular, one without filters covers all of them); not single rows,
+    # which a broader rebuild only covers while they exist (checked below): the
+    # projection of a deleted row is only removed by a rebuild of its id
+    id_parameter = (
+        ROW_SCOPES[projection_type][0] if projection_type in ROW_SCOPES else None
+    )
+    broadest = [
+        filters
+        for filters in groups
+        if {k for k, _ in filters} == {id_parameter}
+        or not any(other < filters for other in groups)
+    ]
+    for filters, group in groups.items():
+        if filters in broadest:
+            continue
+        broader = next(other for other in broadest if other < filters)
+        groups[broader].requests += group.requests
+    groups = {filters: groups[filters] for filters in broadest}
+
+    if projection_type not in ROW_SCOPES:
+        return list(groups.values())
+
+    id_parameter, ids_parameter, selector = ROW_SCOPES[projection_type]
+    row_groups = {
+        group.payload[id_parameter]: group
+        for group in groups.values()
+        if group.payload.keys() == {id_parameter}
+    }
+    rebuilds = [
+        group for group in groups.values() if group.payload.keys() != {id_parameter}
+    ]
+
+    # single rows selected by a broader rebuild are covered by it, the others
+    # (e.g. deleted ones) are rebuilt by id
+    for rebuild in rebuilds:
+        if not row_groups:
+            break
+        try:
+            covered_ids = selector(**rebuild.payload).filter(id__in=list(row_groups))
+            covered_ids = {str(i) for i in covered_ids.values_list("id", flat=True)}
+        except Exception as e:
+            logger.warning(
+                f"Failed to resolve the rows of {projection_type} rebuild "
+                f"{rebuild.payload}: {e}"
+            )
+            continue
+
+        for row_id in list(row_groups):
+            if str(row_id) in covered_ids:
+                rebuild.requests += row_groups.pop(row_id).requests
+
+    # the remaining single rows are rebuilt together
+    if len(row_groups) == 1:
+        rebuilds += row_groups.values()
+    elif row_groups:
+        rebuilds.append(
+            ProjectionRebuild(
+                projection_type,
+                {ids_parameter: sorted(row_groups, key=str)},
+                [r for group in row_groups.values() for r in group.requests],
+            )
+        )
+
+    return rebuilds
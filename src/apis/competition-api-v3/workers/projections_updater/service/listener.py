@@ -0,0 +1,134 @@
+import logging
+import select
+import time
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_REQUESTS_CHANNEL = "projection_update_requests"
+
+
+def notify_projection_requests(projection_type: str) -> None:
+    """
+    Wake up the projections workers once the current transaction commits.
+
+    Postgres only delivers a NOTIFY when its transaction commits (and drops it on
+    rollback), and folds identical notifications of a transaction into one. The
+    projection type is the payload, so that workers partitioned by type only
+    wake up for their own requests.
+    """
+    if connection.vendor != "postgresql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_notify(%s, %s)",
+            [PROJECTION_REQUESTS_CHANNEL, str(projection_type)],
+        )
+
+
+class ProjectionRequestsListener:
+    """
+    LISTEN for new projection update requests on a dedicated connection.
+
+    `projection_types` limits the notifications that wake up the listener (all
+    when None). Once `wakeup_fd` becomes readable, `wait` returns immediately:
+    it lets a worker interrupt its threads on shutdown.
+
+    A notification sent while not listening is lost, so callers `connect` before
+    draining the pending requests for the first time, and `wait` only returns
+    once listening again: a drain following it sees every request that was not
+    announced.
+    """
+
+    def __init__(self, projection_types=None, wakeup_fd: int = None):
+        self.projection_types = (
+            set(map(str, projection_types)) if projection_types else None
+        )
+        self.wakeup_fd = wakeup_fd
+        self._connection = None
+
+    def connect(self) -> bool:
+        """LISTEN on a dedicated connection (once), returning whether listening."""
+        if self._connection is None:
+            try:
+                self._connection = self._connect()
+            except Exception as e:
+                logger.warning(f"Failed to listen for projection update requests: {e}")
+                return False
+        return True
+
+    def _connect(self):
+        # a connection of its own: Django's is used (and closed) by the request handling
+        listen_connection = connection.Database.connect(
+            **connection.get_connection_params()
+        )
+        try:
+            listen_connection.autocommit = True
+            with listen_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {PROJECTION_REQUESTS_CHANNEL}")
+        except Exception:
+            listen_connection.close()
+            raise
+        logger.info(
+            f"Listening for projection update requests on {PROJECTION_REQUESTS_CHANNEL}"
+        )
+        return listen_connection
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until a new request is announced or `timeout` seconds elapse.
+
+        Returns whether a notification was received. When Postgres cannot be
+        listened to, it sleeps for `timeout` instead, so the caller keeps polling,
+        and reconnects before returning.
+        """
+        if self._connection is not None:
+            try:
+                return self._wait(timeout)
+            except Exception as e:
+                logger.warning(f"Failed to listen for projection update requests: {e}")
+                self.close()
+
+        select.select(self._wakeup_fds(), [], [], timeout)
+        self.connect()
+        return False
+
+    def _wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._received():
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            readable, _, _ = select.select(
+                [self._connection, *self._wakeup_fds()], [], [], remaining
+            )
+            if self._connection not in readable:
+                return False
+            self._connection.poll()
+
+    def _received(self) -> bool:
+        """Consume the pending notifications, returning whether one concerns us."""
+        notifies = self._connection.notifies
+        received = any(
+            self.projection_types is None or notify.payload in self.projection_types
+            for notify in notifies
+        )
+        notifies.clear()
+        return received
+
+    def _wakeup_fds(self) -> list:
+        return [self.wakeup_fd] if self.wakeup_fd is not None else []
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
@@ -9,13 +9,17 @@ from apps.projections.service import (
     rebuild_general_ranking_projection,
     rebuild_home_page_config_projection,
     rebuild_match_projection,
+    rebuild_match_projections,
     rebuild_modality_ranking_projection,
     rebuild_nucleo_projection,
     rebuild_regulation_projection,
     rebuild_season_projection,
     rebuild_student_projection,
+    rebuild_student_projections,
     rebuild_team_projection,
+    rebuild_team_projections,
     rebuild_tournament_projection,
+    rebuild_tournament_projections,
     rebuild_tournament_standings_projection,
 )
 from apps.regulations.selectors import get_regulations_table
@@ -24,6 +28,30 @@ from apps.teams.selectors import get_teams_table
 from apps.tournaments.selectors import get_tournaments_table
 from django.db import transaction
 
+# rows rebuilt per call of a set-based rebuild function
+REBUILD_CHUNK_SIZE = 500
+
+
+def _rebuild_in_chunks(rebuild_function, ids: list) -> list:
+    """
+    Rebuild with a set-based rebuild function, a bounded number of rows at a time.
+
+    Returns the ids of the projections that changed: the only ones whose cache
+    entries need to be invalidated.
+    """
+    changed_ids = []
+    for i in range(0, len(ids), REBUILD_CHUNK_SIZE):
+        changed_ids += rebuild_function(ids[i : i + REBUILD_CHUNK_SIZE])
+    return changed_ids
+
+
+def _deleted_ids(requested_ids, rebuilt_ids) -> list:
+    """Requested ids left without a source row: their projections must be deleted."""
+    if requested_ids is None:
+        return []
+    found_ids = {str(i) for i in rebuilt_ids}
+    return [i for i in requested_ids if str(i) not in found_ids]
+
 
 @transaction.atomic
 def update_teams_projections(
@@ -32,10 +60,12 @@ def update_teams_projections(
     modality_id: str = None,
     nucleus_id: str = None,
     athlete_id: str = None,
-) -> None:
+    team_ids: list = None,
+) -> list:
     """Update the projections for the teams based on the provided parameters."""
     args = {
         "team_id": team_id,
+        "team_ids": team_ids,
         "course_id": course_id,
         "modality_id": modality_id,
         "nucleus_id": nucleus_id,
@@ -49,21 +79,28 @@ def update_teams_projections(
         nucleus_id=nucleus_id,
         athlete_id=athlete_id,
     )
+    if team_ids is not None:
+        teams = teams.filter(id__in=team_ids)
 
     if team_id is not None and teams.count() == 0:
         # team was deleted
-        rebuild_team_projection(team_id=team_id)
+        changed = rebuild_team_projection(team_id=team_id)
         logger.info(
             f"Updated projections for team_id={team_id} (team deleted).", extra=args
         )
-        return
+        return [team_id] if changed else []
 
-    c = 0
-    for team in teams:
-        rebuild_team_projection(team_id=team.id)
-        c += 1
+    rebuilt_ids = list(teams.prefetch_related(None).values_list("id", flat=True))
+    rebuilt_ids += _deleted_ids(team_ids, rebuilt_ids)
+    changed_ids = _rebuild_in_chunks(rebuild_team_projections, rebuilt_ids)
 
-    logger.info(f"Updated projections for [{c}] teams.", extra=args)
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] teams "
+        f"([{len(changed_ids)}] changed).",
+        extra=args,
+    )
+
+    return changed_ids
 
 
 @transaction.atomic
@@ -72,10 +109,12 @@ def update_athletes_projections(
     course_id: str = None,
     nucleus_id: str = None,
     team_id: str = None,
-) -> None:
+    athlete_ids: list = None,
+) -> list:
     """Update the projections for the athletes based on the provided parameters."""
     args = {
         "athlete_id": athlete_id,
+        "athlete_ids": athlete_ids,
         "course_id": course_id,
         "nucleus_id": nucleus_id,
         "team_id": team_id,
@@ -87,22 +126,29 @@ def update_athletes_projections(
         nucleus_id=nucleus_id,
         team_id=team_id,
     )
+    if athlete_ids is not None:
+        athletes = athletes.filter(id__in=athlete_ids)
 
     if athlete_id is not None and athletes.count() == 0:
         # athlete was deleted
-        rebuild_student_projection(student_id=athlete_id)
+        changed = rebuild_student_projection(student_id=athlete_id)
         logger.info(
             f"Updated projections for athlete_id={athlete_id} (athlete deleted).",
             extra=args,
         )
-        return
+        return [athlete_id] if changed else []
 
-    c = 0
-    for athlete in athletes:
-        rebuild_student_projection(student_id=athlete.id)
-        c += 1
+    rebuilt_ids = list(athletes.prefetch_related(None).values_list("id", flat=True))
+    rebuilt_ids += _deleted_ids(athlete_ids, rebuilt_ids)
+    changed_ids = _rebuild_in_chunks(rebuild_student_projections, rebuilt_ids)
 
-    logger.info(f"Updated projections for [{c}] athletes.", extra=args)
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] athletes "
+        f"([{len(changed_ids)}] changed).",
+        extra=args,
+    )
+
+    return changed_ids
 
 
 @transaction.atomic
@@ -112,10 +158,12 @@ def update_matches_projections(
     modality_id: str = None,
     athlete_id: str = None,
     team_id: str = None,
-) -> None:
+    match_ids: list = None,
+) -> list:
     """Update the projections for the matches based on the provided parameters."""
     args = {
         "match_id": match_id,
+        "match_ids": match_ids,
         "tournament_id": tournament_id,
         "modality_id": modality_id,
         "athlete_id": athlete_id,
@@ -129,29 +177,40 @@ def update_matches_projections(
         athlete_id=athlete_id,
         team_id=team_id,
     )
+    if match_ids is not None:
+        matches = matches.filter(id__in=match_ids)
 
     if match_id is not None and matches.count() == 0:
         # match was deleted
-        rebuild_match_projection(match_id=match_id)
+        changed = rebuild_match_projection(match_id=match_id)
         logger.info(
             f"Updated projections for match_id={match_id} (match deleted).", extra=args
         )
-        return
+        return [match_id] if changed else []
 
-    c = 0
-    for match in matches:
-        rebuild_match_projection(match_id=match.id)
-        c += 1
+    rebuilt_ids = list(matches.prefetch_related(None).values_list("id", flat=True))
+    rebuilt_ids += _deleted_ids(match_ids, rebuilt_ids)
+    changed_ids = _rebuild_in_chunks(rebuild_match_projections, rebuilt_ids)
+
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] matches "
+        f"([{len(changed_ids)}] changed).",
+        extra=args,
+    )
 
-    logger.info(f"Updated projections for [{c}] matches.", extra=args)
+    return changed_ids
 
 
 @transaction.atomic
-def update_nucleus_projections(nucleus_id: str = None) -> None:
+def update_nucleus_projections(
+    nucleus_id: str = None, nucleus_ids: list = None
+) -> list:
     """Update the projections for the nucleus based on the provided parameters."""
-    args = {"nucleus_id": nucleus_id}
+    args = {"nucleus_id": nucleus_id, "nucleus_ids": nucleus_ids}
 
     nucleus = get_nucleus_table(nucleus_id=nucleus_id)
+    if nucleus_ids is not None:
+        nucleus = nucleus.filter(id__in=nucleus_ids)
 
     if nucleus_id is not None and nucleus.count() == 0:
         # nucleus was deleted
@@ -160,37 +219,52 @@ def update_nucleus_projections(nucleus_id: str = None) -> None:
             f"Updated projections for nucleus_id={nucleus_id} (nucleus deleted).",
             extra=args,
         )
-        return
+        return [nucleus_id]
 
-    c = 0
+    rebuilt_ids = []
     for n in nucleus:
         rebuild_nucleo_projection(nucleo_id=n.id)
-        c += 1
+        rebuilt_ids.append(n.id)
+
+    for deleted_id in _deleted_ids(nucleus_ids, rebuilt_ids):
+        rebuild_nucleo_projection(nucleo_id=deleted_id)
+        rebuilt_ids.append(deleted_id)
+
+    logger.info(f"Updated projections for [{len(rebuilt_ids)}] nucleus.", extra=args)
 
-    logger.info(f"Updated projections for [{c}] nucleus.", extra=args)
+    return rebuilt_ids
 
 
 @transaction.atomic
-def update_general_rankings_projections(season_id: str = None) -> None:
+def update_general_rankings_projections(
+    season_id: str = None, season_ids: list = None
+) -> list:
     """Update the projections for the general rankings based on the provided parameters."""
     args = {
         "season_id": season_id,
+        "season_ids": season_ids,
     }
 
     seasons = get_seasons_table(season_id=season_id)
+    if season_ids is not None:
+        seasons = seasons.filter(id__in=season_ids)
 
-    c = 0
+    rebuilt_ids = []
     for season in seasons:
         rebuild_general_ranking_projection(season_id=season.id)
-        c += 1
+        rebuilt_ids.append(season.id)
+
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] seasons ranking.", extra=args
+    )
 
-    logger.info(f"Updated projections for [{c}] seasons ranking.", extra=args)
+    return rebuilt_ids
 
 
 @transaction.atomic
 def update_modality_rankings_projections(
     season_id: str = None, modality_id: str = None
-) -> None:
+) -> list:
     """Update the projections for the modality rankings based on the provided parameters."""
     args = {
         "season_id": season_id,
@@ -201,79 +275,102 @@ def update_modality_rankings_projections(
     modalities = get_modalities_table(modality_id=modality_id)
 
     c = 0
+    rebuilt_ids = []
     for season in seasons:
         for modality in modalities:
             rebuild_modality_ranking_projection(
                 season_id=season.id, modality_id=modality.id
             )
             c += 1
+        rebuilt_ids.append(season.id)
 
     logger.info(
         f"Updated projections for [{c}] season-modality ranking combinations.",
         extra=args,
     )
 
+    return rebuilt_ids
+
 
 @transaction.atomic
-def update_seasons_projections(season_id: str = None) -> None:
+def update_seasons_projections(season_id: str = None, season_ids: list = None) -> list:
     """Update the projections for the seasons based on the provided parameters."""
     args = {
         "season_id": season_id,
+        "season_ids": season_ids,
     }
 
     seasons = get_seasons_table(season_id=season_id)
+    if season_ids is not None:
+        seasons = seasons.filter(id__in=season_ids)
 
-    c = 0
+    rebuilt_ids = []
     for season in seasons:
         rebuild_season_projection(season_id=season.id)
-        c += 1
+        rebuilt_ids.append(season.id)
+
+    logger.info(f"Updated projections for [{len(rebuilt_ids)}] seasons.", extra=args)
 
-    logger.info(f"Updated projections for [{c}] seasons.", extra=args)
+    return rebuilt_ids
 
 
 @transaction.atomic
 def update_tournaments_projections(
-    tournament_id: str = None, modality_id: str = None
-) -> None:
+    tournament_id: str = None, modality_id: str = None, tournament_ids: list = None
+) -> list:
     """Update the projections for the tournaments based on the provided parameters."""
     args = {
         "tournament_id": tournament_id,
         "modality_id": modality_id,
+        "tournament_ids": tournament_ids,
     }
 
     tournaments = get_tournaments_table(
         tournament_id=tournament_id, modality_id=modality_id
     )
+    if tournament_ids is not None:
+        tournaments = tournaments.filter(id__in=tournament_ids)
 
     if tournament_id is not None and tournaments.count() == 0:
         # tournament was deleted
-        rebuild_tournament_projection(tournament_id=tournament_id)
+        changed = rebuild_tournament_projection(tournament_id=tournament_id)
         logger.info(
             f"Updated projections for tournament_id={tournament_id} (tournament deleted).",
             extra=args,
         )
-        return
+        return [tournament_id] if changed else []
 
-    c = 0
-    for tournament in tournaments:
-        rebuild_tournament_projection(tournament_id=tournament.id)
-        c += 1
+    rebuilt_ids = list(tournaments.prefetch_related(None).values_list("id", flat=True))
+    rebuilt_ids += _deleted_ids(tournament_ids, rebuilt_ids)
+    changed_ids = _rebuild_in_chunks(rebuild_tournament_projections, rebuilt_ids)
+
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] tournaments "
+        f"([{len(changed_ids)}] changed).",
+        extra=args,
+    )
 
-    logger.info(f"Updated projections for [{c}] tournaments.", extra=args)
+    return changed_ids
 
 
 @transaction.atomic
 def update_tournament_standings_projections(
-    tournament_id: str = None, team_id: str = None, athlete_id: str = None
-) -> None:
+    tournament_id: str = None,
+    team_id: str = None,
+    athlete_id: str = None,
+    tournament_ids: list = None,
+) -> list:
     """Update the projections for the tournament standings based on the provided parameters."""
     args = {
         "tournament_id": tournament_id,
+        "tournament_ids": tournament_ids,
     }
 
     tournaments = get_tournaments_table(
         tournament_id=tournament_id, team_id=team_id, athlete_id=athlete_id
     )
+    if tournament_ids is not None:
+        tournaments = tournaments.filter(id__in=tournament_ids)
 
     if tournament_id is not None and tournaments.count() == 0:
         # tournament was deleted
@@ -282,24 +379,38 @@ def update_tournament_standings_projections(
             f"Updated projections for tournament_id={tournament_id} (tournament deleted).",
             extra=args,
         )
-        return
+        return [tournament_id]
 
-    c = 0
+    rebuilt_ids = []
     for tournament in tournaments:
         rebuild_tournament_standings_projection(tournament_id=tournament.id)
-        c += 1
+        rebuilt_ids.append(tournament.id)
 
-    logger.info(f"Updated projections for [{c}] tournament standings.", extra=args)
+    for deleted_id in _deleted_ids(tournament_ids, rebuilt_ids):
+        rebuild_tournament_standings_projection(tournament_id=deleted_id)
+        rebuilt_ids.append(deleted_id)
+
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] tournament standings.",
+        extra=args,
+    )
+
+    return rebuilt_ids
 
 
 @transaction.atomic
-def update_regulations_projections(regulation_id: str = None) -> None:
+def update_regulations_projections(
+    regulation_id: str = None, regulation_ids: list = None
+) -> list:
     """Update the projections for the regulations based on the provided parameters."""
     args = {
         "regulation_id": regulation_id,
+        "regulation_ids": regulation_ids,
     }
 
     regulations = get_regulations_table(regulation_id=regulation_id)
+    if regulation_ids is not None:
+        regulations = regulations.filter(id__in=regulation_ids)
 
     if regulation_id is not None and regulations.count() == 0:
         # regulation was deleted
@@ -308,14 +419,22 @@ def update_regulations_projections(regulation_id: str = None) -> None:
             f"Updated projections for regulation_id={regulation_id} (regulation deleted).",
             extra=args,
         )
-        return
+        return [regulation_id]
 
-    c = 0
+    rebuilt_ids = []
     for regulation in regulations:
         rebuild_regulation_projection(regulation_id=regulation.id)
-        c += 1
+        rebuilt_ids.append(regulation.id)
 
-    logger.info(f"Updated projections for [{c}] regulations.", extra=args)
+    for deleted_id in _deleted_ids(regulation_ids, rebuilt_ids):
+        rebuild_regulation_projection(regulation_id=deleted_id)
+        rebuilt_ids.append(deleted_id)
+
+    logger.info(
+        f"Updated projections for [{len(rebuilt_ids)}] regulations.", extra=args
+    )
+
+    return rebuilt_ids
 
 
 @transaction.atomic
@@ -326,16 +445,21 @@ def update_home_page_config_projections() -> None:
 
 
 @transaction.atomic
-def update_courses_projections(course_id: str = None, nucleus_id: str = None) -> None:
+def update_courses_projections(
+    course_id: str = None, nucleus_id: str = None, course_ids: list = None
+) -> list:
     """Update the projections for the courses based on the provided parameters."""
     from apps.courses.selectors import get_courses_table
 
     args = {
         "course_id": course_id,
         "nucleus_id": nucleus_id,
+        "course_ids": course_ids,
     }
 
     courses = get_courses_table(course_id=course_id, nucleo_id=nucleus_id)
+    if course_ids is not None:
+        courses = courses.filter(id__in=course_ids)
 
     if course_id is not None and courses.count() == 0:
         # course was deleted
@@ -344,11 +468,17 @@ def update_courses_projections(course_id: str = None, nucleus_id: str = None) ->
             f"Updated projections for course_id={course_id} (course deleted).",
             extra=args,
         )
-        return
+        return [course_id]
 
-    c = 0
+    rebuilt_ids = []
     for course in courses:
         rebuild_course_projection(course_id=course.id)
-        c += 1
+        rebuilt_ids.append(course.id)
+
+    for deleted_id in _deleted_ids(course_ids, rebuilt_ids):
+        rebuild_course_projection(course_id=deleted_id)
+        rebuilt_ids.append(deleted_id)
+
+    logger.info(f"Updated projections for [{len(rebuilt_ids)}] courses.", extra=args)
 
-    logger.info(f"Updated projections for [{c}] courses.", extra=args)
+    return rebuilt_ids
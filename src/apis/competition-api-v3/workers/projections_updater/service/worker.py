@@ -0,0 +1,133 @@
+import logging
+import os
+import signal
+import threading
+from pathlib import Path
+
+from django.db import connection
+from shared.cache.delayed import public_cache_tasks
+
+from .base import handle_pending_projection_requests
+from .listener import ProjectionRequestsListener
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectionsWorker:
+    """
+    Process projection update requests with a pool of threads.
+
+    Each thread drains the pending requests batch after batch, then waits on its
+    own LISTEN connection for new ones. Threads (and worker processes) claim
+    disjoint batches thanks to `select_for_update(skip_locked=True)`, and
+    `projection_types` partitions the work between workers (all types when None).
+
+    SIGTERM and SIGINT stop the worker: the threads finish their current batch and
+    exit. While every thread is running, the health file is touched every
+    HEALTH_INTERVAL seconds, so a stale file means the worker is unhealthy.
+    """
+
+    HEALTH_INTERVAL = 10
+
+    def __init__(
+        self,
+        threads: int = 1,
+        projection_types=None,
+        batch_size: int = 200,
+        poll_interval: float = 10,
+        health_file: str = None,
+    ):
+        self.threads = threads
+        self.projection_types = projection_types
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.health_file = Path(health_file) if health_file else None
+        self._stop_event = threading.Event()
+        # written on stop: interrupts the threads waiting for notifications
+        self._wakeup_read, self._wakeup_write = os.pipe()
+
+    def run(self) -> bool:
+        """Run until stopped, returning False when a thread died unexpectedly."""
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        logger.info(
+            f"Starting [{self.threads}] projections worker threads "
+            f"(types: {', '.join(self.projection_types or ['all'])})."
+        )
+        threads = [
+            threading.Thread(target=self._work, name=f"projections-worker-{i}")
+            for i in range(self.threads)
+        ]
+        for thread in threads:
+            thread.start()
+
+        healthy = True
+        while True:
+            if all(thread.is_alive() for thread in threads):
+                self._touch_health_file()
+            elif not self._stop_event.is_set():
+                logger.error("A projections worker thread died, stopping the worker.")
+                healthy = False
+                self.stop()
+
+            if self._stop_event.wait(self.HEALTH_INTERVAL):
+                break
+
+        for thread in threads:
+            thread.join()
+        # run the pending cache invalidations and refreshes now rather than lose them
+        public_cache_tasks.join(now=True)
+
+        if self.health_file is not None:
+            self.health_file.unlink(missing_ok=True)
+        os.close(self._wakeup_read)
+        os.close(self._wakeup_write)
+
+        logger.info("Projections worker stopped.")
+        return healthy
+
+    def stop(self) -> None:
+        if not self._stop_event.is_set():
+            self._stop_event.set()
+            os.write(self._wakeup_write, b"\0")
+
+    def _handle_signal(self, signum, frame):
+        logger.info(f"Received signal {signum}, stopping after the current batches.")
+        self.stop()
+
+    def _touch_health_file(self) -> None:
+        if self.health_file is None:
+            return
+        try:
+            self.health_file.touch()
+        except OSError as e:
+            logger.warning(f"Failed to touch health file {self.health_file}: {e}")
+
+    def _work(self) -> None:
+        listener = ProjectionRequestsListener(
+            self.projection_types, wakeup_fd=self._wakeup_read
+        )
+        try:
+            # listen before the first drain, not to miss requests created meanwhile
+            listener.connect()
+            while not self._stop_event.is_set():
+                try:
+                    # drain everything pending, batch after batch
+                    while not self._stop_event.is_set():
+                        if not handle_pending_projection_requests(
+                            self.projection_types, self.batch_size
+                        ):
+                            break
+                except Exception as e:
+                    logger.error(f"Error handling projection update requests: {e}")
+                    # reconnect on the next batch, e.g. after a database restart
+                    connection.close()
+
+                # sleep until a new request is committed (NOTIFY), polling as a fallback
+                if not self._stop_event.is_set():
+                    listener.wait(self.poll_interval)
+        finally:
+            listener.close()
+            # Django connections are per thread
+            connection.close()
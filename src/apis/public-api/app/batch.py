@@ -0,0 +1,234 @@
+"""
+Batch resolution of public API requests.
+
+Website pages fan out into several list/detail calls. The batch endpoint
+resolves them in a single HTTP request: each sub-request is matched to its
+route, the cached bodies of all of them are fetched with one MGET and only the
+misses run the route, concurrently (at most BATCH_CONCURRENCY at a time) and
+each on its own database session.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import orjson
+from fastapi import HTTPException, Response
+from fastapi.params import Depends
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError, create_model
+
+from .cache import (
+    CachedRoute,
+    body_etag,
+    cache_lookups,
+    get_cached_bodies,
+    get_redis_client,
+    redis_breaker,
+    store_bodies,
+)
+from .database import get_async_db
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/public"
+
+# Cache misses of a batch computed at the same time, each holding a connection
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", 4))
+
+# Parameter validation model of each cached route, built on first use
+_params_models: dict[CachedRoute, type[BaseModel]] = {}
+
+
+def _params_model(route: CachedRoute) -> type[BaseModel]:
+    """Pydantic model validating the query/path parameters of a route."""
+    model = _params_models.get(route)
+    if model is None:
+        fields = {}
+        for name, parameter in inspect.signature(route.func).parameters.items():
+            if isinstance(parameter.default, Depends):
+                continue
+            default = (
+                ...
+                if parameter.default is inspect.Parameter.empty
+                else parameter.default
+            )
+            fields[name] = (parameter.annotation, default)
+        model = create_model(f"{route.func.__name__}_params", **fields)
+        _params_models[route] = model
+    return model
+
+
+def _match(routes: list, path: str) -> tuple[Optional[CachedRoute], dict[str, Any]]:
+    """Find the cached GET route serving a path, with its path parameters."""
+    path = path.removeprefix(API_PREFIX) or "/"
+    for route in routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        cached_route = getattr(route.endpoint, "cached_route", None)
+        if cached_route is None:
+            continue
+        match = route.path_regex.match(path)
+        if match:
+            return cached_route, {
+                name: route.param_convertors[name].convert(value)
+                for name, value in match.groupdict().items()
+            }
+    return None, {}
+
+
+def _error(detail: Any) -> bytes:
+    return orjson.dumps({"detail": detail})
+
+
+async def _compute(
+    route: CachedRoute, params: dict[str, Any], semaphore: asyncio.Semaphore
+) -> tuple[int, bytes, bool]:
+    """
+    Run the route of a cache miss on its own session: (status, body, cacheable).
+
+    Errors only fail their own sub-request, with a 500 when not an HTTPException.
+    """
+    async with semaphore:
+        try:
+            async with get_async_db() as db:
+                result = await route.func(**params, db=db)
+                if isinstance(result, Response):
+                    return result.status_code, result.body, False
+                return 200, route.render(result), True
+        except HTTPException as e:
+            return e.status_code, _error(e.detail), False
+        except Exception as e:
+            logger.error(
+                "batch_request_failed",
+                extra={"function": route.func.__name__, "error": str(e)},
+            )
+            return 500, _error("Internal Server Error"), False
+
+
+async def resolve_requests(routes: list, requests: list) -> list[tuple[int, bytes]]:
+    """
+    Resolve several GET requests of the public API.
+
+    Args:
+        routes: Routes of the public API router
+        requests: Sub-requests (path, optional query params)
+
+    Returns:
+        (status, JSON body) of each sub-request, in the order of the requests
+    """
+    results: list[Optional[tuple[int, bytes]]] = [None] * len(requests)
+    pending: list[tuple[int, CachedRoute, dict[str, Any]]] = []
+
+    for index, sub_request in enumerate(requests):
+        url = urlsplit(sub_request.path)
+        route, path_params = _match(routes, url.path)
+        if route is None:
+            results[index] = (404, _error("Not Found"))
+            continue
+        try:
+            params = (
+                _params_model(route)
+                .model_validate(
+                    {
+                        **dict(parse_qsl(url.query)),
+                        **sub_request.params,
+                        **path_params,
+                    }
+                )
+                .model_dump()
+            )
+        except ValidationError as e:
+            results[index] = (
+                422,
+                b'{"detail":' + e.json(include_url=False).encode() + b"}",
+            )
+            continue
+        pending.append((index, route, params))
+
+    keys: list[Optional[str]] = [None] * len(pending)
+    bodies: list[Optional[tuple[str, bytes]]] = [None] * len(pending)
+    client = get_redis_client()
+    if client is None:
+        for _, route, _ in pending:
+            cache_lookups.labels(route.family, "bypass").inc()
+    elif pending:
+        try:
+            keys = [await route.key(params) for _, route, params in pending]
+            bodies = await get_cached_bodies(
+                client, [(route, key) for (_, route, _), key in zip(pending, keys)]
+            )
+        except Exception as e:
+            redis_breaker.record_failure(e)
+            for _, route, _ in pending:
+                cache_lookups.labels(route.family, "error").inc()
+            logger.warning("batch_cache_lookup_failed", extra={"error": str(e)})
+            keys = [None] * len(pending)
+
+    misses = []
+    for (index, route, params), key, cached in zip(pending, keys, bodies):
+        if cached is None:
+            misses.append((index, route, params, key))
+        else:
+            results[index] = (200, cached[1])
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    outcomes = await asyncio.gather(
+        *[_compute(route, params, semaphore) for _, route, params, _ in misses]
+    )
+
+    computed = []
+    for (index, route, _, key), (status, body, cacheable) in zip(misses, outcomes):
+        results[index] = (status, body)
+        if cacheable and key is not None:
+            computed.append((route, key, body_etag(body), body))
+
+    if computed:
+        try:
+            await store_bodies(client, computed)
+        except Exception as e:
+            redis_breaker.record_failure(e)
+            logger.warning("batch_cache_store_failed", extra={"error": str(e)})
+
+    logger.info(
+        "batch_resolved",
+        extra={
+            "requests": len(requests),
+            "cache_hits": sum(cached is not None for cached in bodies),
+            "computed": len(computed),
+        },
+    )
+
+    return results
+
+
+async def resolve_batch(routes: list, requests: list) -> bytes:
+    """
+    Resolve several GET requests of the public API into a batch response.
+
+    Args:
+        routes: Routes of the public API router
+        requests: Sub-requests (path, optional query params)
+
+    Returns:
+        JSON body {"responses": [{"path", "status", "body"}, ...]}, in the
+        order of the sub-requests
+    """
+    results = await resolve_requests(routes, requests)
+    return (
+        b'{"responses":['
+        + b",".join(
+            b'{"path":'
+            + orjson.dumps(sub_request.path)
+            + b',"status":'
+            + str(status).encode()
+            + b',"body":'
+            + body
+            + b"}"
+            for sub_request, (status, body) in zip(requests, results)
+        )
+        + b"]}"
+    )
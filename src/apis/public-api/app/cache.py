@@ -3,16 +3,32 @@ Redis caching utility for Public API.
 
 This module provides a caching layer to minimize database hits by storing
 frequently accessed data in Redis with configurable TTLs.
+
+Redis is accessed through redis.asyncio, so cache round trips never block the
+event loop the async routes run on.
 """
 
+import asyncio
+import hashlib
+import inspect
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict, deque
 from functools import wraps
+from operator import attrgetter
 from typing import Any, Callable, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-import redis
+import orjson
+import redis.asyncio as redis
+from fastapi import Request, Response
+from prometheus_client import Counter
+from prometheus_client import Enum as EnumMetric
+from prometheus_client import Histogram
+from pydantic import TypeAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +36,15 @@ logger = logging.getLogger(__name__)
 REDIS_HOST = os.getenv("REDIS_HOST", "redis")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_DB = int(os.getenv("REDIS_DB", 0))
+# Bounds how long a request can wait on an unreachable Redis before failing over
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 1.0))
 CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+CACHE_INVALIDATION_CHANNEL = os.getenv(
+    "CACHE_INVALIDATION_CHANNEL", "public-api:cache-invalidation"
+)
+
+# Generation counters of the cache namespaces (see versioned_key)
+GENERATION_KEY_PREFIX = "cache:gen:"
 
 # TTL configurations (in seconds)
 CACHE_TTL = {
@@ -42,41 +66,320 @@ CACHE_TTL = {
     "course": 300,  # 5 minutes
 }
 
+# Seconds stale entries may still be served while being refreshed (see cached)
+CACHE_STALE_TTL = {
+    "tournament_list": 60,
+    "match_list": 30,
+    "ranking": 60,
+}
+
+# In-process cache tier (per uvicorn worker) in front of Redis, in seconds per family
+LOCAL_CACHE_MAX_ENTRIES = int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", 1024))
+LOCAL_CACHE_TTL = {
+    "nucleo": 60,
+    "nucleo_list": 60,
+    "regulation": 60,
+    "season": 60,
+    "home_page_config": 60,
+    "course": 30,
+}
+# Upper bound on how long a process may miss a generation bump (e.g. while the
+# invalidation listener is reconnecting)
+LOCAL_GENERATION_TTL = 5
+
+# Upper bound of the Cache-Control max-age sent to clients; past it they revalidate
+# with If-None-Match, which stays cheap and picks up event-driven invalidations
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", 60))
+# Seconds the nginx micro-cache in front of the API keeps a body (X-Accel-Expires,
+# which nginx honours over Cache-Control and does not forward to clients)
+PROXY_CACHE_MAX_AGE = int(os.getenv("PROXY_CACHE_MAX_AGE", 5))
+
+# Single-flight recomputation of missing keys
+LOCK_TIMEOUT_MS = 5000  # lock expiry, bounds how long a crashed holder blocks a key
+LOCK_WAIT_TIMEOUT = 2.0  # seconds a request waits for the holder before querying itself
+LOCK_POLL_INTERVAL = 0.05
+
+# Circuit breaker around Redis (see RedisCircuitBreaker)
+REDIS_BREAKER_FAILURE_THRESHOLD = int(os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", 3))
+REDIS_BREAKER_FAILURE_WINDOW = float(os.getenv("REDIS_BREAKER_FAILURE_WINDOW", 10))
+REDIS_BREAKER_MAX_BACKOFF = float(os.getenv("REDIS_BREAKER_MAX_BACKOFF", 30))
+
 # Redis client instance
 _redis_client: Optional[redis.Redis] = None
 
+# Background refreshes of stale entries (referenced until done, see cached)
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+class LocalCache:
+    """
+    Size-bounded, in-process LRU cache with per-entry TTLs.
+
+    Sits in front of Redis (one instance per uvicorn worker). Values are shared
+    between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Get a value, or _MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """Remove entries if present."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_MISSING = object()
+
+local_cache = LocalCache(LOCAL_CACHE_MAX_ENTRIES)
+
+# Hit/miss counters per cache tier (per process)
+_tier_stats: dict[str, dict[str, int]] = {
+    "local": {"hits": 0, "misses": 0},
+    "redis": {"hits": 0, "misses": 0},
+}
+
+
+def _record(tier: str, outcome: str) -> None:
+    _tier_stats[tier][outcome] += 1
+
+
+# Outcomes of a cache lookup: served fresh, served stale, recomputed, failed over
+# to the database on a Redis error, or not attempted (cache disabled/circuit open)
+CACHE_OUTCOMES = ("hit", "stale", "miss", "error", "bypass")
+
+cache_lookups = Counter(
+    "public_api_cache_lookups_total",
+    "Cache lookups by key family (cache_key / response:<route>) and outcome",
+    ["family", "outcome"],
+)
+redis_latency = Histogram(
+    "public_api_redis_latency_seconds",
+    "Latency of the cache's Redis round trips",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+crud_db_time = Histogram(
+    "public_api_crud_db_seconds",
+    "Time cached crud functions spend querying the database (misses and bypasses)",
+    ["function", "family"],
+)
+
+
+async def _timed(metric: Any, awaitable: Any) -> Any:
+    """Await, observing the elapsed time on a histogram (child)."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        metric.observe(time.perf_counter() - start)
+
+
+redis_circuit_state = EnumMetric(
+    "public_api_redis_circuit_state",
+    "State of the circuit breaker around the Redis cache",
+    states=["closed", "open"],
+)
+redis_circuit_opened = Counter(
+    "public_api_redis_circuit_opened_total",
+    "Number of times the Redis circuit breaker opened",
+)
+
+
+class RedisCircuitBreaker:
+    """
+    Circuit breaker around the Redis cache.
+
+    Connection errors and timeouts are counted over a sliding window; once they
+    reach the threshold the circuit opens and get_redis_client returns None, so
+    requests go straight to the database (the same path as a disabled cache)
+    instead of each waiting on Redis timeouts. While open, a background task
+    pings Redis with exponential backoff and closes the circuit on success.
+    """
+
+    def __init__(self, threshold: int, window: float, max_backoff: float):
+        self.threshold = threshold
+        self.window = window
+        self.max_backoff = max_backoff
+        self.state = "closed"
+        self.opened_count = 0
+        self.last_error: Optional[str] = None
+        self._opened_at: Optional[float] = None
+        self._failures: deque[float] = deque()
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def allow(self) -> bool:
+        """Whether Redis may be used, (re)starting the probe while open."""
+        if self.state == "closed":
+            return True
+        self._ensure_probe()
+        return False
+
+    def record_failure(self, error: BaseException, immediate: bool = False) -> None:
+        """
+        Count an error of a Redis call; only connectivity errors count.
+
+        Args:
+            error: Exception raised by the Redis call
+            immediate: Open the circuit right away (e.g. Redis down at startup)
+        """
+        if not isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            return
+
+        self.last_error = str(error)
+        if self.state == "open":
+            return
+
+        now = time.monotonic()
+        self._failures.append(now)
+        while self._failures and self._failures[0] <= now - self.window:
+            self._failures.popleft()
+        if immediate or len(self._failures) >= self.threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = "open"
+        self.opened_count += 1
+        self._opened_at = time.monotonic()
+        self._failures.clear()
+        redis_circuit_state.state("open")
+        redis_circuit_opened.inc()
+        logger.error(
+            "redis_circuit_opened",
+            extra={"error": self.last_error, "threshold": self.threshold},
+        )
+        self._ensure_probe()
+
+    def _close(self) -> None:
+        logger.info(
+            "redis_circuit_closed",
+            extra={"open_seconds": round(time.monotonic() - self._opened_at, 1)},
+        )
+        self.state = "closed"
+        self._opened_at = None
+        redis_circuit_state.state("closed")
+        # Generations may have been bumped while we could not see them
+        local_cache.clear()
+
+    def _ensure_probe(self) -> None:
+        if self._probe_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # started by the next call made from the event loop
+        self._probe_task = loop.create_task(self._probe(), name="redis-circuit-probe")
+
+    async def _probe(self) -> None:
+        backoff = 1.0
+        try:
+            while self.state == "open":
+                await asyncio.sleep(backoff)
+                try:
+                    await _connect().ping()
+                except Exception as e:
+                    self.last_error = str(e)
+                    logger.warning(
+                        "redis_circuit_probe_failed",
+                        extra={"error": str(e), "retry_in": backoff},
+                    )
+                    backoff = min(backoff * 2, self.max_backoff)
+                    continue
+                self._close()
+        finally:
+            self._probe_task = None
+
+    def stats(self) -> dict:
+        """State of the breaker, as reported by /cache/stats."""
+        return {
+            "state": self.state,
+            "opened_count": self.opened_count,
+            "open_seconds": (
+                round(time.monotonic() - self._opened_at, 1)
+                if self._opened_at is not None
+                else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+redis_breaker = RedisCircuitBreaker(
+    REDIS_BREAKER_FAILURE_THRESHOLD,
+    REDIS_BREAKER_FAILURE_WINDOW,
+    REDIS_BREAKER_MAX_BACKOFF,
+)
+
 
 def get_redis_client() -> Optional[redis.Redis]:
     """
     Get or create Redis client instance.
 
+    Connections are opened lazily by the pool; the startup check
+    (check_redis_connection) pings the server.
+
     Returns:
-        Redis client instance or None if cache is disabled
+        Redis client instance or None if cache is disabled or the circuit
+        breaker is open
     """
-    global _redis_client
-
-    if not CACHE_ENABLED:
+    if not CACHE_ENABLED or not redis_breaker.allow():
         return None
 
+    return _connect()
+
+
+def _connect() -> Optional[redis.Redis]:
+    """Create the Redis client on first use, regardless of the circuit state."""
+    global _redis_client
+
     if _redis_client is None:
         try:
             _redis_client = redis.Redis(
-                host=REDIS_HOST,
-                port=REDIS_PORT,
-                db=REDIS_DB,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_keepalive=True,
-                retry_on_timeout=True,
                 connection_pool=redis.ConnectionPool(
                     host=REDIS_HOST,
                     port=REDIS_PORT,
                     db=REDIS_DB,
+                    socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                    socket_timeout=REDIS_SOCKET_TIMEOUT,
+                    socket_keepalive=True,
                     max_connections=100,
                 ),
             )
-            # Test connection
-            _redis_client.ping()
             logger.info(
                 "redis_connected", extra={"host": REDIS_HOST, "port": REDIS_PORT}
             )
@@ -90,43 +393,57 @@ def get_redis_client() -> Optional[redis.Redis]:
     return _redis_client
 
 
-def clear_redis_cache():
+async def clear_redis_cache():
     """Clear all cache entries (use with caution)."""
     client = get_redis_client()
     if client:
         try:
-            client.flushdb()
+            await client.flushdb()
+            # Let every process drop its local tier as well
+            await client.publish(
+                CACHE_INVALIDATION_CHANNEL, json.dumps({"action": "clear"})
+            )
             logger.info("redis_cache_cleared")
         except Exception as e:
+            redis_breaker.record_failure(e)
             logger.error("redis_clear_failed", extra={"error": str(e)})
+    local_cache.clear()
+
+
+# Column names and a compiled attribute getter per projection model
+_row_layouts: dict[type, tuple[tuple[str, ...], Callable[[Any], Any]]] = {}
+
+
+def row_to_dict(obj: Any) -> dict:
+    """
+    Convert a SQLAlchemy model instance to a dict of its columns.
+
+    The column layout of each model is resolved once and read with a single
+    attrgetter call; UUID and datetime values are left for orjson to encode.
+    """
+    layout = _row_layouts.get(type(obj))
+    if layout is None:
+        names = tuple(col.name for col in obj.__table__.columns)
+        layout = _row_layouts[type(obj)] = (names, attrgetter(*names))
+    names, getter = layout
+    values = getter(obj)
+    return dict(zip(names, values if len(names) > 1 else (values,)))
 
 
 def json_serializer(obj: Any) -> Any:
     """
-    Serialize objects to JSON-compatible format.
+    Serialize objects orjson cannot encode natively.
 
     Handles:
-    - UUID objects -> converted to string
-    - SQLAlchemy ORM models -> converted to dict
-    - datetime objects -> converted to ISO format string
+    - SQLAlchemy ORM models -> converted to dict (see row_to_dict)
     - Other objects with __dict__ -> converted to dict (private attrs excluded)
-    """
-    if isinstance(obj, UUID):
-        return str(obj)
 
+    UUID, datetime and date values are encoded by orjson itself.
+    """
     # Handle SQLAlchemy model instances with __table__ attribute
     if hasattr(obj, "__table__"):
-        result = {}
         try:
-            for col in obj.__table__.columns:
-                val = getattr(obj, col.name, None)
-                if isinstance(val, UUID):
-                    result[col.name] = str(val)
-                elif hasattr(val, "isoformat"):  # datetime objects
-                    result[col.name] = val.isoformat()
-                else:
-                    result[col.name] = val
-            return result
+            return row_to_dict(obj)
         except Exception as e:
             logger.warning(
                 "sqlalchemy_serialization_failed",
@@ -136,268 +453,904 @@ def json_serializer(obj: Any) -> Any:
     # For other objects with __dict__, convert to dict excluding private attributes
     if hasattr(obj, "__dict__"):
         try:
-            result = {}
-            for key, value in vars(obj).items():
-                if not key.startswith("_"):
-                    if isinstance(value, UUID):
-                        result[key] = str(value)
-                    elif hasattr(value, "isoformat"):
-                        result[key] = value.isoformat()
-                    else:
-                        result[key] = value
-            return result
-        except (TypeError, ValueError):
+            return {
+                key: value
+                for key, value in vars(obj).items()
+                if not key.startswith("_")
+            }
+        except TypeError:
             pass
 
     # Last resort - convert to string
     return str(obj)
 
 
-class CacheKeyGenerator:
-    """Generate cache keys for different entity types."""
-
-    @staticmethod
-    def team(team_id: UUID) -> str:
-        """Cache key for a single team by ID."""
-        return f"team:{team_id}"
-
-    @staticmethod
-    def team_list(
-        skip: int = 0,
-        limit: int = 50,
-        course_id: Optional[UUID] = None,
-        nucleo_id: Optional[UUID] = None,
-        modality_id: Optional[UUID] = None,
-        season_id: Optional[int] = None,
-    ) -> str:
-        """Cache key for team list with filters."""
-        filters = f"course={course_id}:nucleo={nucleo_id}:modality={modality_id}:season={season_id}"
-        return f"team:list:{skip}:{limit}:{filters}"
-
-    @staticmethod
-    def student(student_id: UUID) -> str:
-        """Cache key for a single student by ID."""
-        return f"student:{student_id}"
-
-    @staticmethod
-    def student_by_number(student_number: str) -> str:
-        """Cache key for student by number."""
-        return f"student:number:{student_number}"
-
-    @staticmethod
-    def student_list(
-        skip: int = 0,
-        limit: int = 50,
-        course_id: Optional[UUID] = None,
-        nucleo_id: Optional[UUID] = None,
-        is_member: Optional[bool] = None,
-        search: Optional[str] = None,
-    ) -> str:
-        """Cache key for student list with filters."""
-        filters = (
-            f"course={course_id}:nucleo={nucleo_id}:member={is_member}:search={search}"
+async def get_generations(
+    client: redis.Redis, namespaces: tuple[str, ...]
+) -> list[int]:
+    """
+    Get the current generation of each cache namespace in one round trip.
+
+    Missing generations are seeded with the current time in milliseconds, so a
+    counter lost to eviction can never fall back to a value used by live entries.
+    """
+    generation_keys = [
+        f"{GENERATION_KEY_PREFIX}{namespace}" for namespace in namespaces
+    ]
+    values = await client.mget(generation_keys)
+
+    if None in values:
+        seed = int(time.time() * 1000)
+        pipe = client.pipeline()
+        for generation_key, value in zip(generation_keys, values):
+            if value is None:
+                pipe.set(generation_key, seed, nx=True)
+        await pipe.execute()
+        values = await client.mget(generation_keys)
+
+    return [int(value) for value in values]
+
+
+async def versioned_keys(keys: list[str], *namespaces: str) -> list[str]:
+    """Version several keys sharing the same namespaces with a single lookup."""
+    client = get_redis_client()
+    if client is None:
+        return keys
+
+    # Generations are mirrored in the local tier so hot keys need no network hop
+    generations = [local_cache.get(f"gen:{namespace}") for namespace in namespaces]
+    missing = [ns for ns, gen in zip(namespaces, generations) if gen is _MISSING]
+    if missing:
+        fetched = dict(zip(missing, await get_generations(client, tuple(missing))))
+        for namespace, generation in fetched.items():
+            local_cache.set(f"gen:{namespace}", generation, LOCAL_GENERATION_TTL)
+        generations = [
+            fetched[ns] if gen is _MISSING else gen
+            for ns, gen in zip(namespaces, generations)
+        ]
+
+    version = ".".join(str(generation) for generation in generations)
+    return [f"{key}:v{version}" for key in keys]
+
+
+async def versioned_key(key: str, *namespaces: str) -> str:
+    """
+    Embed the generation of each namespace in a cache key.
+
+    Bumping any of the namespaces (see invalidate_namespaces) makes every key built
+    with it unreachable; the orphaned entries simply expire with their TTL.
+
+    Args:
+        key: Readable base key (e.g., "match:list:0:50:...")
+        namespaces: Namespaces the key belongs to, broadest first
+
+    Returns:
+        Key suffixed with the namespace generations (e.g., "match:list:...:v17")
+    """
+    return (await versioned_keys([key], *namespaces))[0]
+
+
+def call_key(base: str, params: dict[str, Any]) -> str:
+    """
+    Canonical cache key of a call: a readable base plus a hash of its arguments.
+
+    Arguments are encoded as sorted JSON, so the key does not depend on argument
+    order or on how they were passed (UUID or its string, positional or keyword),
+    and free-text values cannot collide with the key's separators.
+
+    Args:
+        base: Readable prefix (e.g., "match:list")
+        params: Bound arguments of the call, without the database session
+
+    Returns:
+        Unversioned cache key (e.g., "match:list:1f0c...")
+    """
+    canonical = orjson.dumps(
+        params,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return f"{base}:{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+
+
+def _serialize(result: Any) -> bytes:
+    return orjson.dumps(result, default=json_serializer, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def _store(
+    client: redis.Redis, key: str, result: Any, ttl: int, func_name: str
+) -> Optional[bytes]:
+    """Serialize and store a computed result, logging (not raising) failures."""
+    try:
+        serialized = _serialize(result)
+        await _timed(redis_latency.labels("set"), client.setex(key, ttl, serialized))
+        logger.debug(
+            "cache_set",
+            extra={"key": key, "ttl": ttl, "function": func_name},
+        )
+        return serialized
+    except Exception as e:
+        logger.warning(
+            "cache_serialization_failed",
+            extra={"function": func_name, "error": str(e)},
+        )
+        return None
+
+
+def _decode(key: str, cached_value: Any, local_ttl: int) -> Any:
+    """Decode a Redis value, promoting it to the local tier if enabled."""
+    value = orjson.loads(cached_value)
+    if local_ttl:
+        local_cache.set(key, value, local_ttl)
+    return value
+
+
+async def _acquire_lock(client: redis.Redis, key: str) -> Optional[str]:
+    """Try to take the single-flight lock of a key, returning its token."""
+    token = uuid4().hex
+    if await client.set(f"{key}:lock", token, nx=True, px=LOCK_TIMEOUT_MS):
+        return token
+    return None
+
+
+# Deletes a lock only while it still holds the caller's token, in one step: a lock
+# that expired and was taken by another holder in between is left alone
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+async def release_lock(client: redis.Redis, lock_key: str, token: str) -> bool:
+    """Release a Redis lock if it is still owned by the given token."""
+    return bool(await client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+
+
+async def _release_lock(client: redis.Redis, key: str, token: str) -> None:
+    """Release a single-flight lock if it is still owned by the given token."""
+    await release_lock(client, f"{key}:lock", token)
+
+
+async def _wait_for_value(client: redis.Redis, key: str) -> Optional[bytes]:
+    """Poll for a value being computed by the lock holder of a key."""
+    deadline = time.monotonic() + LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        value = await client.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _with_session(args: tuple, kwargs: dict, session: Any) -> tuple[tuple, dict]:
+    """Replace the database session (``db`` / first argument) of a crud call."""
+    if "db" in kwargs:
+        return args, {**kwargs, "db": session}
+    return (session, *args[1:]), kwargs
+
+
+async def _refresh_in_background(
+    client: redis.Redis,
+    func: Callable,
+    db_time: Any,
+    key: str,
+    token: str,
+    ttl: int,
+    args: tuple,
+    kwargs: dict,
+) -> None:
+    """Recompute a stale entry with its own session, outside of the request."""
+    from .database import get_async_db
+
+    try:
+        async with get_async_db() as db:
+            args, kwargs = _with_session(args, kwargs, db)
+            result = await _timed(db_time, func(*args, **kwargs))
+            await _store(client, key, result, ttl, func.__name__)
+        logger.debug("cache_refreshed", extra={"key": key, "function": func.__name__})
+    except Exception as e:
+        logger.warning(
+            "cache_refresh_failed",
+            extra={"key": key, "function": func.__name__, "error": str(e)},
         )
-        return f"student:list:{skip}:{limit}:{filters}"
-
-    @staticmethod
-    def tournament(tournament_id: UUID) -> str:
-        """Cache key for a single tournament by ID."""
-        return f"tournament:{tournament_id}"
-
-    @staticmethod
-    def tournament_list(
-        skip: int = 0,
-        limit: int = 50,
-        modality_id: Optional[UUID] = None,
-        status: Optional[str] = None,
-        season_id: Optional[int] = None,
-    ) -> str:
-        """Cache key for tournament list with filters."""
-        filters = f"modality={modality_id}:status={status}:season={season_id}"
-        return f"tournament:list:{skip}:{limit}:{filters}"
-
-    @staticmethod
-    def match(match_id: UUID) -> str:
-        """Cache key for a single match by ID."""
-        return f"match:{match_id}"
-
-    @staticmethod
-    def match_list(
-        skip: int = 0,
-        limit: int = 50,
-        tournament_id: Optional[UUID] = None,
-        status: Optional[str] = None,
-        date: Optional[str] = None,
-    ) -> str:
-        """Cache key for match list with filters."""
-        filters = f"tournament={tournament_id}:status={status}:date={date}"
-        return f"match:list:{skip}:{limit}:{filters}"
-
-    @staticmethod
-    def ranking(ranking_type: str, ranking_id: UUID) -> str:
-        """Cache key for ranking (general or modality)."""
-        return f"ranking:{ranking_type}:{ranking_id}"
-
-    @staticmethod
-    def ranking_list(ranking_type: str, skip: int = 0, limit: int = 100) -> str:
-        """Cache key for ranking list."""
-        return f"ranking:{ranking_type}:list:{skip}:{limit}"
-
-    @staticmethod
-    def nucleo(nucleo_id: UUID) -> str:
-        """Cache key for a single nucleo by ID."""
-        return f"nucleo:{nucleo_id}"
-
-    @staticmethod
-    def nucleo_list(skip: int = 0, limit: int = 100) -> str:
-        """Cache key for nucleo list."""
-        return f"nucleo:list:{skip}:{limit}"
-
-    @staticmethod
-    def modality(modality_id: UUID) -> str:
-        """Cache key for modality."""
-        return f"modality:{modality_id}"
-
-    @staticmethod
-    def regulation(regulation_id: UUID) -> str:
-        """Cache key for regulation."""
-        return f"regulation:{regulation_id}"
+    finally:
+        await _release_lock(client, key, token)
 
 
 def cached(
     cache_key: str,
     ttl: int = 3600,
-    key_builder: Optional[Callable] = None,
+    namespaces: Optional[Callable[..., tuple[str, ...]]] = None,
+    stale_ttl: int = 0,
+    local_ttl: int = 0,
 ) -> Callable:
     """
     Decorator for caching function results in Redis.
 
+    Keys are derived from the function signature: the call's bound arguments
+    (defaults applied, database session excluded) are hashed canonically under
+    cache_key (see call_key), so every parameter is part of the key by
+    construction.
+
+    With local_ttl, decoded values are also kept in the in-process LRU tier, so
+    hot keys are served without a Redis round trip or JSON decoding.
+
+    Lookups are counted per outcome under cache_key (public_api_cache_lookups_total)
+    and the time spent in the function itself, i.e. in the database, is
+    observed on public_api_crud_db_seconds.
+
+    Misses are single-flight: only the request holding a short Redis lock runs the
+    function, concurrent requests wait for its result instead of hitting the DB.
+
+    With stale_ttl, entries are kept for ttl + stale_ttl seconds; once older than
+    ttl they are still served while one request refreshes them in the background.
+
     Args:
-        cache_key: Base cache key (if key_builder is provided, this is ignored)
+        cache_key: Readable base of the keys (e.g., "match:list")
         ttl: Time to live in seconds
-        key_builder: Optional function to dynamically build cache key from function args
+        namespaces: Function of the call arguments returning the cache namespaces
+            the result depends on (defaults to cache_key alone, see versioned_key)
+        stale_ttl: Seconds a value may be served stale while it is being refreshed
+        local_ttl: Seconds a value may be served from the in-process tier
 
     Returns:
         Decorated function with caching
     """
 
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        get_namespaces = namespaces or (lambda **_: (cache_key,))
+        lookups = {
+            outcome: cache_lookups.labels(cache_key, outcome)
+            for outcome in CACHE_OUTCOMES
+        }
+        db_time = crud_db_time.labels(func.__name__, cache_key)
+
+        def query(args: tuple, kwargs: dict) -> Any:
+            return _timed(db_time, func(*args, **kwargs))
+
+        async def build_key(args: tuple, kwargs: dict) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "db"}
+            return await versioned_key(
+                call_key(cache_key, params), *get_namespaces(**params)
+            )
+
         @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
+        async def wrapper(*args, **kwargs) -> Any:
             client = get_redis_client()
 
             # Skip cache if disabled or client unavailable
             if client is None:
-                return func(*args, **kwargs)
+                lookups["bypass"].inc()
+                return await query(args, kwargs)
 
             try:
-                # Build cache key
-                if key_builder:
-                    final_key = key_builder(*args, **kwargs)
-                else:
-                    final_key = cache_key
-
-                # Try to get from cache
-                cached_value = client.get(final_key)
+                final_key = await build_key(args, kwargs)
+            except redis.RedisError as e:
+                redis_breaker.record_failure(e)
+                lookups["error"].inc()
+                logger.warning(
+                    "cache_operation_failed",
+                    extra={"function": func.__name__, "error": str(e)},
+                )
+                return await query(args, kwargs)
+            except Exception as e:
+                # A key that cannot be built means the function is never cached
+                lookups["error"].inc()
+                logger.error(
+                    "cache_key_build_failed",
+                    extra={"function": func.__name__, "error": repr(e)},
+                    exc_info=True,
+                )
+                return await query(args, kwargs)
+
+            try:
+                if local_ttl:
+                    local_value = local_cache.get(final_key)
+                    if local_value is not _MISSING:
+                        _record("local", "hits")
+                        lookups["hit"].inc()
+                        return local_value
+                    _record("local", "misses")
+
+                # Try to get from cache (with the remaining TTL to detect stale values)
+                pipe = client.pipeline(transaction=False)
+                pipe.get(final_key)
+                pipe.pttl(final_key)
+                cached_value, remaining_ms = await _timed(
+                    redis_latency.labels("get"), pipe.execute()
+                )
+
                 if cached_value is not None:
-                    logger.debug(
-                        "cache_hit",
-                        extra={"key": final_key, "function": func.__name__},
-                    )
-                    return json.loads(cached_value)
+                    _record("redis", "hits")
+                    if stale_ttl and 0 <= remaining_ms < stale_ttl * 1000:
+                        lookups["stale"].inc()
+                        token = await _acquire_lock(client, final_key)
+                        if token is not None:
+                            task = asyncio.create_task(
+                                _refresh_in_background(
+                                    client,
+                                    func,
+                                    db_time,
+                                    final_key,
+                                    token,
+                                    ttl + stale_ttl,
+                                    args,
+                                    kwargs,
+                                )
+                            )
+                            _refresh_tasks.add(task)
+                            task.add_done_callback(_refresh_tasks.discard)
+                        logger.debug(
+                            "cache_stale_hit",
+                            extra={"key": final_key, "function": func.__name__},
+                        )
+                    else:
+                        lookups["hit"].inc()
+                        logger.debug(
+                            "cache_hit",
+                            extra={"key": final_key, "function": func.__name__},
+                        )
+                    return _decode(final_key, cached_value, local_ttl)
 
-                # Cache miss - call function
-                result = func(*args, **kwargs)
+                # Cache miss - only one request recomputes the key
+                _record("redis", "misses")
+                lookups["miss"].inc()
+                token = await _acquire_lock(client, final_key)
+                if token is None:
+                    cached_value = await _wait_for_value(client, final_key)
+                    if cached_value is not None:
+                        logger.debug(
+                            "cache_hit_after_wait",
+                            extra={"key": final_key, "function": func.__name__},
+                        )
+                        return _decode(final_key, cached_value, local_ttl)
 
-                # Store in cache
                 try:
-                    serialized = json.dumps(
-                        result,
-                        default=json_serializer,
-                        separators=(",", ":"),
-                    )
-                    client.setex(final_key, ttl, serialized)
-                    logger.debug(
-                        "cache_set",
-                        extra={"key": final_key, "ttl": ttl, "function": func.__name__},
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "cache_serialization_failed",
-                        extra={"function": func.__name__, "error": str(e)},
+                    result = await query(args, kwargs)
+                    serialized = await _store(
+                        client, final_key, result, ttl + stale_ttl, func.__name__
                     )
+                    if local_ttl and serialized is not None:
+                        # keep the decoded form locally, never ORM instances
+                        local_cache.set(final_key, orjson.loads(serialized), local_ttl)
+                finally:
+                    if token is not None:
+                        await _release_lock(client, final_key, token)
 
                 return result
 
             except Exception as e:
+                redis_breaker.record_failure(e)
+                lookups["error"].inc()
                 logger.warning(
                     "cache_operation_failed",
                     extra={"function": func.__name__, "error": str(e)},
                 )
                 # On error, bypass cache and call function directly
-                return func(*args, **kwargs)
+                return await query(args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+# Cached bodies are stored behind their ETag, computed once when stored
+_ETAG_SIZE = len(body_etag(b""))
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison, as per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _json_response(
+    request: Request, etag: str, body: bytes, ttl: int, hit: bool
+) -> Response:
+    """Build the JSON (or 304) response of a cached route body."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={min(ttl, HTTP_CACHE_MAX_AGE)}",
+        "X-Accel-Expires": str(min(ttl, PROXY_CACHE_MAX_AGE)),
+        "X-Cache": "HIT" if hit else "MISS",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class CachedRoute:
+    """
+    Body cache of a route decorated with cached_response.
+
+    Exposed as the route's cached_route attribute, so other entry points (the
+    batch endpoint) read and fill the very same cache entries.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        response_model: Any,
+        ttl: int,
+        namespaces: Callable[..., tuple[str, ...]],
+        local_ttl: int = 0,
+    ):
+        self.func = func
+        self.family = f"response:{func.__name__}"
+        self.adapter = TypeAdapter(response_model)
+        self.ttl = ttl
+        self.namespaces = namespaces
+        self.local_ttl = local_ttl
+
+    async def key(self, params: dict[str, Any]) -> str:
+        """Versioned cache key of the body for the given route parameters."""
+        params = {k: v for k, v in params.items() if k != "db"}
+        return await versioned_key(
+            call_key(self.family, params),
+            *self.namespaces(**params),
+        )
+
+    def render(self, result: Any) -> bytes:
+        """Validate a route result against the response model and encode it."""
+        return self.adapter.dump_json(
+            self.adapter.validate_python(result, from_attributes=True)
+        )
+
+
+async def get_cached_bodies(
+    client: redis.Redis, entries: list[tuple[CachedRoute, str]]
+) -> list[Optional[tuple[str, bytes]]]:
+    """
+    Look up several cached route bodies at once.
+
+    The in-process tier is checked first; the remaining keys are fetched with a
+    single MGET. Each lookup is counted as a hit or miss of its route's family.
+
+    Args:
+        client: Redis client
+        entries: (cached route, cache key) pairs
+
+    Returns:
+        (ETag, body) of each entry, None on a miss
+    """
+    bodies: list[Optional[tuple[str, bytes]]] = []
+    remote = []
+    for index, (route, key) in enumerate(entries):
+        body = local_cache.get(key) if route.local_ttl else _MISSING
+        if body is not _MISSING:
+            _record("local", "hits")
+            cache_lookups.labels(route.family, "hit").inc()
+            bodies.append(body)
+            continue
+        if route.local_ttl:
+            _record("local", "misses")
+        bodies.append(None)
+        remote.append(index)
+
+    if remote:
+        values = await _timed(
+            redis_latency.labels("mget"),
+            client.mget([entries[index][1] for index in remote]),
+        )
+        for index, value in zip(remote, values):
+            route, key = entries[index]
+            if value is None:
+                _record("redis", "misses")
+                cache_lookups.labels(route.family, "miss").inc()
+                continue
+            _record("redis", "hits")
+            cache_lookups.labels(route.family, "hit").inc()
+            body = value[:_ETAG_SIZE].decode(), value[_ETAG_SIZE:]
+            if route.local_ttl:
+                local_cache.set(key, body, route.local_ttl)
+            bodies[index] = body
+
+    return bodies
+
+
+async def store_bodies(
+    client: redis.Redis, entries: list[tuple[CachedRoute, str, str, bytes]]
+) -> None:
+    """
+    Store several computed route bodies, with their ETag, in a single pipeline.
+
+    Args:
+        client: Redis client
+        entries: (cached route, cache key, ETag, body) of each body
+    """
+    pipe = client.pipeline(transaction=False)
+    for route, key, etag, body in entries:
+        pipe.setex(key, route.ttl, etag.encode() + body)
+        if route.local_ttl:
+            local_cache.set(key, (etag, body), route.local_ttl)
+    await _timed(redis_latency.labels("set"), pipe.execute())
+
+
+def cached_response(
+    response_model: Any,
+    ttl: int,
+    namespaces: Callable[..., tuple[str, ...]],
+    local_ttl: int = 0,
+) -> Callable:
+    """
+    Decorator for caching the final JSON body of a route in Redis.
+
+    On a miss the route result is validated against response_model and encoded
+    once; hits return the stored bytes as a raw Response, skipping Pydantic
+    validation and FastAPI's re-serialization. Errors raised by the route (e.g.
+    404s) are never cached.
+
+    Every response carries a strong ETag of its body and a Cache-Control max-age
+    aligned with ttl (capped by HTTP_CACHE_MAX_AGE); a matching If-None-Match is
+    answered with 304. X-Accel-Expires lets the nginx micro-cache keep the body
+    for PROXY_CACHE_MAX_AGE seconds. X-Cache tells whether the body came from the cache (HIT)
+    or was computed (MISS).
+
+    Args:
+        response_model: Same model declared on the route (used on misses only)
+        ttl: Time to live in seconds
+        namespaces: Function of the route parameters returning the cache
+            namespaces the body depends on (see versioned_key)
+        local_ttl: Seconds the body may be served from the in-process tier
+
+    Returns:
+        Decorated route returning a JSON Response
+    """
+
+    def decorator(func: Callable) -> Callable:
+        route = CachedRoute(func, response_model, ttl, namespaces, local_ttl)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            request: Request = kwargs.pop("request")
+            client = get_redis_client()
+
+            final_key = None
+            if client is None:
+                cache_lookups.labels(route.family, "bypass").inc()
+            else:
+                try:
+                    final_key = await route.key(kwargs)
+                    cached = (await get_cached_bodies(client, [(route, final_key)]))[0]
+                    if cached is not None:
+                        return _json_response(request, *cached, ttl, hit=True)
+                except Exception as e:
+                    redis_breaker.record_failure(e)
+                    cache_lookups.labels(route.family, "error").inc()
+                    logger.warning(
+                        "cache_operation_failed",
+                        extra={"function": func.__name__, "error": str(e)},
+                    )
+                    final_key = None
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            body = route.render(result)
+            etag = body_etag(body)
+            if final_key is not None:
+                try:
+                    await store_bodies(client, [(route, final_key, etag, body)])
+                except Exception as e:
+                    redis_breaker.record_failure(e)
+                    logger.warning(
+                        "cache_operation_failed",
+                        extra={"function": func.__name__, "error": str(e)},
+                    )
+
+            return _json_response(request, etag, body, ttl, hit=False)
+
+        # Expose the request to FastAPI without adding it to the route itself
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    "request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+                ),
+            ]
+        )
+        wrapper.cached_route = route
 
         return wrapper
 
     return decorator
 
 
-def invalidate_cache(pattern: str = "*") -> None:
+async def invalidate_namespaces(*namespaces: str) -> None:
     """
-    Invalidate cache entries matching a pattern.
+    Invalidate every cache entry built with any of the given namespaces.
+
+    Each namespace is a single INCR on its generation counter, so the cost does
+    not depend on how many keys are stored.
 
     Args:
-        pattern: Redis key pattern to match (e.g., "team:*" or "*")
+        namespaces: Namespaces to invalidate (e.g., "match:list", "standings:<id>")
     """
     client = get_redis_client()
-    if client is None:
+    if client is None or not namespaces:
         return
 
     try:
-        keys = client.keys(pattern)
-        if keys:
-            client.delete(*keys)
-            logger.info(
-                "cache_invalidated",
-                extra={"pattern": pattern, "keys_deleted": len(keys)},
-            )
+        await get_generations(client, namespaces)
+        pipe = client.pipeline()
+        for namespace in namespaces:
+            pipe.incr(f"{GENERATION_KEY_PREFIX}{namespace}")
+        await pipe.execute()
+        local_cache.delete(*[f"gen:{namespace}" for namespace in namespaces])
+        logger.info("cache_invalidated", extra={"namespaces": list(namespaces)})
     except Exception as e:
+        redis_breaker.record_failure(e)
         logger.error(
             "cache_invalidation_failed",
-            extra={"pattern": pattern, "error": str(e)},
+            extra={"namespaces": list(namespaces), "error": str(e)},
         )
 
 
-def invalidate_entity_cache(entity_type: str, entity_id: Optional[UUID] = None) -> None:
+# Cache entries affected by each projection type rebuilt by the projections worker,
+# which invalidates them in Redis (mirrored in the competition API's
+# shared/cache/invalidation.py: keep both in sync).
+# "entity" is the (key bases, id argument, namespace) of the entries deleted per
+# rebuilt id (see call_key),
+# "scoped" the namespace bumped per id, "lists" are bumped whenever ids are
+# reported and "all" is used instead when the whole projection was rebuilt.
+PROJECTION_CACHE_KEYS: dict[str, dict] = {
+    "team": {
+        "entity": (("team", "response:get_team"), "team_id", "team"),
+        "lists": ["team:list"],
+        "all": ["team", "team:list"],
+    },
+    "athlete": {
+        "entity": (("student", "response:get_student"), "student_id", "student"),
+        "lists": ["student:list", "student:number"],
+        "all": ["student", "student:list", "student:number"],
+    },
+    "tournament": {
+        "entity": (
+            ("tournament", "response:get_tournament"),
+            "tournament_id",
+            "tournament",
+        ),
+        "lists": ["tournament:list"],
+        "all": ["tournament", "tournament:list"],
+    },
+    "match": {
+        "entity": (("match", "response:get_match"), "match_id", "match"),
+        "lists": ["match:list"],
+        "all": ["match", "match:list"],
+    },
+    "tournament_standing": {
+        "scoped": "standings:{id}",
+        "lists": ["standings:competitors"],
+        "all": ["standings"],
+    },
+    "general_ranking": {
+        "scoped": "ranking:general:{id}",
+        "lists": ["ranking:course"],
+        "all": ["ranking:general", "ranking:course"],
+    },
+    "modality_ranking": {
+        "scoped": "ranking:modality:{id}",
+        "lists": ["ranking:modality:course"],
+        "all": ["ranking:modality", "ranking:modality:course"],
+    },
+    "nucleo": {
+        "entity": (("nucleo", "response:get_nucleo"), "nucleo_id", "nucleo"),
+        "lists": ["nucleo:list"],
+        "all": ["nucleo", "nucleo:list"],
+    },
+    "season": {"all": ["season:list"]},
+    "regulation": {"all": ["regulation:list"]},
+    "home_page_config": {"all": ["home_page_config"]},
+    "course": {"all": ["course:list"]},
+}
+
+
+async def drop_local_projection_cache(
+    projection_type: str, ids: Optional[list[str]] = None
+) -> None:
     """
-    Invalidate cache for a specific entity type.
+    Drop this process' local copies of the cache entries of a rebuilt projection.
+
+    The projections worker invalidates the shared Redis tier itself (once, before
+    publishing the change); each process only has to forget its local mirror of
+    the bumped generations and its local entries of the rebuilt entities.
 
     Args:
-        entity_type: Type of entity (team, student, tournament, etc.)
-        entity_id: Optional specific entity ID (if not provided, clears entire entity type)
+        projection_type: Projection type reported by the projections worker
+        ids: Rebuilt projection ids (if not provided, drops every entry of the projection)
     """
-    if entity_id:
-        # Clear specific entity and related lists
-        invalidate_cache(f"{entity_type}:{entity_id}*")
-        invalidate_cache(f"{entity_type}:list:*")
+    families = PROJECTION_CACHE_KEYS.get(projection_type)
+    if families is None:
+        logger.warning(
+            "cache_invalidation_unknown_projection",
+            extra={"projection_type": projection_type},
+        )
+        return
+
+    if ids is None or ("entity" not in families and "scoped" not in families):
+        namespaces = families["all"]
     else:
-        # Clear entire entity type
-        invalidate_cache(f"{entity_type}:*")
+        namespaces = list(families["lists"])
+        if "scoped" in families:
+            namespaces += [families["scoped"].format(id=entity_id) for entity_id in ids]
+        if "entity" in families:
+            bases, argument, namespace = families["entity"]
+            local_cache.delete(
+                *await versioned_keys(
+                    [
+                        call_key(base, {argument: entity_id})
+                        for entity_id in ids
+                        for base in bases
+                    ],
+                    namespace,
+                )
+            )
+
+    local_cache.delete(*[f"gen:{namespace}" for namespace in namespaces])
+
+
+class CacheInvalidationListener:
+    """
+    Background subscriber for projection invalidation messages.
 
+    The projections worker publishes one message per processed update request
+    on CACHE_INVALIDATION_CHANNEL, e.g. {"projection_type": "match", "ids": [...]}.
+    Other messages carry an "action": "clear" is handled here, the rest by the
+    handlers registered with on_action (e.g. "warmup").
+    Runs as a task on the application's event loop.
 
-def get_cache_stats() -> dict:
+    The projections worker has already invalidated Redis when the message
+    arrives (and invalidates it again after the read replica's lag, when one is
+    used), so each process only drops its in-process tier.
+    """
+
+    MAX_BACKOFF = 30
+
+    def __init__(self, channel: str = CACHE_INVALIDATION_CHANNEL):
+        self.channel = channel
+        self._stop_event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._action_handlers: dict[str, Callable[[], None]] = {}
+
+    def on_action(self, action: str, handler: Callable[[], None]) -> None:
+        """Register the handler of an action message (e.g. {"action": "warmup"})."""
+        self._action_handlers[action] = handler
+
+    def start(self) -> None:
+        """Start listening in a background task (no-op if caching is disabled)."""
+        if not CACHE_ENABLED or self._task is not None:
+            return
+
+        # Bound to the running loop, so created here rather than at import
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._run(), name="cache-invalidation-listener"
+        )
+
+    async def stop(self) -> None:
+        """Stop the listener task."""
+        self._stop_event.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=5)
+            except asyncio.TimeoutError:
+                pass
+            self._task = None
+
+    async def _wait(self, seconds: float) -> None:
+        """Sleep unless the listener is stopped first."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        backoff = 1
+        while not self._stop_event.is_set():
+            client = get_redis_client()
+            if client is None:
+                await self._wait(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+                continue
+
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                logger.info(
+                    "cache_invalidation_subscribed", extra={"channel": self.channel}
+                )
+                backoff = 1
+                while not self._stop_event.is_set():
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        await self._handle_message(message)
+            except Exception as e:
+                redis_breaker.record_failure(e)
+                logger.error(
+                    "cache_invalidation_listener_failed",
+                    extra={"channel": self.channel, "error": str(e)},
+                )
+                await self._wait(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+            finally:
+                await pubsub.aclose()
+
+    async def _handle_message(self, message: dict) -> None:
+        try:
+            data = json.loads(message["data"])
+            action = data.get("action")
+            if action == "clear":
+                local_cache.clear()
+            elif action is not None:
+                self._action_handlers[action]()
+            else:
+                await drop_local_projection_cache(
+                    data["projection_type"], data.get("ids")
+                )
+        except Exception as e:
+            logger.warning(
+                "cache_invalidation_message_invalid",
+                extra={"error": str(e), "data": str(message.get("data"))},
+            )
+
+
+cache_invalidation_listener = CacheInvalidationListener()
+
+
+def get_tier_stats() -> dict:
+    """Get hit rates per cache tier for this process."""
+    tiers = {}
+    for tier, counters in _tier_stats.items():
+        lookups = counters["hits"] + counters["misses"]
+        tiers[tier] = {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else None,
+        }
+    tiers["local"]["entries"] = len(local_cache)
+    tiers["local"]["max_entries"] = local_cache.max_entries
+    return tiers
+
+
+async def get_cache_stats() -> dict:
     """Get cache statistics."""
+    if not CACHE_ENABLED:
+        return {"status": "disabled"}
+
     client = get_redis_client()
     if client is None:
-        return {"status": "disabled"}
+        # Circuit open: requests are served from the database
+        return {"status": "unavailable", "circuit": redis_breaker.stats()}
 
     try:
-        info = client.info()
+        info = await client.info()
         return {
             "status": "enabled",
             "memory_used": info.get("used_memory_human", "N/A"),
             "connected_clients": info.get("connected_clients", 0),
             "total_commands": info.get("total_commands_processed", 0),
+            "tiers": get_tier_stats(),
+            "circuit": redis_breaker.stats(),
         }
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        redis_breaker.record_failure(e)
+        return {"status": "error", "error": str(e), "circuit": redis_breaker.stats()}
@@ -9,10 +9,15 @@ import datetime
 from typing import Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-
-from .cache import CACHE_TTL, CacheKeyGenerator, cached
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .cache import (
+    CACHE_STALE_TTL,
+    CACHE_TTL,
+    LOCAL_CACHE_TTL,
+    cached,
+)
 from .models import (
     CourseDetailView,
     GeneralRankingView,
@@ -27,19 +32,38 @@ from .models import (
     TournamentDetailView,
     TournamentStandingsView,
 )
+from .pagination import paginate_keyset
+
+# ==================== Helpers ====================
+
+
+async def _all(db: AsyncSession, stmt: Select) -> list:
+    """Run a statement and return every row as a model instance."""
+    return list((await db.scalars(stmt)).all())
+
+
+async def _first(db: AsyncSession, stmt: Select):
+    """Run a statement and return its first row, or None."""
+    return (await db.scalars(stmt.limit(1))).first()
+
+
+async def _count(db: AsyncSession, stmt: Select) -> int:
+    """Count the rows of a filtered statement."""
+    return await db.scalar(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    )
+
 
 # ==================== Nucleo Operations ====================
 
 
 @cached(
-    cache_key="",
+    "nucleo:list",
     ttl=CACHE_TTL["nucleo_list"],
-    key_builder=lambda db, skip=0, limit=100: CacheKeyGenerator.nucleo_list(
-        skip, limit
-    ),
+    local_ttl=LOCAL_CACHE_TTL["nucleo_list"],
 )
-def get_nucleos(
-    db: Session,
+async def get_nucleos(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
 ) -> tuple[list[NucleoDetailView], int]:
@@ -49,49 +73,96 @@ def get_nucleos(
     Returns:
         Tuple of (list of nucleos, total count)
     """
-    query = db.query(NucleoDetailView).order_by(NucleoDetailView.name)
-    total = query.count()
-    return query.offset(skip).limit(limit).all(), total
+    stmt = select(NucleoDetailView).order_by(NucleoDetailView.name)
+    total = await count_nucleos(db)
+    return await _all(db, stmt.offset(skip).limit(limit)), total
 
 
+# Totals are cached apart from the pages (and invalidated with the same
+# namespaces), once per filter set: paging through a list runs a single COUNT
 @cached(
-    cache_key="",
+    "nucleo:list:count",
+    ttl=CACHE_TTL["nucleo_list"],
+    namespaces=lambda **_: ("nucleo:list",),
+)
+async def count_nucleos(db: AsyncSession) -> int:
+    """Total of the nucleo list, shared by all of its pages."""
+    return await _count(db, select(NucleoDetailView))
+
+
+@cached(
+    "nucleo",
     ttl=CACHE_TTL["nucleo"],
-    key_builder=lambda db, nucleo_id: CacheKeyGenerator.nucleo(nucleo_id),
+    local_ttl=LOCAL_CACHE_TTL["nucleo"],
 )
-def get_nucleo_by_id(db: Session, nucleo_id: UUID) -> Optional[NucleoDetailView]:
+async def get_nucleo_by_id(
+    db: AsyncSession, nucleo_id: UUID
+) -> Optional[NucleoDetailView]:
     """
     Get a specific nucleo by ID.
 
     Returns:
         Nucleo or None if not found
     """
-    return (
-        db.query(NucleoDetailView)
-        .filter(NucleoDetailView.nucleo_id == nucleo_id)
-        .first()
+    return await _first(
+        db, select(NucleoDetailView).where(NucleoDetailView.nucleo_id == nucleo_id)
     )
 
 
 # ==================== Team Detail View Operations ====================
 
 
+# Sort key of the list, backed by a composite index on the projection table
+TEAM_KEYSET = (TeamDetailView.team_name, TeamDetailView.team_id)
+
+
+def _teams_stmt(
+    course_id: Optional[UUID],
+    nucleo_id: Optional[UUID],
+    modality_id: Optional[UUID],
+    season_id: Optional[int],
+) -> Select:
+    """Filtered (unordered) team list."""
+    stmt = select(TeamDetailView)
+    if course_id:
+        stmt = stmt.where(TeamDetailView.course_id == course_id)
+    if nucleo_id:
+        stmt = stmt.where(TeamDetailView.nucleo_id == nucleo_id)
+    if modality_id:
+        stmt = stmt.where(TeamDetailView.modality_id == modality_id)
+    if season_id:
+        stmt = stmt.where(TeamDetailView.team_season_id == season_id)
+    return stmt
+
+
 @cached(
-    cache_key="",
+    "team:list:count",
     ttl=CACHE_TTL["team_list"],
-    key_builder=lambda db, skip=0, limit=100, course_id=None, nucleo_id=None, modality_id=None, season_id=None: CacheKeyGenerator.team_list(
-        skip, limit, course_id, nucleo_id, modality_id, season_id
-    ),
+    namespaces=lambda **_: ("team:list",),
 )
-def get_teams(
-    db: Session,
+async def count_teams(
+    db: AsyncSession,
+    course_id: Optional[UUID] = None,
+    nucleo_id: Optional[UUID] = None,
+    modality_id: Optional[UUID] = None,
+    season_id: Optional[int] = None,
+) -> int:
+    """Total of a filtered team list, shared by all of its pages."""
+    return await _count(db, _teams_stmt(course_id, nucleo_id, modality_id, season_id))
+
+
+@cached("team:list", ttl=CACHE_TTL["team_list"])
+async def get_teams(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     course_id: Optional[UUID] = None,
     nucleo_id: Optional[UUID] = None,
     modality_id: Optional[UUID] = None,
     season_id: Optional[int] = None,
-) -> tuple[list[TeamDetailView], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[TeamDetailView], Optional[int]]:
     """
     Get list of teams with pagination and optional filters.
 
@@ -103,36 +174,33 @@ def get_teams(
         nucleo_id: Filter by nucleo ID
         modality_id: Filter by modality ID
         season_id: Filter by season ID
+        cursor: Keyset cursor ("" for the first page); when given, skip is
+            ignored and no total is counted
+        include_total: Whether to count the total (None when False)
     Returns:
-        Tuple of (list of teams, total count)
+        Tuple of (list of teams, total count or None)
     """
-    query = db.query(TeamDetailView)
+    stmt = _teams_stmt(course_id, nucleo_id, modality_id, season_id)
 
-    # Apply filters
-    if course_id:
-        query = query.filter(TeamDetailView.course_id == course_id)
-    if nucleo_id:
-        query = query.filter(TeamDetailView.nucleo_id == nucleo_id)
-    if modality_id:
-        query = query.filter(TeamDetailView.modality_id == modality_id)
-    if season_id:
-        query = query.filter(TeamDetailView.team_season_id == season_id)
+    if cursor is not None:
+        teams = await _all(db, paginate_keyset(stmt, TEAM_KEYSET, cursor, limit))
+        return teams, None
 
-    # Get total count
-    total = query.count()
+    # Count once per filter set, shared by every page of the list
+    total = (
+        await count_teams(db, course_id, nucleo_id, modality_id, season_id)
+        if include_total
+        else None
+    )
 
-    # Apply pagination
-    teams = query.offset(skip).limit(limit).all()
+    # Apply pagination, ordered by the keyset so both modes page identically
+    teams = await _all(db, stmt.order_by(*TEAM_KEYSET).offset(skip).limit(limit))
 
     return teams, total
 
 
-@cached(
-    cache_key="",
-    ttl=CACHE_TTL["team"],
-    key_builder=lambda db, team_id: CacheKeyGenerator.team(team_id),
-)
-def get_team_by_id(db: Session, team_id: UUID) -> Optional[TeamDetailView]:
+@cached("team", ttl=CACHE_TTL["team"])
+async def get_team_by_id(db: AsyncSession, team_id: UUID) -> Optional[TeamDetailView]:
     """
     Get a specific team by ID.
 
@@ -143,28 +211,71 @@ def get_team_by_id(db: Session, team_id: UUID) -> Optional[TeamDetailView]:
     Returns:
         Team detail or None if not found
     """
-    return db.query(TeamDetailView).filter(TeamDetailView.team_id == team_id).first()
+    return await _first(
+        db, select(TeamDetailView).where(TeamDetailView.team_id == team_id)
+    )
 
 
 # ==================== Student Detail View Operations ====================
 
 
+# Sort key of the list, backed by a composite index on the projection table
+STUDENT_KEYSET = (StudentDetailView.full_name, StudentDetailView.student_id)
+
+
+def _students_stmt(
+    course_id: Optional[UUID],
+    nucleo_id: Optional[UUID],
+    is_member: Optional[bool],
+    search: Optional[str],
+) -> Select:
+    """Filtered (unordered) student list."""
+    stmt = select(StudentDetailView)
+    if course_id:
+        stmt = stmt.where(StudentDetailView.course_id == course_id)
+    if nucleo_id:
+        stmt = stmt.where(StudentDetailView.nucleo_id == nucleo_id)
+    if is_member is not None:
+        stmt = stmt.where(StudentDetailView.is_member == is_member)
+    if search:
+        search_pattern = f"%{search}%"
+        stmt = stmt.where(
+            or_(
+                StudentDetailView.full_name.ilike(search_pattern),
+                StudentDetailView.student_number.ilike(search_pattern),
+            )
+        )
+    return stmt
+
+
 @cached(
-    cache_key="",
+    "student:list:count",
     ttl=CACHE_TTL["student_list"],
-    key_builder=lambda db, skip=0, limit=100, course_id=None, nucleo_id=None, is_member=None, search=None: CacheKeyGenerator.student_list(
-        skip, limit, course_id, nucleo_id, is_member, search
-    ),
+    namespaces=lambda **_: ("student:list",),
 )
-def get_students(
-    db: Session,
+async def count_students(
+    db: AsyncSession,
+    course_id: Optional[UUID] = None,
+    nucleo_id: Optional[UUID] = None,
+    is_member: Optional[bool] = None,
+    search: Optional[str] = None,
+) -> int:
+    """Total of a filtered student list, shared by all of its pages."""
+    return await _count(db, _students_stmt(course_id, nucleo_id, is_member, search))
+
+
+@cached("student:list", ttl=CACHE_TTL["student_list"])
+async def get_students(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     course_id: Optional[UUID] = None,
     nucleo_id: Optional[UUID] = None,
     is_member: Optional[bool] = None,
     search: Optional[str] = None,
-) -> tuple[list[StudentDetailView], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[StudentDetailView], Optional[int]]:
     """
     Get list of students with pagination and optional filters.
 
@@ -176,43 +287,36 @@ def get_students(
         nucleo_id: Filter by nucleo ID
         is_member: Filter by membership status
         search: Search in student name or number
+        cursor: Keyset cursor ("" for the first page); when given, skip is
+            ignored and no total is counted
+        include_total: Whether to count the total (None when False)
 
     Returns:
-        Tuple of (list of students, total count)
+        Tuple of (list of students, total count or None)
     """
-    query = db.query(StudentDetailView)
+    stmt = _students_stmt(course_id, nucleo_id, is_member, search)
 
-    # Apply filters
-    if course_id:
-        query = query.filter(StudentDetailView.course_id == course_id)
-    if nucleo_id:
-        query = query.filter(StudentDetailView.nucleo_id == nucleo_id)
-    if is_member is not None:
-        query = query.filter(StudentDetailView.is_member == is_member)
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                StudentDetailView.full_name.ilike(search_pattern),
-                StudentDetailView.student_number.ilike(search_pattern),
-            )
-        )
+    if cursor is not None:
+        students = await _all(db, paginate_keyset(stmt, STUDENT_KEYSET, cursor, limit))
+        return students, None
 
-    # Get total count
-    total = query.count()
+    # Count once per filter set, shared by every page of the list
+    total = (
+        await count_students(db, course_id, nucleo_id, is_member, search)
+        if include_total
+        else None
+    )
 
-    # Apply pagination
-    students = query.offset(skip).limit(limit).all()
+    # Apply pagination, ordered by the keyset so both modes page identically
+    students = await _all(db, stmt.order_by(*STUDENT_KEYSET).offset(skip).limit(limit))
 
     return students, total
 
 
-@cached(
-    cache_key="",
-    ttl=CACHE_TTL["student"],
-    key_builder=lambda db, student_id: CacheKeyGenerator.student(student_id),
-)
-def get_student_by_id(db: Session, student_id: UUID) -> Optional[StudentDetailView]:
+@cached("student", ttl=CACHE_TTL["student"])
+async def get_student_by_id(
+    db: AsyncSession, student_id: UUID
+) -> Optional[StudentDetailView]:
     """
     Get a specific student by ID.
 
@@ -223,22 +327,14 @@ def get_student_by_id(db: Session, student_id: UUID) -> Optional[StudentDetailVi
     Returns:
         Student detail or None if not found
     """
-    return (
-        db.query(StudentDetailView)
-        .filter(StudentDetailView.student_id == student_id)
-        .first()
+    return await _first(
+        db, select(StudentDetailView).where(StudentDetailView.student_id == student_id)
     )
 
 
-@cached(
-    cache_key="",
-    ttl=CACHE_TTL["student"],
-    key_builder=lambda db, student_number: CacheKeyGenerator.student_by_number(
-        student_number
-    ),
-)
-def get_student_by_number(
-    db: Session, student_number: str
+@cached("student:number", ttl=CACHE_TTL["student"])
+async def get_student_by_number(
+    db: AsyncSession, student_number: str
 ) -> Optional[StudentDetailView]:
     """
     Get a specific student by student number.
@@ -250,31 +346,71 @@ def get_student_by_number(
     Returns:
         Student detail or None if not found
     """
-    return (
-        db.query(StudentDetailView)
-        .filter(StudentDetailView.student_number == student_number)
-        .first()
+    return await _first(
+        db,
+        select(StudentDetailView).where(
+            StudentDetailView.student_number == student_number
+        ),
     )
 
 
 # ==================== Tournament Detail View Operations ====================
 
 
+# Sort key of the list, backed by a composite index on the projection table
+TOURNAMENT_KEYSET = (
+    TournamentDetailView.start_date,
+    TournamentDetailView.tournament_id,
+)
+
+
+def _tournaments_stmt(
+    modality_id: Optional[UUID], status: Optional[str], season_id: Optional[int]
+) -> Select:
+    """Filtered (unordered) tournament list."""
+    stmt = select(TournamentDetailView)
+    if modality_id:
+        stmt = stmt.where(TournamentDetailView.modality_id == modality_id)
+    if status:
+        stmt = stmt.where(TournamentDetailView.status == status)
+    else:
+        # Never expose draft tournaments on the public API
+        stmt = stmt.where(TournamentDetailView.status != "draft")
+    if season_id:
+        stmt = stmt.where(TournamentDetailView.tournament_season_id == season_id)
+    return stmt
+
+
 @cached(
-    cache_key="",
+    "tournament:list:count",
     ttl=CACHE_TTL["tournament_list"],
-    key_builder=lambda db, skip=0, limit=100, modality_id=None, status=None, season_id=None: CacheKeyGenerator.tournament_list(
-        skip, limit, modality_id, status, season_id
-    ),
+    namespaces=lambda **_: ("tournament:list",),
+)
+async def count_tournaments(
+    db: AsyncSession,
+    modality_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    season_id: Optional[int] = None,
+) -> int:
+    """Total of a filtered tournament list, shared by all of its pages."""
+    return await _count(db, _tournaments_stmt(modality_id, status, season_id))
+
+
+@cached(
+    "tournament:list",
+    ttl=CACHE_TTL["tournament_list"],
+    stale_ttl=CACHE_STALE_TTL["tournament_list"],
 )
-def get_tournaments(
-    db: Session,
+async def get_tournaments(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     modality_id: Optional[UUID] = None,
     status: Optional[str] = None,
     season_id: Optional[int] = None,
-) -> tuple[list[TournamentDetailView], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[TournamentDetailView], Optional[int]]:
     """
     Get list of tournaments with pagination and optional filters.
 
@@ -285,43 +421,42 @@ def get_tournaments(
         modality_id: Filter by modality ID
         status: Filter by tournament status
         season_id: Filter by season ID
+        cursor: Keyset cursor ("" for the first page); when given, skip is
+            ignored and no total is counted
+        include_total: Whether to count the total (None when False)
     Returns:
-        Tuple of (list of tournaments, total count)
+        Tuple of (list of tournaments, total count or None)
     """
-    query = db.query(TournamentDetailView)
+    stmt = _tournaments_stmt(modality_id, status, season_id)
 
-    # Apply filters
-    if modality_id:
-        query = query.filter(TournamentDetailView.modality_id == modality_id)
-    if status:
-        query = query.filter(TournamentDetailView.status == status)
-    else:
-        # Never expose draft tournaments on the public API
-        query = query.filter(TournamentDetailView.status != "draft")
-    if season_id:
-        query = query.filter(TournamentDetailView.tournament_season_id == season_id)
+    if cursor is not None:
+        tournaments = await _all(
+            db,
+            paginate_keyset(stmt, TOURNAMENT_KEYSET, cursor, limit, descending=True),
+        )
+        return tournaments, None
 
-    # Get total count
-    total = query.count()
+    # Count once per filter set, shared by every page of the list
+    total = (
+        await count_tournaments(db, modality_id, status, season_id)
+        if include_total
+        else None
+    )
 
-    # Apply pagination and order by start date descending
-    tournaments = (
-        query.order_by(TournamentDetailView.start_date.desc())
+    # Apply pagination, ordered by the keyset so both modes page identically
+    tournaments = await _all(
+        db,
+        stmt.order_by(*(column.desc() for column in TOURNAMENT_KEYSET))
         .offset(skip)
-        .limit(limit)
-        .all()
+        .limit(limit),
     )
 
     return tournaments, total
 
 
-@cached(
-    cache_key="",
-    ttl=CACHE_TTL["tournament"],
-    key_builder=lambda db, tournament_id: CacheKeyGenerator.tournament(tournament_id),
-)
-def get_tournament_by_id(
-    db: Session, tournament_id: UUID
+@cached("tournament", ttl=CACHE_TTL["tournament"])
+async def get_tournament_by_id(
+    db: AsyncSession, tournament_id: UUID
 ) -> Optional[TournamentDetailView]:
     """
     Get a specific tournament by ID.
@@ -333,25 +468,80 @@ def get_tournament_by_id(
     Returns:
         Tournament detail or None if not found
     """
-    return (
-        db.query(TournamentDetailView)
-        .filter(TournamentDetailView.tournament_id == tournament_id)
-        .first()
+    return await _first(
+        db,
+        select(TournamentDetailView).where(
+            TournamentDetailView.tournament_id == tournament_id
+        ),
     )
 
 
 # ==================== Match Detail View Operations ====================
 
 
+# Sort key of the list, backed by a composite index on the projection table
+MATCH_KEYSET = (MatchDetailView.start_time, MatchDetailView.match_id)
+
+
+def _matches_stmt(
+    tournament_id: Optional[UUID],
+    status: Optional[str],
+    date: Optional[str],
+    course_id: Optional[UUID],
+    nucleo_id: Optional[UUID],
+) -> Select:
+    """Filtered (unordered) match list."""
+    stmt = select(MatchDetailView).where(
+        MatchDetailView.status != "draft",
+        MatchDetailView.start_time != None,  # noqa: E711
+    )
+    if tournament_id:
+        stmt = stmt.where(MatchDetailView.tournament_id == tournament_id)
+    if status:
+        stmt = stmt.where(MatchDetailView.status == status)
+    if date:
+        try:
+            date_obj = datetime.datetime.strptime(date, "%Y-%m")
+            stmt = stmt.where(
+                MatchDetailView.start_time >= date_obj,
+                MatchDetailView.start_time < (date_obj + datetime.timedelta(days=31)),
+            )
+        except ValueError:
+            # Invalid date format, ignore the filter
+            pass
+    if course_id:
+        stmt = stmt.where(MatchDetailView.courses_ids.any(str(course_id)))
+    if nucleo_id:
+        stmt = stmt.where(MatchDetailView.nucleos_ids.any(str(nucleo_id)))
+    return stmt
+
+
 @cached(
-    cache_key="",
+    "match:list:count",
     ttl=CACHE_TTL["match_list"],
-    key_builder=lambda db, skip=0, limit=100, tournament_id=None, status=None, date=None: CacheKeyGenerator.match_list(
-        skip, limit, tournament_id, status, date
-    ),
+    namespaces=lambda **_: ("match:list",),
+)
+async def count_matches(
+    db: AsyncSession,
+    tournament_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    date: Optional[str] = None,
+    course_id: Optional[UUID] = None,
+    nucleo_id: Optional[UUID] = None,
+) -> int:
+    """Total of a filtered match list, shared by all of its pages."""
+    return await _count(
+        db, _matches_stmt(tournament_id, status, date, course_id, nucleo_id)
+    )
+
+
+@cached(
+    "match:list",
+    ttl=CACHE_TTL["match_list"],
+    stale_ttl=CACHE_STALE_TTL["match_list"],
 )
-def get_matches(
-    db: Session,
+async def get_matches(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     tournament_id: Optional[UUID] = None,
@@ -359,7 +549,9 @@ def get_matches(
     date: Optional[str] = None,
     course_id: Optional[UUID] = None,
     nucleo_id: Optional[UUID] = None,
-) -> tuple[list[MatchDetailView], int]:
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> tuple[list[MatchDetailView], Optional[int]]:
     """
     Get list of matches with pagination and optional filters.
 
@@ -372,54 +564,42 @@ def get_matches(
         date: Filter by scheduled date (YYYY-MM)
         course_id: Filter by course ID
         nucleo_id: Filter by nucleo ID
+        cursor: Keyset cursor ("" for the first page); when given, skip is
+            ignored and no total is counted
+        include_total: Whether to count the total (None when False)
     Returns:
-        Tuple of (list of matches, total count)
+        Tuple of (list of matches, total count or None)
     """
-    query = db.query(MatchDetailView).filter(
-        MatchDetailView.status != "draft",
-        MatchDetailView.start_time != None,  # noqa: E711
-    )
+    stmt = _matches_stmt(tournament_id, status, date, course_id, nucleo_id)
 
-    # Apply filters
-    if tournament_id:
-        query = query.filter(MatchDetailView.tournament_id == tournament_id)
-    if status:
-        query = query.filter(MatchDetailView.status == status)
-    if date:
-        try:
-            date_obj = datetime.datetime.strptime(date, "%Y-%m")
-            query = query.filter(
-                MatchDetailView.start_time >= date_obj,
-                MatchDetailView.start_time < (date_obj + datetime.timedelta(days=31)),
-            )
-        except ValueError:
-            # Invalid date format, ignore the filter
-            pass
-    if course_id:
-        query = query.filter(MatchDetailView.courses_ids.any(str(course_id)))
-    if nucleo_id:
-        query = query.filter(MatchDetailView.nucleos_ids.any(str(nucleo_id)))
+    if cursor is not None:
+        matches = await _all(
+            db, paginate_keyset(stmt, MATCH_KEYSET, cursor, limit, descending=True)
+        )
+        return matches, None
 
-    # Get total count
-    total = query.count()
+    # Count once per filter set, shared by every page of the list
+    total = (
+        await count_matches(db, tournament_id, status, date, course_id, nucleo_id)
+        if include_total
+        else None
+    )
 
-    # Apply pagination and order by start time descending
-    matches = (
-        query.order_by(MatchDetailView.start_time.desc())
+    # Apply pagination, ordered by the keyset so both modes page identically
+    matches = await _all(
+        db,
+        stmt.order_by(*(column.desc() for column in MATCH_KEYSET))
         .offset(skip)
-        .limit(limit)
-        .all()
+        .limit(limit),
     )
 
     return matches, total
 
 
-@cached(
-    cache_key="",
-    ttl=CACHE_TTL["match"],
-    key_builder=lambda db, match_id: CacheKeyGenerator.match(match_id),
-)
-def get_match_by_id(db: Session, match_id: UUID) -> Optional[MatchDetailView]:
+@cached("match", ttl=CACHE_TTL["match"])
+async def get_match_by_id(
+    db: AsyncSession, match_id: UUID
+) -> Optional[MatchDetailView]:
     """
     Get a specific match by ID.
 
@@ -430,8 +610,8 @@ def get_match_by_id(db: Session, match_id: UUID) -> Optional[MatchDetailView]:
     Returns:
         Match detail or None if not found
     """
-    return (
-        db.query(MatchDetailView).filter(MatchDetailView.match_id == match_id).first()
+    return await _first(
+        db, select(MatchDetailView).where(MatchDetailView.match_id == match_id)
     )
 
 
@@ -439,12 +619,13 @@ def get_match_by_id(db: Session, match_id: UUID) -> Optional[MatchDetailView]:
 
 
 @cached(
-    cache_key="",
+    "standings",
     ttl=CACHE_TTL["ranking"],
-    key_builder=lambda db, tournament_id, skip=0, limit=100: f"standings:{tournament_id}:{skip}:{limit}",
+    namespaces=lambda tournament_id, **_: ("standings", f"standings:{tournament_id}"),
+    stale_ttl=CACHE_STALE_TTL["ranking"],
 )
-def get_tournament_standings(
-    db: Session,
+async def get_tournament_standings(
+    db: AsyncSession,
     tournament_id: UUID,
     skip: int = 0,
     limit: int = 100,
@@ -461,26 +642,47 @@ def get_tournament_standings(
     Returns:
         Tuple of (list of standings, total count)
     """
-    query = db.query(TournamentStandingsView).filter(
+    stmt = select(TournamentStandingsView).where(
         TournamentStandingsView.tournament_id == tournament_id
     )
 
-    # Get total count
-    total = query.count()
+    # Count once per tournament, shared by every page of the standings
+    total = await count_tournament_standings(db, tournament_id)
 
     # Apply pagination and order by rank
-    standings = (
-        query.order_by(TournamentStandingsView.position.asc().nullslast())
+    standings = await _all(
+        db,
+        stmt.order_by(TournamentStandingsView.position.asc().nullslast())
         .offset(skip)
-        .limit(limit)
-        .all()
+        .limit(limit),
     )
 
     return standings, total
 
 
-def get_standings_by_competitor(
-    db: Session, competitor_entity_id: UUID
+@cached(
+    "standings:count",
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda tournament_id, **_: ("standings", f"standings:{tournament_id}"),
+)
+async def count_tournament_standings(db: AsyncSession, tournament_id: UUID) -> int:
+    """Total of the standings of a tournament, shared by all of their pages."""
+    return await _count(
+        db,
+        select(TournamentStandingsView).where(
+            TournamentStandingsView.tournament_id == tournament_id
+        ),
+    )
+
+
+@cached(
+    "standings:competitors",
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda **_: ("standings", "standings:competitors"),
+    stale_ttl=CACHE_STALE_TTL["ranking"],
+)
+async def get_standings_by_competitor(
+    db: AsyncSession, competitor_entity_id: UUID
 ) -> list[TournamentStandingsView]:
     """
     Get all standings for a specific competitor across tournaments.
@@ -492,10 +694,11 @@ def get_standings_by_competitor(
     Returns:
         List of standings for the competitor
     """
-    return (
-        db.query(TournamentStandingsView)
-        .filter(TournamentStandingsView.competitor_entity_id == competitor_entity_id)
-        .all()
+    return await _all(
+        db,
+        select(TournamentStandingsView).where(
+            TournamentStandingsView.competitor_entity_id == competitor_entity_id
+        ),
     )
 
 
@@ -503,12 +706,16 @@ def get_standings_by_competitor(
 
 
 @cached(
-    cache_key="",
+    "ranking:general",
     ttl=CACHE_TTL["ranking"],
-    key_builder=lambda db, season_id, nucleo_id=None: f"ranking:general:{season_id}:{nucleo_id}",
+    namespaces=lambda season_id, **_: (
+        "ranking:general",
+        f"ranking:general:{season_id}",
+    ),
+    stale_ttl=CACHE_STALE_TTL["ranking"],
 )
-def get_general_ranking(
-    db: Session,
+async def get_general_ranking(
+    db: AsyncSession,
     season_id: int,
     nucleo_id: Optional[UUID] = None,
 ) -> tuple[list[GeneralRankingView], int]:
@@ -523,35 +730,32 @@ def get_general_ranking(
     Returns:
         Tuple of (list of rankings, total count)
     """
-    query = db.query(GeneralRankingView).filter(
-        GeneralRankingView.season_id == season_id
-    )
+    stmt = select(GeneralRankingView).where(GeneralRankingView.season_id == season_id)
 
     # Apply filters
     if nucleo_id:
-        query = query.filter(GeneralRankingView.nucleo_id == nucleo_id)
+        stmt = stmt.where(GeneralRankingView.nucleo_id == nucleo_id)
 
     # Order by rank (nulls last) and points descending
-    query = query.order_by(
+    stmt = stmt.order_by(
         GeneralRankingView.rank.asc().nullslast(),
         GeneralRankingView.points.desc(),
     )
 
-    # Get total count
-    total = query.count()
+    # Get all rankings (the list is unpaginated, so its length is the total)
+    rankings = await _all(db, stmt)
 
-    # Get all rankings
-    rankings = query.all()
-
-    return rankings, total
+    return rankings, len(rankings)
 
 
 @cached(
-    cache_key="",
+    "ranking:course",
     ttl=CACHE_TTL["ranking"],
-    key_builder=lambda db, course_id: f"ranking:course:{course_id}",
+    stale_ttl=CACHE_STALE_TTL["ranking"],
 )
-def get_course_ranking(db: Session, course_id: UUID) -> Optional[GeneralRankingView]:
+async def get_course_ranking(
+    db: AsyncSession, course_id: UUID
+) -> Optional[GeneralRankingView]:
     """
     Get ranking information for a specific course.
 
@@ -562,10 +766,8 @@ def get_course_ranking(db: Session, course_id: UUID) -> Optional[GeneralRankingV
     Returns:
         Ranking information or None if not found
     """
-    return (
-        db.query(GeneralRankingView)
-        .filter(GeneralRankingView.course_id == course_id)
-        .first()
+    return await _first(
+        db, select(GeneralRankingView).where(GeneralRankingView.course_id == course_id)
     )
 
 
@@ -573,12 +775,12 @@ def get_course_ranking(db: Session, course_id: UUID) -> Optional[GeneralRankingV
 
 
 @cached(
-    cache_key="",
+    "regulation:list",
     ttl=CACHE_TTL["regulation"],
-    key_builder=lambda db, search=None, season_id=None: f"regulation:list:{search}:{season_id}",
+    local_ttl=LOCAL_CACHE_TTL["regulation"],
 )
-def get_regulations(
-    db: Session,
+async def get_regulations(
+    db: AsyncSession,
     search: Optional[str] = None,
     season_id: Optional[int] = None,
 ) -> list[RegulationDetailView]:
@@ -592,33 +794,37 @@ def get_regulations(
     Returns:
         List of regulations ordered by creation date (newest first)
     """
-    query = db.query(RegulationDetailView)
+    stmt = select(RegulationDetailView)
 
     if season_id:
-        query = query.filter(RegulationDetailView.season_id == season_id)
+        stmt = stmt.where(RegulationDetailView.season_id == season_id)
 
     if search:
         term = f"%{search}%"
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 RegulationDetailView.title.ilike(term),
                 RegulationDetailView.description.ilike(term),
             )
         )
 
-    return query.all()
+    return await _all(db, stmt)
 
 
 # ==================== Modality Ranking View Operations ====================
 
 
 @cached(
-    cache_key="",
+    "ranking:modality",
     ttl=CACHE_TTL["ranking"],
-    key_builder=lambda db, season_id, modality_id=None, nucleo_id=None: f"ranking:modality:{season_id}:{modality_id}:{nucleo_id}",
+    namespaces=lambda season_id, **_: (
+        "ranking:modality",
+        f"ranking:modality:{season_id}",
+    ),
+    stale_ttl=CACHE_STALE_TTL["ranking"],
 )
-def get_modality_ranking(
-    db: Session,
+async def get_modality_ranking(
+    db: AsyncSession,
     season_id: int,
     modality_id: Optional[UUID] = None,
     nucleo_id: Optional[UUID] = None,
@@ -636,39 +842,34 @@ def get_modality_ranking(
     Returns:
         Tuple of (list of rankings, total count)
     """
-    query = db.query(ModalityRankingView).filter(
-        ModalityRankingView.season_id == season_id
-    )
+    stmt = select(ModalityRankingView).where(ModalityRankingView.season_id == season_id)
 
     # Apply filters
     if modality_id:
-        query = query.filter(ModalityRankingView.modality_id == modality_id)
+        stmt = stmt.where(ModalityRankingView.modality_id == modality_id)
     if nucleo_id:
-        query = query.filter(ModalityRankingView.nucleo_id == nucleo_id)
+        stmt = stmt.where(ModalityRankingView.nucleo_id == nucleo_id)
 
     # Order by modality, then rank (nulls last) and points
-    query = query.order_by(
+    stmt = stmt.order_by(
         ModalityRankingView.modality_id,
         ModalityRankingView.rank.asc().nullslast(),
         ModalityRankingView.points.desc(),
     )
 
-    # Get total count
-    total = query.count()
+    # Get all rankings (the list is unpaginated, so its length is the total)
+    rankings = await _all(db, stmt)
 
-    # Get all rankings
-    rankings = query.all()
-
-    return rankings, total
+    return rankings, len(rankings)
 
 
 @cached(
-    cache_key="",
+    "ranking:modality:course",
     ttl=CACHE_TTL["ranking"],
-    key_builder=lambda db, course_id: f"ranking:modality:course:{course_id}",
+    stale_ttl=CACHE_STALE_TTL["ranking"],
 )
-def get_course_modality_rankings(
-    db: Session,
+async def get_course_modality_rankings(
+    db: AsyncSession,
     course_id: UUID,
 ) -> list[ModalityRankingView]:
     """Get modality-specific rankings for a given course.
@@ -680,14 +881,14 @@ def get_course_modality_rankings(
     Returns:
         List of rankings for the course across modalities (may be empty)
     """
-    return (
-        db.query(ModalityRankingView)
-        .filter(ModalityRankingView.course_id == course_id)
+    return await _all(
+        db,
+        select(ModalityRankingView)
+        .where(ModalityRankingView.course_id == course_id)
         .order_by(
             ModalityRankingView.modality_name.asc().nullslast(),
             ModalityRankingView.rank.asc().nullslast(),
-        )
-        .all()
+        ),
     )
 
 
@@ -695,38 +896,39 @@ def get_course_modality_rankings(
 
 
 @cached(
-    cache_key="",
+    "season:list",
     ttl=CACHE_TTL["season"],
-    key_builder=lambda db: "season:list",
+    local_ttl=LOCAL_CACHE_TTL["season"],
 )
-def get_seasons(db: Session) -> Tuple[list[SeasonDetailView], int]:
+async def get_seasons(db: AsyncSession) -> Tuple[list[SeasonDetailView], int]:
     """Get list of all seasons.
 
     Returns:
         List of season details ordered by most recent first
     """
 
-    query = db.query(SeasonDetailView).order_by(SeasonDetailView.season_id.desc())
-    total = query.count()
+    seasons = await _all(
+        db, select(SeasonDetailView).order_by(SeasonDetailView.season_id.desc())
+    )
 
-    return query.all(), total
+    return seasons, len(seasons)
 
 
 # ==================== Home Page Config View Operations ====================
 
 
 @cached(
-    cache_key="",
+    "home_page_config",
     ttl=CACHE_TTL["home_page_config"],
-    key_builder=lambda db: "home_page_config",
+    local_ttl=LOCAL_CACHE_TTL["home_page_config"],
 )
-def get_home_page_config(db: Session) -> Optional[dict]:
+async def get_home_page_config(db: AsyncSession) -> Optional[dict]:
     """Get the home page configuration.
 
     Returns:
         Home page configuration as a dictionary or None if not set
     """
-    config = db.query(HomePageConfigView).first()
+    config = await _first(db, select(HomePageConfigView))
     if config:
         return {
             "title": config.title,
@@ -743,12 +945,12 @@ def get_home_page_config(db: Session) -> Optional[dict]:
 
 
 @cached(
-    cache_key="",
+    "course:list",
     ttl=CACHE_TTL["course"],
-    key_builder=lambda db, course_id, skip, limit: f"course:list:{skip}:{limit}",
+    local_ttl=LOCAL_CACHE_TTL["course"],
 )
-def get_courses(
-    db: Session,
+async def get_courses(
+    db: AsyncSession,
     skip: int = None,
     limit: int = None,
 ) -> Tuple[list[CourseDetailView], int]:
@@ -757,7 +959,17 @@ def get_courses(
     Returns:
         List of course details ordered by name
     """
-    query = db.query(CourseDetailView).order_by(CourseDetailView.name.asc())
-    total = query.count()
+    stmt = select(CourseDetailView).order_by(CourseDetailView.name.asc())
+    total = await count_courses(db)
 
-    return query.offset(skip).limit(limit).all(), total
+    return await _all(db, stmt.offset(skip).limit(limit)), total
+
+
+@cached(
+    "course:list:count",
+    ttl=CACHE_TTL["course"],
+    namespaces=lambda **_: ("course:list",),
+)
+async def count_courses(db: AsyncSession) -> int:
+    """Total of the course list, shared by all of its pages."""
+    return await _count(db, select(CourseDetailView))
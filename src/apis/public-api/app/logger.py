@@ -6,27 +6,48 @@ import logging
 import sys
 import time
 import uuid
-from typing import Callable, Optional
+from typing import Optional
 
-import logging_loki
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.types import Processor
 
+from .loki import BatchedLokiHandler
+
 loogger = logging.getLogger(__name__)
 
 
-class StructlogMiddleware(BaseHTTPMiddleware):
-    """Middleware to automatically log all requests and responses with structured logging"""
+class StructlogMiddleware:
+    """
+    Middleware to automatically log all requests and responses with structured logging.
+
+    Pure ASGI rather than a BaseHTTPMiddleware, which runs the app in an extra
+    task and re-streams every response: the status and timing are taken from
+    the messages the app sends, which are passed through as they are.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Generate request ID if not present
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request_id = next(
+            (
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == b"x-request-id"
+            ),
+            None,
+        ) or str(uuid.uuid4())
 
         # Extract action from path and method
-        path = request.url.path
-        method = request.method
+        path = scope["path"]
+        method = scope["method"]
         action = self._extract_action(path, method)
 
         # Bind request context
@@ -37,46 +58,25 @@ class StructlogMiddleware(BaseHTTPMiddleware):
             action=action,
         )
 
-        # Log request
         logger = structlog.get_logger()
-        # if action != "list_metrics":  # Avoid logging Prometheus scrape requests
-        # logger.info(
-        #     "request_received",
-        #     action=action,
-        #     method=method,
-        #     path=path,
-        #     query_params=str(request.query_params) if request.query_params else None,
-        # )
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
 
         # Track timing
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-
-            # Log response
-            if action != "list_metrics":  # Avoid logging Prometheus scrape requests
-                logger.info(
-                    "request_completed",
-                    extra={
-                        "action": action,
-                        "status_code": response.status_code,
-                        "duration_ms": duration_ms,
-                    },
-                )
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+            await self.app(scope, receive, send_with_request_id)
 
         except Exception as e:
-            # Calculate duration
-            duration_ms = round((time.time() - start_time) * 1000, 2)
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
             # Log error
             logger.error(
@@ -90,6 +90,20 @@ class StructlogMiddleware(BaseHTTPMiddleware):
             )
             raise
 
+        else:
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+
+            # Log response
+            if action != "list_metrics":  # Avoid logging Prometheus scrape requests
+                logger.info(
+                    "request_completed",
+                    extra={
+                        "action": action,
+                        "status_code": status_code,
+                        "duration_ms": duration_ms,
+                    },
+                )
+
         finally:
             # Clear context
             structlog.contextvars.clear_contextvars()
@@ -156,7 +170,7 @@ def configure_logging(
     if additional_tags:
         tags.update(additional_tags)
 
-    loki_handler = logging_loki.LokiHandler(
+    loki_handler = BatchedLokiHandler(
         url=loki_url,
         tags=tags,
         version="1",
@@ -0,0 +1,174 @@
+"""
+Non-blocking Loki log shipping for the public API.
+
+logging_loki.LokiHandler does one HTTP push per record on the thread that logs
+it, so every request_completed line adds a Loki round trip to the request
+and a slow Loki stalls the event loop. BatchedLokiHandler only formats the
+record and puts it on a bounded queue; a daemon thread pushes the queued lines
+to Loki in gzip-compressed batches, and records that do not fit in the queue
+are dropped and counted instead of blocking.
+"""
+
+import gzip
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Optional
+
+import logging_loki
+import orjson
+from prometheus_client import Counter
+
+loki_dropped_records = Counter(
+    "public_api_loki_records_dropped_total",
+    "Log records dropped because the Loki shipping queue was full",
+)
+
+# (labels, timestamp in ns, formatted line)
+LokiEntry = tuple[dict[str, str], str, str]
+
+
+class BatchedLokiHandler(logging_loki.LokiHandler):
+    """Loki handler shipping records in batches from a background thread."""
+
+    def __init__(
+        self,
+        url: str,
+        tags: Optional[dict] = None,
+        auth=None,
+        version: str = "1",
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        timeout: float = 5.0,
+    ):
+        """
+        Args:
+            url: Loki push endpoint
+            tags: Labels added to every stream
+            auth: Optional (user, password) for Loki
+            version: Loki API version of logging_loki's emitter
+            queue_size: Maximum records waiting to be shipped
+            batch_size: Maximum records per push
+            flush_interval: Maximum seconds a record waits for its batch
+            timeout: Timeout of a push, in seconds
+        """
+        super().__init__(url=url, tags=tags, auth=auth, version=version)
+        self.queue: queue.Queue[LokiEntry] = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            entry = (
+                self.emitter.build_tags(record),
+                str(time.time_ns()),
+                self.format(record),
+            )
+        except Exception:
+            self.handleError(record)
+            return
+
+        # Started lazily so forked worker processes get their own thread
+        if self._pid != os.getpid():
+            self._start()
+
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            loki_dropped_records.inc()
+
+    def close(self) -> None:
+        """Ship the queued records (bounded by timeout) and stop the thread."""
+        if self._thread is not None and self._pid == os.getpid():
+            self._stop_event.set()
+            self._thread.join(self.timeout)
+            self._thread = None
+        super().close()
+
+    def _start(self) -> None:
+        with self.lock:
+            if self._pid == os.getpid():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._ship, name="loki-shipper", daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _ship(self) -> None:
+        while not self._stop_event.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._push(batch)
+
+        # Flush what is left on shutdown
+        while not self.queue.empty():
+            self._push(self._drain())
+
+    def _next_batch(self) -> list[LokiEntry]:
+        """Wait for a record, then collect more until the batch is full or flush_interval elapses."""
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop_event.is_set():
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self) -> list[LokiEntry]:
+        batch: list[LokiEntry] = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _push(self, batch: list[LokiEntry]) -> None:
+        streams: dict[tuple, list[list[str]]] = {}
+        for labels, ts, line in batch:
+            streams.setdefault(tuple(sorted(labels.items())), []).append([ts, line])
+
+        payload = {
+            "streams": [
+                {"stream": dict(labels), "values": values}
+                for labels, values in streams.items()
+            ]
+        }
+
+        try:
+            response = self.emitter.session.post(
+                self.emitter.url,
+                data=gzip.compress(orjson.dumps(payload)),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+                timeout=self.timeout,
+            )
+            if response.status_code != self.emitter.success_response_code:
+                raise ValueError(
+                    f"Unexpected Loki API response status code: {response.status_code}"
+                )
+        except Exception as e:
+            # Logging from the shipper thread would feed the failure back into the queue
+            sys.stderr.write(f"Failed to push {len(batch)} log records to Loki: {e}\n")
@@ -10,14 +10,23 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import schemas
-from .cache import clear_redis_cache, get_cache_stats
-from .database import check_db_connection, check_redis_connection, get_db
+from .cache import cache_invalidation_listener, clear_redis_cache, get_cache_stats
+from .database import (
+    check_db_connection,
+    check_redis_connection,
+    close_db_connection,
+    get_db,
+    read_replica,
+)
 from .logger import StructlogMiddleware
 from .routes import router
+from .warmup import cache_warmer
 
 logger = logging.getLogger(__name__)
 
@@ -29,21 +38,37 @@ async def lifespan(app: FastAPI):
     logger.info("service_starting", extra={"action": "startup"})
 
     # Check database connection
-    if check_db_connection():
+    if await check_db_connection():
         logger.info("database_connected", extra={"status": "success"})
     else:
         logger.error("database_connection_failed", extra={"status": "error"})
 
+    # Route reads to the read replica while it is available and caught up
+    await read_replica.start()
+
     # Initialize Redis cache
-    if check_redis_connection():
+    if await check_redis_connection():
         logger.info("redis_cache_initialized", extra={"status": "success"})
     else:
         logger.warning("redis_cache_unavailable", extra={"status": "disabled"})
 
+    # Listen for projection changes published by the projections worker, which
+    # asks for a warm-up once it has processed a batch
+    cache_invalidation_listener.on_action(
+        "warmup", lambda: cache_warmer.request("projections")
+    )
+    cache_invalidation_listener.start()
+
+    # Pre-populate the hottest pages in the background
+    cache_warmer.request("startup")
+
     logger.info("service_started", extra={"status": "ready"})
     yield
 
     # Shutdown
+    await cache_warmer.stop()
+    await cache_invalidation_listener.stop()
+    await close_db_connection()
     logger.info("service_stopped", extra={"action": "shutdown"})
 
 
@@ -52,6 +77,7 @@ app = FastAPI(
     description="Public read-only API for TACA competition data - no authentication required",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/public/docs",
     redoc_url="/api/public/redoc",
     openapi_url="/api/public/openapi.json",
@@ -71,7 +97,7 @@ Instrumentator().instrument(app).expose(app)
 
 
 @app.get("/", response_model=schemas.HealthResponse)
-def read_root():
+async def read_root():
     """Root endpoint with service information."""
     return schemas.HealthResponse(
         status="healthy",
@@ -81,20 +107,22 @@ def read_root():
 
 
 @app.get("/health", response_model=schemas.HealthResponse)
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db)):
     """
     Health check endpoint.
 
-    Verifies that the API is running and can connect to the database.
+    Verifies that the API is running and can connect to the database it reads
+    from, and reports the read replica routing state.
     """
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        await db.execute(text("SELECT 1"))
         logger.info("health_check", extra={"status": "healthy"})
         return schemas.HealthResponse(
             status="healthy",
             service="Public API",
             timestamp=datetime.utcnow(),
+            read_replica=read_replica.stats() if read_replica.configured else None,
         )
     except Exception as e:
         logger.error("health_check", extra={"error": str(e), "status": "unhealthy"})
@@ -105,19 +133,19 @@ def health_check(db: Session = Depends(get_db)):
 
 
 @app.get("/cache/stats")
-def get_cache_statistics():
+async def get_cache_statistics():
     """
     Get Redis cache statistics.
 
     Returns cache status, memory usage, and performance metrics.
     """
-    stats = get_cache_stats()
+    stats = await get_cache_stats()
     logger.info("cache_stats_requested", extra={"stats": stats})
     return {"cache": stats}
 
 
 @app.post("/cache/clear")
-def clear_cache():
+async def clear_cache():
     """
     Clear all Redis cache entries.
 
@@ -125,7 +153,8 @@ def clear_cache():
     Use with caution.
     """
     try:
-        clear_redis_cache()
+        await clear_redis_cache()
+        cache_warmer.request("clear")
         logger.info("cache_cleared_by_admin", extra={"action": "manual_clear"})
         return {
             "status": "success",
@@ -0,0 +1,131 @@
+"""
+Keyset (cursor) pagination for the public list endpoints.
+
+Offset pagination makes Postgres walk and discard every skipped row, so deep
+pages get linearly slower. With a cursor the next page starts right after the
+sort key of the last returned row, which the composite (sort column, id)
+indexes on the projection tables turn into a single index range scan.
+
+Cursors are opaque to clients: a URL-safe base64 JSON array of the sort key.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client supplied cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a sort key into an opaque cursor.
+
+    Args:
+        values: Sort key values, in the order of the keyset columns
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [
+            v.isoformat() if isinstance(v, (datetime.date, datetime.datetime)) else v
+            for v in values
+        ],
+        default=str,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *columns) -> tuple:
+    """
+    Decode a cursor back into the sort key of the given columns.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+        columns: Keyset columns, used to restore each value's type
+
+    Returns:
+        Tuple of sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursorError("Cursor does not match the sort key")
+        return tuple(_restore(value, column) for value, column in zip(values, columns))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        if isinstance(e, InvalidCursorError):
+            raise
+        raise InvalidCursorError("Malformed cursor") from e
+
+
+def _restore(value: Any, column) -> Any:
+    """Convert a JSON cursor value back to the column's Python type."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    if python_type is datetime.date:
+        return datetime.date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return value
+
+
+def paginate_keyset(
+    stmt: Select, columns: tuple, cursor: str, limit: int, descending: bool = False
+) -> Select:
+    """
+    Order a statement by the keyset columns and seek past the given cursor.
+
+    Args:
+        stmt: Filtered select statement
+        columns: Sort key columns, ending with a unique column (the id)
+        cursor: Cursor of the last row of the previous page ("" for the first page)
+        limit: Maximum number of records to return
+        descending: Whether the sort key is descending
+
+    Returns:
+        Statement for the requested page
+    """
+    if cursor:
+        after = decode_cursor(cursor, *columns)
+        keyset = tuple_(*columns)
+        stmt = stmt.where(keyset < after if descending else keyset > after)
+    order = [c.desc() if descending else c.asc() for c in columns]
+    return stmt.order_by(*order).limit(limit)
+
+
+def next_cursor(items: list, columns: tuple, limit: int) -> Optional[str]:
+    """
+    Cursor of the page following items, or None when it is the last page.
+
+    Args:
+        items: Rows of the current page (ORM rows or their cached dicts)
+        columns: Keyset columns the items were sorted by
+        limit: Page size the items were requested with
+
+    Returns:
+        Cursor string or None
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor(*(last[column.key] for column in columns))
+    return encode_cursor(*(getattr(last, column.key) for column in columns))
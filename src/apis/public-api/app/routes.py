@@ -2,11 +2,14 @@ import logging
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import crud, schemas
+from .batch import resolve_batch
+from .cache import CACHE_TTL, LOCAL_CACHE_TTL, cached_response
 from .database import get_db
+from .pagination import InvalidCursorError, next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +24,26 @@ router = APIRouter()
     summary="List all teams",
     description="Get a paginated list of teams with optional filters",
 )
-def list_teams(
+@cached_response(
+    response_model=schemas.TeamDetailList,
+    ttl=CACHE_TTL["team_list"],
+    namespaces=lambda **_: ("team:list",),
+)
+async def list_teams(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     course_id: Optional[UUID] = Query(None, description="Filter by course ID"),
     nucleo_id: Optional[UUID] = Query(None, description="Filter by nucleo ID"),
     modality_id: Optional[UUID] = Query(None, description="Filter by modality ID"),
     season_id: Optional[int] = Query(None, description="Filter by season ID"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from next_cursor (empty to start cursor pagination)",
+    ),
+    include_total: bool = Query(
+        True, description="Count the total (disable to skip the count query)"
+    ),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of teams with pagination and optional filters.
@@ -39,17 +54,25 @@ def list_teams(
     - **nucleo_id**: Optional filter by nucleo
     - **modality_id**: Optional filter by modality
     - **season_id**: Optional filter by season
+    - **cursor**: Opaque keyset cursor; deep pages stay as cheap as the first one,
+      but no total is counted and page is ignored
+    - **include_total**: Set to false to skip counting the total
     """
     skip = (page - 1) * page_size
-    teams, total = crud.get_teams(
-        db=db,
-        skip=skip,
-        limit=page_size,
-        course_id=course_id,
-        nucleo_id=nucleo_id,
-        modality_id=modality_id,
-        season_id=season_id,
-    )
+    try:
+        teams, total = await crud.get_teams(
+            db=db,
+            skip=skip,
+            limit=page_size,
+            course_id=course_id,
+            nucleo_id=nucleo_id,
+            modality_id=modality_id,
+            season_id=season_id,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     logger.info(
         "teams_listed",
@@ -69,8 +92,9 @@ def list_teams(
     return schemas.TeamDetailList(
         items=teams,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
+        next_cursor=next_cursor(teams, crud.TEAM_KEYSET, page_size),
     )
 
 
@@ -80,16 +104,21 @@ def list_teams(
     summary="Get team by ID",
     description="Get detailed information about a specific team",
 )
-def get_team(
+@cached_response(
+    response_model=schemas.TeamDetail,
+    ttl=CACHE_TTL["team"],
+    namespaces=lambda **_: ("team",),
+)
+async def get_team(
     team_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve detailed information about a specific team.
 
     - **team_id**: Unique identifier of the team
     """
-    team = crud.get_team_by_id(db=db, team_id=team_id)
+    team = await crud.get_team_by_id(db=db, team_id=team_id)
     if not team:
         logger.warning("team_not_found", extra={"team_id": str(team_id)})
         raise HTTPException(status_code=404, detail="Team not found")
@@ -107,14 +136,26 @@ def get_team(
     summary="List all students",
     description="Get a paginated list of students with optional filters",
 )
-def list_students(
+@cached_response(
+    response_model=schemas.StudentDetailList,
+    ttl=CACHE_TTL["student_list"],
+    namespaces=lambda **_: ("student:list",),
+)
+async def list_students(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     course_id: Optional[UUID] = Query(None, description="Filter by course ID"),
     nucleo_id: Optional[UUID] = Query(None, description="Filter by nucleo ID"),
     is_member: Optional[bool] = Query(None, description="Filter by membership status"),
     search: Optional[str] = Query(None, description="Search in student name or number"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from next_cursor (empty to start cursor pagination)",
+    ),
+    include_total: bool = Query(
+        True, description="Count the total (disable to skip the count query)"
+    ),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of students with pagination and optional filters.
@@ -125,17 +166,25 @@ def list_students(
     - **nucleo_id**: Optional filter by nucleo
     - **is_member**: Optional filter by membership status
     - **search**: Optional search in name or student number
+    - **cursor**: Opaque keyset cursor; deep pages stay as cheap as the first one,
+      but no total is counted and page is ignored
+    - **include_total**: Set to false to skip counting the total
     """
     skip = (page - 1) * page_size
-    students, total = crud.get_students(
-        db=db,
-        skip=skip,
-        limit=page_size,
-        course_id=course_id,
-        nucleo_id=nucleo_id,
-        is_member=is_member,
-        search=search,
-    )
+    try:
+        students, total = await crud.get_students(
+            db=db,
+            skip=skip,
+            limit=page_size,
+            course_id=course_id,
+            nucleo_id=nucleo_id,
+            is_member=is_member,
+            search=search,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     logger.info(
         "students_listed",
@@ -155,8 +204,9 @@ def list_students(
     return schemas.StudentDetailList(
         items=students,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
+        next_cursor=next_cursor(students, crud.STUDENT_KEYSET, page_size),
     )
 
 
@@ -166,16 +216,21 @@ def list_students(
     summary="Get student by ID",
     description="Get detailed information about a specific student",
 )
-def get_student(
+@cached_response(
+    response_model=schemas.StudentDetail,
+    ttl=CACHE_TTL["student"],
+    namespaces=lambda **_: ("student",),
+)
+async def get_student(
     student_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve detailed information about a specific student.
 
     - **student_id**: Unique identifier of the student
     """
-    student = crud.get_student_by_id(db=db, student_id=student_id)
+    student = await crud.get_student_by_id(db=db, student_id=student_id)
     if not student:
         logger.warning("student_not_found", extra={"student_id": str(student_id)})
         raise HTTPException(status_code=404, detail="Student not found")
@@ -190,16 +245,21 @@ def get_student(
     summary="Get student by number",
     description="Get detailed information about a student by their student number",
 )
-def get_student_by_number(
+@cached_response(
+    response_model=schemas.StudentDetail,
+    ttl=CACHE_TTL["student"],
+    namespaces=lambda **_: ("student:number",),
+)
+async def get_student_by_number(
     student_number: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve detailed information about a student by their student number.
 
     - **student_number**: Student number
     """
-    student = crud.get_student_by_number(db=db, student_number=student_number)
+    student = await crud.get_student_by_number(db=db, student_number=student_number)
     if not student:
         logger.warning("student_not_found", extra={"student_number": student_number})
         raise HTTPException(status_code=404, detail="Student not found")
@@ -217,13 +277,25 @@ def get_student_by_number(
     summary="List all tournaments",
     description="Get a paginated list of tournaments with optional filters",
 )
-def list_tournaments(
+@cached_response(
+    response_model=schemas.TournamentDetailList,
+    ttl=CACHE_TTL["tournament_list"],
+    namespaces=lambda **_: ("tournament:list",),
+)
+async def list_tournaments(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     modality_id: Optional[UUID] = Query(None, description="Filter by modality ID"),
     status: Optional[str] = Query(None, description="Filter by tournament status"),
     season_id: Optional[int] = Query(None, description="Filter by season ID"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from next_cursor (empty to start cursor pagination)",
+    ),
+    include_total: bool = Query(
+        True, description="Count the total (disable to skip the count query)"
+    ),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of tournaments with pagination and optional filters.
@@ -233,16 +305,24 @@ def list_tournaments(
     - **modality_id**: Optional filter by modality
     - **status**: Optional filter by status (draft, active, finished, cancelled)
     - **season_id**: Optional filter by season
+    - **cursor**: Opaque keyset cursor; deep pages stay as cheap as the first one,
+      but no total is counted and page is ignored
+    - **include_total**: Set to false to skip counting the total
     """
     skip = (page - 1) * page_size
-    tournaments, total = crud.get_tournaments(
-        db=db,
-        skip=skip,
-        limit=page_size,
-        modality_id=modality_id,
-        status=status,
-        season_id=season_id,
-    )
+    try:
+        tournaments, total = await crud.get_tournaments(
+            db=db,
+            skip=skip,
+            limit=page_size,
+            modality_id=modality_id,
+            status=status,
+            season_id=season_id,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     logger.info(
         "tournaments_listed",
@@ -261,8 +341,9 @@ def list_tournaments(
     return schemas.TournamentDetailList(
         items=tournaments,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
+        next_cursor=next_cursor(tournaments, crud.TOURNAMENT_KEYSET, page_size),
     )
 
 
@@ -272,16 +353,21 @@ def list_tournaments(
     summary="Get tournament by ID",
     description="Get detailed information about a specific tournament",
 )
-def get_tournament(
+@cached_response(
+    response_model=schemas.TournamentDetail,
+    ttl=CACHE_TTL["tournament"],
+    namespaces=lambda **_: ("tournament",),
+)
+async def get_tournament(
     tournament_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve detailed information about a specific tournament.
 
     - **tournament_id**: Unique identifier of the tournament
     """
-    tournament = crud.get_tournament_by_id(db=db, tournament_id=tournament_id)
+    tournament = await crud.get_tournament_by_id(db=db, tournament_id=tournament_id)
     if not tournament:
         logger.warning(
             "tournament_not_found", extra={"tournament_id": str(tournament_id)}
@@ -298,11 +384,19 @@ def get_tournament(
     summary="Get tournament standings",
     description="Get the current standings/rankings for a tournament",
 )
-def get_tournament_standings(
+@cached_response(
+    response_model=schemas.TournamentStandingsList,
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda tournament_id, **_: (
+        "standings",
+        f"standings:{tournament_id}",
+    ),
+)
+async def get_tournament_standings(
     tournament_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve the current standings for a specific tournament.
@@ -314,7 +408,7 @@ def get_tournament_standings(
     - **page_size**: Number of items per page (max 100)
     """
     # First check if tournament exists
-    tournament = crud.get_tournament_by_id(db=db, tournament_id=tournament_id)
+    tournament = await crud.get_tournament_by_id(db=db, tournament_id=tournament_id)
     if not tournament:
         logger.warning(
             "tournament_not_found", extra={"tournament_id": str(tournament_id)}
@@ -322,7 +416,7 @@ def get_tournament_standings(
         raise HTTPException(status_code=404, detail="Tournament not found")
 
     skip = (page - 1) * page_size
-    standings, total = crud.get_tournament_standings(
+    standings, total = await crud.get_tournament_standings(
         db=db,
         tournament_id=tournament_id,
         skip=skip,
@@ -356,7 +450,12 @@ def get_tournament_standings(
     summary="List all matches",
     description="Get a paginated list of matches with optional filters",
 )
-def list_matches(
+@cached_response(
+    response_model=schemas.MatchDetailList,
+    ttl=CACHE_TTL["match_list"],
+    namespaces=lambda **_: ("match:list",),
+)
+async def list_matches(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     tournament_id: Optional[UUID] = Query(None, description="Filter by tournament ID"),
@@ -364,7 +463,14 @@ def list_matches(
     date: Optional[str] = Query(None, description="Filter by scheduled date (YYYY-MM)"),
     nucleo_id: Optional[UUID] = Query(None, description="Filter by nucleo ID"),
     course_id: Optional[UUID] = Query(None, description="Filter by course ID"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from next_cursor (empty to start cursor pagination)",
+    ),
+    include_total: bool = Query(
+        True, description="Count the total (disable to skip the count query)"
+    ),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of matches with pagination and optional filters.
@@ -373,18 +479,26 @@ def list_matches(
     - **page_size**: Number of items per page (max 100)
     - **tournament_id**: Optional filter by tournament
     - **status**: Optional filter by status (scheduled, in_progress, completed, finished, cancelled)
+    - **cursor**: Opaque keyset cursor; deep pages stay as cheap as the first one,
+      but no total is counted and page is ignored
+    - **include_total**: Set to false to skip counting the total
     """
     skip = (page - 1) * page_size
-    matches, total = crud.get_matches(
-        db=db,
-        skip=skip,
-        limit=page_size,
-        tournament_id=tournament_id,
-        status=status,
-        date=date,
-        nucleo_id=nucleo_id,
-        course_id=course_id,
-    )
+    try:
+        matches, total = await crud.get_matches(
+            db=db,
+            skip=skip,
+            limit=page_size,
+            tournament_id=tournament_id,
+            status=status,
+            date=date,
+            nucleo_id=nucleo_id,
+            course_id=course_id,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     if nucleo_id and course_id:
         logger.warning(
@@ -418,8 +532,9 @@ def list_matches(
     return schemas.MatchDetailList(
         items=matches,
         total=total,
-        page=page,
+        page=page if cursor is None else None,
         page_size=page_size,
+        next_cursor=next_cursor(matches, crud.MATCH_KEYSET, page_size),
     )
 
 
@@ -429,9 +544,14 @@ def list_matches(
     summary="Get match by ID",
     description="Get detailed information about a specific match",
 )
-def get_match(
+@cached_response(
+    response_model=schemas.MatchDetail,
+    ttl=CACHE_TTL["match"],
+    namespaces=lambda **_: ("match",),
+)
+async def get_match(
     match_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve detailed information about a specific match.
@@ -440,7 +560,7 @@ def get_match(
 
     - **match_id**: Unique identifier of the match
     """
-    match = crud.get_match_by_id(db=db, match_id=match_id)
+    match = await crud.get_match_by_id(db=db, match_id=match_id)
     if not match:
         logger.warning("match_not_found", extra={"match_id": str(match_id)})
         raise HTTPException(status_code=404, detail="Match not found")
@@ -458,9 +578,14 @@ def get_match(
     summary="Get competitor standings",
     description="Get all tournament standings for a specific competitor (team or athlete)",
 )
-def get_competitor_standings(
+@cached_response(
+    response_model=list[schemas.TournamentStanding],
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda **_: ("standings", "standings:competitors"),
+)
+async def get_competitor_standings(
     competitor_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve all tournament standings for a specific competitor.
@@ -470,7 +595,7 @@ def get_competitor_standings(
 
     - **competitor_id**: Unique identifier of the competitor (team_id or student_id)
     """
-    standings = crud.get_standings_by_competitor(
+    standings = await crud.get_standings_by_competitor(
         db=db,
         competitor_entity_id=competitor_id,
     )
@@ -495,10 +620,18 @@ def get_competitor_standings(
     summary="Get general ranking",
     description="Get the general ranking of all courses based on tournament performance",
 )
-def get_general_ranking(
+@cached_response(
+    response_model=schemas.GeneralRankingList,
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda season_id, **_: (
+        "ranking:general",
+        f"ranking:general:{season_id}",
+    ),
+)
+async def get_general_ranking(
     season_id: int = Query(..., description="Season ID to filter the ranking"),
     nucleo_id: Optional[UUID] = Query(None, description="Optional filter by nucleo ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve the general ranking of courses.
@@ -510,7 +643,7 @@ def get_general_ranking(
     - **season_id**: Season ID to filter the ranking
     - **nucleo_id**: Optional filter to show ranking only for a specific nucleo
     """
-    rankings, total = crud.get_general_ranking(
+    rankings, total = await crud.get_general_ranking(
         db=db, season_id=season_id, nucleo_id=nucleo_id
     )
 
@@ -534,16 +667,21 @@ def get_general_ranking(
     summary="Get course ranking",
     description="Get ranking information for a specific course",
 )
-def get_course_ranking(
+@cached_response(
+    response_model=schemas.GeneralRanking,
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda **_: ("ranking:course",),
+)
+async def get_course_ranking(
     course_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve ranking information for a specific course.
 
     - **course_id**: Unique identifier of the course
     """
-    ranking = crud.get_course_ranking(db=db, course_id=course_id)
+    ranking = await crud.get_course_ranking(db=db, course_id=course_id)
     if not ranking:
         logger.warning("course_ranking_not_found", extra={"course_id": str(course_id)})
         raise HTTPException(status_code=404, detail="Course ranking not found")
@@ -561,13 +699,19 @@ def get_course_ranking(
     summary="List all nucleos",
     description="Get a paginated list of all active nucleos",
 )
-def list_nucleos(
+@cached_response(
+    response_model=schemas.NucleoList,
+    ttl=CACHE_TTL["nucleo_list"],
+    namespaces=lambda **_: ("nucleo:list",),
+    local_ttl=LOCAL_CACHE_TTL["nucleo_list"],
+)
+async def list_nucleos(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     skip = (page - 1) * page_size
-    nucleos, total = crud.get_nucleos(db=db, skip=skip, limit=page_size)
+    nucleos, total = await crud.get_nucleos(db=db, skip=skip, limit=page_size)
     logger.info(
         "nucleos_listed", extra={"total": total, "page": page, "page_size": page_size}
     )
@@ -582,11 +726,17 @@ def list_nucleos(
     summary="Get nucleo by ID",
     description="Get a specific nucleo",
 )
-def get_nucleo(
+@cached_response(
+    response_model=schemas.NucleoPublic,
+    ttl=CACHE_TTL["nucleo"],
+    namespaces=lambda **_: ("nucleo",),
+    local_ttl=LOCAL_CACHE_TTL["nucleo"],
+)
+async def get_nucleo(
     nucleo_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    nucleo = crud.get_nucleo_by_id(db=db, nucleo_id=nucleo_id)
+    nucleo = await crud.get_nucleo_by_id(db=db, nucleo_id=nucleo_id)
     if not nucleo:
         raise HTTPException(status_code=404, detail="Nucleo not found")
     logger.info("nucleo_retrieved", extra={"nucleo_id": str(nucleo_id)})
@@ -602,10 +752,16 @@ def get_nucleo(
     summary="List all regulations",
     description="Get all public regulation documents, optionally filtered by search term",
 )
-def list_regulations(
+@cached_response(
+    response_model=list[schemas.RegulationPublic],
+    ttl=CACHE_TTL["regulation"],
+    namespaces=lambda **_: ("regulation:list",),
+    local_ttl=LOCAL_CACHE_TTL["regulation"],
+)
+async def list_regulations(
     search: Optional[str] = Query(None, description="Search in title and description"),
     season_id: Optional[int] = Query(None, description="Filter by season ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve the list of regulation documents.
@@ -613,7 +769,7 @@ def list_regulations(
     - **search**: Optional text to filter by title or description
     - **season_id**: Optional filter by season ID
     """
-    regulations = crud.get_regulations(db=db, search=search, season_id=season_id)
+    regulations = await crud.get_regulations(db=db, search=search, season_id=season_id)
     logger.info("regulations_listed", extra={"total": len(regulations)})
     return regulations
 
@@ -630,13 +786,21 @@ def list_regulations(
         "You can optionally filter by modality or nucleo."
     ),
 )
-def get_modality_ranking(
+@cached_response(
+    response_model=schemas.ModalityRankingList,
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda season_id, **_: (
+        "ranking:modality",
+        f"ranking:modality:{season_id}",
+    ),
+)
+async def get_modality_ranking(
     season_id: int = Query(..., description="Season ID to filter the ranking"),
     modality_id: Optional[UUID] = Query(
         None, description="Optional filter by modality ID"
     ),
     nucleo_id: Optional[UUID] = Query(None, description="Optional filter by nucleo ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve rankings of courses within modalities.
 
@@ -647,7 +811,7 @@ def get_modality_ranking(
     - **modality_id**: Optional filter to show ranking only for a specific modality
     - **nucleo_id**: Optional filter to show ranking only for a specific nucleo
     """
-    rankings, total = crud.get_modality_ranking(
+    rankings, total = await crud.get_modality_ranking(
         db=db,
         season_id=season_id,
         modality_id=modality_id,
@@ -675,9 +839,14 @@ def get_modality_ranking(
     summary="Get course modality rankings",
     description="Get modality-specific ranking information for a given course",
 )
-def get_course_modality_rankings(
+@cached_response(
+    response_model=list[schemas.ModalityRanking],
+    ttl=CACHE_TTL["ranking"],
+    namespaces=lambda **_: ("ranking:modality:course",),
+)
+async def get_course_modality_rankings(
     course_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve modality rankings for a specific course.
 
@@ -685,7 +854,7 @@ def get_course_modality_rankings(
 
     - **course_id**: Unique identifier of the course
     """
-    rankings = crud.get_course_modality_rankings(db=db, course_id=course_id)
+    rankings = await crud.get_course_modality_rankings(db=db, course_id=course_id)
 
     logger.info(
         "course_modality_rankings_retrieved",
@@ -707,8 +876,14 @@ def get_course_modality_rankings(
     summary="List all seasons",
     description="Get a list of all seasons with their details",
 )
-def list_seasons(
-    db: Session = Depends(get_db),
+@cached_response(
+    response_model=schemas.SeasonDetailList,
+    ttl=CACHE_TTL["season"],
+    namespaces=lambda **_: ("season:list",),
+    local_ttl=LOCAL_CACHE_TTL["season"],
+)
+async def list_seasons(
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of all seasons.
@@ -717,7 +892,7 @@ def list_seasons(
 
     - **db**: Database session
     """
-    seasons, total = crud.get_seasons(db=db)
+    seasons, total = await crud.get_seasons(db=db)
 
     logger.info(
         "seasons_listed",
@@ -741,15 +916,21 @@ def list_seasons(
     summary="Get home page configuration",
     description="Get the current configuration for the public website's home page",
 )
-def get_home_page_config(
-    db: Session = Depends(get_db),
+@cached_response(
+    response_model=schemas.HomePageConfig,
+    ttl=CACHE_TTL["home_page_config"],
+    namespaces=lambda **_: ("home_page_config",),
+    local_ttl=LOCAL_CACHE_TTL["home_page_config"],
+)
+async def get_home_page_config(
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve the current configuration for the public website's home page.
 
     - **db**: Database session
     """
-    home_page_config = crud.get_home_page_config(db=db)
+    home_page_config = await crud.get_home_page_config(db=db)
     if not home_page_config:
         logger.warning("home_page_config_not_found")
         raise HTTPException(status_code=404, detail="Home page configuration not found")
@@ -767,10 +948,16 @@ def get_home_page_config(
     summary="List all courses",
     description="Get a paginated list of courses with optional filters",
 )
-def list_courses(
+@cached_response(
+    response_model=schemas.CourseDetailList,
+    ttl=CACHE_TTL["course"],
+    namespaces=lambda **_: ("course:list",),
+    local_ttl=LOCAL_CACHE_TTL["course"],
+)
+async def list_courses(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of courses with pagination and optional filters.
@@ -779,7 +966,7 @@ def list_courses(
     - **page_size**: Number of items per page (max 100)
     """
     skip = (page - 1) * page_size
-    courses, total = crud.get_courses(
+    courses, total = await crud.get_courses(
         db=db,
         skip=skip,
         limit=page_size,
@@ -808,15 +995,21 @@ def list_courses(
     summary="Get course menu",
     description="Get a list of courses for the public website menu",
 )
-def get_course_menu(
-    db: Session = Depends(get_db),
+@cached_response(
+    response_model=schemas.CourseSimpleList,
+    ttl=CACHE_TTL["course"],
+    namespaces=lambda **_: ("course:list",),
+    local_ttl=LOCAL_CACHE_TTL["course"],
+)
+async def get_course_menu(
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Retrieve a list of courses for the public website menu.
 
     - **db**: Database session
     """
-    courses, total = crud.get_courses(db=db)
+    courses, total = await crud.get_courses(db=db)
 
     logger.info(
         "course_menu_retrieved",
@@ -829,3 +1022,26 @@ def get_course_menu(
         items=courses,
         total=total,
     )
+
+
+# ==================== Batch Endpoint ====================
+
+
+@router.post(
+    "/batch",
+    response_model=schemas.BatchResponse,
+    summary="Resolve several requests at once",
+    description="Resolve up to 20 GET requests of this API in a single call",
+)
+async def batch(payload: schemas.BatchRequest):
+    """
+    Resolve several GET requests of this API in a single call.
+
+    Cached bodies of all requests are fetched at once and only the misses hit
+    the database, concurrently. Each response keeps its own status, so a
+    failing request (e.g. a 404) does not fail the batch.
+
+    - **requests**: List of paths (with optional query parameters), max 20
+    """
+    body = await resolve_batch(router.routes, payload.requests)
+    return Response(content=body, media_type="application/json")
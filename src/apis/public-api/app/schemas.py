@@ -50,9 +50,16 @@ class TeamDetailList(BaseModel):
     """Schema for paginated list of team details."""
 
     items: list[TeamDetail] = Field(..., description="List of team details")
-    total: int = Field(..., ge=0, description="Total number of teams")
-    page: int = Field(..., ge=1, description="Current page number")
+    total: Optional[int] = Field(
+        None, ge=0, description="Total number of teams (not counted in cursor mode)"
+    )
+    page: Optional[int] = Field(
+        None, ge=1, description="Current page number (offset mode only)"
+    )
     page_size: int = Field(..., ge=1, description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, None on the last page"
+    )
 
 
 # ==================== StudentDetailView Schemas ====================
@@ -86,9 +93,16 @@ class StudentDetailList(BaseModel):
     """Schema for paginated list of student details."""
 
     items: list[StudentDetail] = Field(..., description="List of student details")
-    total: int = Field(..., ge=0, description="Total number of students")
-    page: int = Field(..., ge=1, description="Current page number")
+    total: Optional[int] = Field(
+        None, ge=0, description="Total number of students (not counted in cursor mode)"
+    )
+    page: Optional[int] = Field(
+        None, ge=1, description="Current page number (offset mode only)"
+    )
     page_size: int = Field(..., ge=1, description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, None on the last page"
+    )
 
 
 # ==================== TournamentDetailView Schemas ====================
@@ -123,9 +137,18 @@ class TournamentDetailList(BaseModel):
     """Schema for paginated list of tournament details."""
 
     items: list[TournamentDetail] = Field(..., description="List of tournament details")
-    total: int = Field(..., ge=0, description="Total number of tournaments")
-    page: int = Field(..., ge=1, description="Current page number")
+    total: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Total number of tournaments (not counted in cursor mode)",
+    )
+    page: Optional[int] = Field(
+        None, ge=1, description="Current page number (offset mode only)"
+    )
     page_size: int = Field(..., ge=1, description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, None on the last page"
+    )
 
 
 # ==================== MatchDetailView Schemas ====================
@@ -168,9 +191,16 @@ class MatchDetailList(BaseModel):
     """Schema for paginated list of match details."""
 
     items: list[MatchDetail] = Field(..., description="List of match details")
-    total: int = Field(..., ge=0, description="Total number of matches")
-    page: int = Field(..., ge=1, description="Current page number")
+    total: Optional[int] = Field(
+        None, ge=0, description="Total number of matches (not counted in cursor mode)"
+    )
+    page: Optional[int] = Field(
+        None, ge=1, description="Current page number (offset mode only)"
+    )
     page_size: int = Field(..., ge=1, description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, None on the last page"
+    )
 
 
 # ==================== TournamentStandingsView Schemas ====================
@@ -213,6 +243,9 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Service status")
     service: str = Field(..., description="Service name")
     timestamp: datetime = Field(..., description="Current timestamp")
+    read_replica: Optional[dict] = Field(
+        None, description="Read replica routing state, when one is configured"
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -423,3 +456,43 @@ class CourseSimpleList(BaseModel):
 
     items: list[CourseSimple] = Field(..., description="List of course menu items")
     total: int = Field(..., ge=0, description="Total number of courses")
+
+
+# ==================== Batch Schemas ====================
+
+
+class BatchSubRequest(BaseModel):
+    """Schema for a single GET request resolved by the batch endpoint."""
+
+    path: str = Field(
+        ...,
+        description="Public API path, optionally with a query string "
+        "(e.g. /ranking/general?season_id=3)",
+    )
+    params: dict[str, Any] = Field(
+        default_factory=dict, description="Additional query parameters"
+    )
+
+
+class BatchRequest(BaseModel):
+    """Schema for a batch of GET requests."""
+
+    requests: list[BatchSubRequest] = Field(
+        ..., min_length=1, max_length=20, description="Requests to resolve"
+    )
+
+
+class BatchSubResponse(BaseModel):
+    """Schema for the response of a single batched request."""
+
+    path: str = Field(..., description="Path of the request")
+    status: int = Field(..., description="HTTP status of the request")
+    body: Any = Field(..., description="JSON body the request would return")
+
+
+class BatchResponse(BaseModel):
+    """Schema for the responses of a batch, in request order."""
+
+    responses: list[BatchSubResponse] = Field(
+        ..., description="Responses of the batched requests"
+    )
@@ -0,0 +1,205 @@
+"""
+Cache warm-up for the public API.
+
+After a deploy, a cache clear or a projections rebuild every entry is cold and
+the first wave of visitors all reach Postgres. Warm-up resolves the hottest
+pages of the public website ahead of them, through the same path as the batch
+endpoint, so both the route bodies and the crud entries below them are filled.
+
+Pages are resolved concurrently but bounded by CACHE_WARMUP_CONCURRENCY, each
+with its own session, and a Redis lock lets a single process warm at a time.
+"""
+
+import asyncio
+import datetime
+import logging
+import os
+import time
+from typing import Optional
+from uuid import uuid4
+
+import orjson
+
+from .batch import resolve_requests
+from .cache import get_redis_client, redis_breaker, release_lock
+from .database import read_replica
+from .routes import router
+from .schemas import BatchSubRequest
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+CACHE_WARMUP_CONCURRENCY = int(os.getenv("CACHE_WARMUP_CONCURRENCY", 4))
+# Seconds warm-up requests are coalesced for (the worker reports batches back to back)
+CACHE_WARMUP_DEBOUNCE = float(os.getenv("CACHE_WARMUP_DEBOUNCE", 2))
+
+WARMUP_LOCK_KEY = "cache:warmup:lock"
+WARMUP_LOCK_TIMEOUT_MS = 60000
+
+# Page sizes the public website requests its lists with
+LIST_PAGE_SIZE = 100
+CALENDAR_PAGE_SIZE = 20
+
+
+class CacheWarmer:
+    """Debounced, single-flight warm-up of the hottest public API pages."""
+
+    def __init__(self, concurrency: int, debounce: float):
+        self.concurrency = concurrency
+        self.debounce = debounce
+        self._task: Optional[asyncio.Task] = None
+        self._reasons: set[str] = set()
+
+    def request(self, reason: str) -> None:
+        """Schedule a warm-up, merged with any already pending one."""
+        if not CACHE_WARMUP_ENABLED:
+            return
+
+        self._reasons.add(reason)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="cache-warmup")
+
+    async def stop(self) -> None:
+        """Cancel a pending or running warm-up."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        # Requests made while warming up (e.g. a later batch) get another pass
+        while self._reasons:
+            # Let a lagging read replica catch up first (see READ_REPLICA_MAX_LAG)
+            delay = self.debounce
+            if read_replica.available:
+                delay += read_replica.max_lag
+            await asyncio.sleep(delay)
+            reasons, self._reasons = sorted(self._reasons), set()
+            await self._warm_up(reasons)
+
+    async def _warm_up(self, reasons: list[str]) -> None:
+        client = get_redis_client()
+        if client is None:
+            return
+
+        token = uuid4().hex
+        try:
+            if not await client.set(
+                WARMUP_LOCK_KEY, token, nx=True, px=WARMUP_LOCK_TIMEOUT_MS
+            ):
+                logger.info("cache_warmup_skipped", extra={"reasons": reasons})
+                return
+        except Exception as e:
+            redis_breaker.record_failure(e)
+            logger.warning("cache_warmup_failed", extra={"error": str(e)})
+            return
+
+        start = time.perf_counter()
+        try:
+            pages = await warm_up_cache(self.concurrency)
+            logger.info(
+                "cache_warmup_completed",
+                extra={
+                    "reasons": reasons,
+                    "pages": pages,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                },
+            )
+        except Exception as e:
+            logger.error(
+                "cache_warmup_failed", extra={"reasons": reasons, "error": str(e)}
+            )
+        finally:
+            try:
+                await release_lock(client, WARMUP_LOCK_KEY, token)
+            except Exception as e:
+                redis_breaker.record_failure(e)
+
+
+async def _resolve(paths: list[str], semaphore: asyncio.Semaphore) -> list[dict]:
+    """Resolve pages concurrently (bounded), returning the decoded 200 bodies."""
+
+    async def resolve(path: str) -> Optional[dict]:
+        try:
+            async with semaphore:
+                [(status, body)] = await resolve_requests(
+                    router.routes, [BatchSubRequest(path=path)]
+                )
+        except Exception as e:
+            logger.warning(
+                "cache_warmup_page_failed", extra={"path": path, "error": str(e)}
+            )
+            return None
+        if status != 200:
+            logger.warning(
+                "cache_warmup_page_failed", extra={"path": path, "status": status}
+            )
+            return None
+        return orjson.loads(body)
+
+    return await asyncio.gather(*(resolve(path) for path in paths))
+
+
+async def warm_up_cache(concurrency: int = CACHE_WARMUP_CONCURRENCY) -> int:
+    """
+    Pre-populate the cache with the pages visitors hit first.
+
+    Seasons, home page, nucleos and courses come first; the current season
+    (active, or else the most recent) then selects its rankings, tournaments and
+    calendar, and the active tournaments their detail, standings and matches.
+
+    Args:
+        concurrency: Maximum number of pages resolved at the same time
+
+    Returns:
+        Number of pages resolved
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    paths = [
+        "/seasons",
+        "/home-page-config",
+        "/nucleos",
+        f"/nucleos?page=1&page_size={LIST_PAGE_SIZE}",
+        "/courses",
+        "/courses/menu",
+    ]
+    seasons = (await _resolve(paths, semaphore))[0]
+    resolved = len(paths)
+
+    items = seasons["items"] if seasons else []
+    season = next((s for s in items if s.get("is_active")), items[0] if items else None)
+    if season is None:
+        return resolved
+
+    season_id = season["season_id"]
+    month = datetime.date.today().strftime("%Y-%m")
+    paths = [
+        f"/tournaments?status=active&season_id={season_id}&page_size={LIST_PAGE_SIZE}",
+        f"/ranking/general?season_id={season_id}",
+        f"/ranking/modality?season_id={season_id}",
+        f"/tournaments?page=1&page_size={LIST_PAGE_SIZE}&season_id={season_id}",
+        f"/matches?page=1&page_size={CALENDAR_PAGE_SIZE}",
+        f"/matches?page=1&page_size={LIST_PAGE_SIZE}&date={month}",
+    ]
+    active = (await _resolve(paths, semaphore))[0]
+    resolved += len(paths)
+
+    paths = [
+        path
+        for tournament in (active["items"] if active else [])
+        for path in (
+            f"/tournaments/{tournament['tournament_id']}",
+            f"/tournaments/{tournament['tournament_id']}/standings"
+            f"?page_size={LIST_PAGE_SIZE}",
+            f"/matches?tournament_id={tournament['tournament_id']}"
+            f"&page_size={LIST_PAGE_SIZE}",
+        )
+    ]
+    await _resolve(paths, semaphore)
+    return resolved + len(paths)
+
+
+cache_warmer = CacheWarmer(CACHE_WARMUP_CONCURRENCY, CACHE_WARMUP_DEBOUNCE)
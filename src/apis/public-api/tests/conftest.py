@@ -0,0 +1,26 @@
+import fakeredis
+import pytest
+from app import cache
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """A closed circuit breaker of its own, so tests never see each other's failures."""
+    breaker = cache.RedisCircuitBreaker(threshold=3, window=10, max_backoff=30)
+    monkeypatch.setattr(cache, "redis_breaker", breaker)
+    return breaker
+
+
+@pytest.fixture
+def redis_client(monkeypatch, breaker):
+    """In-memory Redis used by the cache module, with an empty local tier."""
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+    cache.local_cache.clear()
+    yield client
+    cache.local_cache.clear()
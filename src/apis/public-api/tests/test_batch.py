@@ -0,0 +1,103 @@
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+from app import batch, cache
+from app.schemas import BatchSubRequest
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+
+pytestmark = pytest.mark.anyio
+
+
+class Item(BaseModel):
+    id: int
+
+
+def get_db():
+    pass
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Sessions opened by the batch, one per computed sub-request."""
+    sessions = []
+
+    @asynccontextmanager
+    async def get_async_db():
+        session = object()
+        sessions.append(session)
+        yield session
+
+    monkeypatch.setattr(batch, "get_async_db", get_async_db)
+    return sessions
+
+
+@pytest.fixture
+def routes(redis_client):
+    router = APIRouter()
+
+    @router.get("/items/{item_id}", response_model=Item)
+    @cache.cached_response(
+        response_model=Item, ttl=3600, namespaces=lambda **_: ("item",)
+    )
+    async def get_item(item_id: int, db=Depends(get_db)):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Item not found")
+        if item_id < 0:
+            raise RuntimeError("database timeout")
+        return {"id": item_id}
+
+    return router.routes
+
+
+async def resolve(routes, *paths):
+    results = await batch.resolve_requests(
+        routes, [BatchSubRequest(path=path) for path in paths]
+    )
+    return [(status, orjson.loads(body)) for status, body in results]
+
+
+async def test_misses_run_on_a_session_each_then_hit_the_cache(routes, sessions):
+    assert await resolve(routes, "/items/1", "/items/2") == [
+        (200, {"id": 1}),
+        (200, {"id": 2}),
+    ]
+    assert len(set(map(id, sessions))) == 2
+
+    assert await resolve(routes, "/items/1", "/items/2") == [
+        (200, {"id": 1}),
+        (200, {"id": 2}),
+    ]
+    assert len(sessions) == 2
+
+
+async def test_errors_only_fail_their_own_sub_request(routes, sessions):
+    assert await resolve(routes, "/items/0", "/items/-1", "/items/3", "/nope") == [
+        (404, {"detail": "Item not found"}),
+        (500, {"detail": "Internal Server Error"}),
+        (200, {"id": 3}),
+        (404, {"detail": "Not Found"}),
+    ]
+
+
+async def test_session_errors_only_fail_their_own_sub_request(
+    routes, sessions, monkeypatch
+):
+    @asynccontextmanager
+    async def get_async_db():
+        raise ConnectionError("no database")
+        yield
+
+    monkeypatch.setattr(batch, "get_async_db", get_async_db)
+
+    assert await resolve(routes, "/items/1") == [
+        (500, {"detail": "Internal Server Error"})
+    ]
+
+
+async def test_failed_sub_requests_are_not_cached(routes, sessions):
+    await resolve(routes, "/items/-1")
+    await resolve(routes, "/items/-1")
+
+    assert len(sessions) == 2
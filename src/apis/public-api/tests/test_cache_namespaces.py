@@ -0,0 +1,49 @@
+import pytest
+from app import cache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_versioned_key_embeds_the_namespace_generations(redis_client):
+    key = await cache.versioned_key("match:list:abc", "match", "match:list")
+
+    generations = await redis_client.mget(
+        [
+            f"{cache.GENERATION_KEY_PREFIX}match",
+            f"{cache.GENERATION_KEY_PREFIX}match:list",
+        ]
+    )
+    assert key == f"match:list:abc:v{int(generations[0])}.{int(generations[1])}"
+
+
+async def test_missing_generations_are_seeded_with_the_current_time(redis_client):
+    [generation] = await cache.get_generations(redis_client, ("team",))
+
+    # a counter lost to eviction must not restart below the values in use
+    assert generation > 1_000_000_000_000
+
+
+async def test_invalidating_a_namespace_changes_its_keys_only(redis_client):
+    match_key = await cache.versioned_key("match:list:abc", "match:list")
+    team_key = await cache.versioned_key("team:list:abc", "team:list")
+
+    await cache.invalidate_namespaces("match:list")
+
+    assert await cache.versioned_key("match:list:abc", "match:list") != match_key
+    assert await cache.versioned_key("team:list:abc", "team:list") == team_key
+
+
+async def test_invalidating_a_namespace_is_seen_through_the_local_tier(redis_client):
+    key = await cache.versioned_key("nucleo:list:abc", "nucleo:list")
+    # the generation is now mirrored locally
+    assert cache.local_cache.get("gen:nucleo:list") is not cache._MISSING
+
+    await cache.invalidate_namespaces("nucleo:list")
+
+    assert await cache.versioned_key("nucleo:list:abc", "nucleo:list") != key
+
+
+async def test_without_redis_keys_are_not_versioned(monkeypatch, breaker):
+    monkeypatch.setattr(cache, "CACHE_ENABLED", False)
+
+    assert await cache.versioned_key("match:list:abc", "match") == "match:list:abc"
@@ -0,0 +1,111 @@
+import httpx
+import pytest
+from app import cache
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+pytestmark = pytest.mark.anyio
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+async def client(redis_client, calls):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", response_model=Item)
+    @cache.cached_response(
+        response_model=Item, ttl=3600, namespaces=lambda **_: ("item",)
+    )
+    async def get_item(item_id: int):
+        calls.append(item_id)
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return {"id": item_id, "name": f"item {item_id}", "ignored": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def test_bodies_are_computed_once_then_served_from_the_cache(client, calls):
+    first = await client.get("/items/1")
+    second = await client.get("/items/1")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == {"id": 1, "name": "item 1"}
+    assert second.content == first.content
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert calls == [1]
+
+
+async def test_responses_carry_a_stable_etag_and_capped_max_age(client):
+    first = await client.get("/items/1")
+    second = await client.get("/items/1")
+
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"].startswith('"')
+    assert first.headers["cache-control"] == (
+        f"public, max-age={cache.HTTP_CACHE_MAX_AGE}"
+    )
+    assert first.headers["x-accel-expires"] == str(cache.PROXY_CACHE_MAX_AGE)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", "W/{etag}", '"other", {etag}', "*"],
+)
+async def test_a_matching_if_none_match_gets_a_304(client, if_none_match):
+    etag = (await client.get("/items/1")).headers["etag"]
+
+    response = await client.get(
+        "/items/1", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_etags_are_computed_once_when_the_body_is_stored(client, monkeypatch):
+    hashed = []
+    body_etag = cache.body_etag
+
+    def counting_body_etag(body):
+        hashed.append(body)
+        return body_etag(body)
+
+    monkeypatch.setattr(cache, "body_etag", counting_body_etag)
+
+    first = await client.get("/items/1")
+    second = await client.get("/items/1", headers={"If-None-Match": '"other"'})
+
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["etag"] == first.headers["etag"] == body_etag(first.content)
+    assert hashed == [first.content]
+
+
+async def test_a_stale_etag_gets_the_new_body(client):
+    etag = (await client.get("/items/1")).headers["etag"]
+
+    response = await client.get("/items/2", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+async def test_errors_are_not_cached(client, calls):
+    for _ in range(2):
+        response = await client.get("/items/0")
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+    assert calls == [0, 0]
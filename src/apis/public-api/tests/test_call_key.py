@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+from app import cache
+from app.cache import call_key
+
+
+def test_keys_keep_a_readable_base():
+    assert call_key("match:list", {"skip": 0}).startswith("match:list:")
+
+
+def test_argument_order_does_not_matter():
+    assert call_key("team:list", {"skip": 0, "limit": 50}) == call_key(
+        "team:list", {"limit": 50, "skip": 0}
+    )
+
+
+def test_uuids_and_their_strings_give_the_same_key():
+    team_id = uuid.uuid4()
+
+    assert call_key("team", {"team_id": team_id}) == call_key(
+        "team", {"team_id": str(team_id)}
+    )
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"skip": 0}, {"skip": 1}),
+        ({"season_id": None}, {"season_id": "None"}),
+        ({"q": "a", "r": "b"}, {"q": "a:r:b"}),
+        ({"q": "a", "r": "b"}, {"q": "a", "r": "b", "s": None}),
+    ],
+)
+def test_different_arguments_give_different_keys(a, b):
+    assert call_key("match:list", a) != call_key("match:list", b)
+
+
+@pytest.mark.anyio
+async def test_cached_calls_share_a_key_however_arguments_are_passed(redis_client):
+    calls = []
+
+    @cache.cached("team:list", ttl=60)
+    async def get_teams(db, skip: int = 0, limit: int = 50, nucleo_id=None):
+        calls.append((skip, limit, nucleo_id))
+        return []
+
+    nucleo_id = uuid.uuid4()
+    await get_teams(None, 0, 50, nucleo_id)
+    await get_teams(db=None, nucleo_id=str(nucleo_id))
+    await get_teams(None, limit=50, skip=0, nucleo_id=nucleo_id)
+    assert len(calls) == 1
+
+    # the database session is not part of the key, every other argument is
+    await get_teams(object(), nucleo_id=nucleo_id)
+    assert len(calls) == 1
+    await get_teams(object(), nucleo_id=nucleo_id, limit=20)
+    assert len(calls) == 2
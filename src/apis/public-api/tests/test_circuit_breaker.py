@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+import redis.asyncio as redis
+from app import cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def connection_error():
+    return redis.ConnectionError("Connection refused")
+
+
+def test_only_connectivity_errors_are_counted(breaker):
+    for _ in range(breaker.threshold):
+        breaker.record_failure(redis.ResponseError("WRONGTYPE"))
+        breaker.record_failure(ValueError("bad payload"))
+
+    assert breaker.state == "closed"
+
+
+def test_the_circuit_opens_at_the_threshold(monkeypatch, breaker):
+    monkeypatch.setattr(breaker, "_ensure_probe", lambda: None)
+
+    for _ in range(breaker.threshold - 1):
+        breaker.record_failure(connection_error())
+    assert breaker.state == "closed"
+
+    breaker.record_failure(redis.TimeoutError("Timeout reading from socket"))
+    assert breaker.state == "open"
+    assert breaker.opened_count == 1
+    assert not breaker.allow()
+    assert cache.get_redis_client() is None
+
+
+def test_failures_outside_the_window_are_forgotten(monkeypatch, breaker, clock):
+    monkeypatch.setattr(breaker, "_ensure_probe", lambda: None)
+
+    for _ in range(breaker.threshold - 1):
+        breaker.record_failure(connection_error())
+    clock[0] += breaker.window
+    breaker.record_failure(connection_error())
+
+    assert breaker.state == "closed"
+
+
+def test_an_immediate_failure_opens_the_circuit(monkeypatch, breaker):
+    monkeypatch.setattr(breaker, "_ensure_probe", lambda: None)
+
+    breaker.record_failure(connection_error(), immediate=True)
+
+    assert breaker.state == "open"
+
+
+@pytest.mark.anyio
+async def test_the_probe_backs_off_then_closes_the_circuit(monkeypatch, breaker):
+    sleeps = []
+
+    class FastAsyncio:
+        """asyncio, as seen by the cache module, without the backoff delays."""
+
+        def __getattr__(self, name):
+            return getattr(asyncio, name)
+
+        async def sleep(self, seconds):
+            sleeps.append(seconds)
+            await asyncio.sleep(0)
+
+    pings = []
+
+    class Redis:
+        async def ping(self):
+            pings.append(True)
+            if len(pings) < 3:
+                raise connection_error()
+            return True
+
+    monkeypatch.setattr(cache, "asyncio", FastAsyncio())
+    monkeypatch.setattr(cache, "_connect", Redis)
+    cache.local_cache.set("gen:team", 1, 60)
+
+    breaker.record_failure(connection_error(), immediate=True)
+    await breaker._probe_task
+
+    assert breaker.state == "closed"
+    assert sleeps == [1.0, 2.0, 4.0]
+    assert breaker.allow()
+    # generations may have been bumped while Redis was unreachable
+    assert len(cache.local_cache) == 0
@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+from app import crud
+
+pytestmark = pytest.mark.anyio
+
+
+class Rows:
+    def all(self):
+        return []
+
+
+class FakeSession:
+    async def scalars(self, stmt):
+        return Rows()
+
+
+@pytest.fixture
+def counts(monkeypatch, redis_client):
+    """Statements counted on the database."""
+    counts = []
+
+    async def count(db, stmt):
+        counts.append(stmt)
+        return 42
+
+    monkeypatch.setattr(crud, "_count", count)
+    return counts
+
+
+async def test_pages_of_a_filter_set_share_one_count(counts):
+    db = FakeSession()
+    course_id = uuid.uuid4()
+
+    first = await crud.get_teams(db, skip=0, limit=10, course_id=course_id)
+    second = await crud.get_teams(db, skip=10, limit=10, course_id=course_id)
+
+    assert first == second == ([], 42)
+    assert len(counts) == 1
+
+
+async def test_each_filter_set_has_its_own_count(counts):
+    db = FakeSession()
+
+    await crud.get_teams(db, course_id=uuid.uuid4())
+    await crud.get_teams(db, course_id=uuid.uuid4())
+    await crud.get_teams(db, season_id=3)
+
+    assert len(counts) == 3
+
+
+async def test_a_list_without_total_is_not_counted(counts):
+    assert await crud.get_matches(FakeSession(), include_total=False) == ([], None)
+    assert counts == []
+
+
+async def test_standings_are_counted_per_tournament(counts):
+    db = FakeSession()
+    tournament_id = uuid.uuid4()
+
+    await crud.get_tournament_standings(db, tournament_id, skip=0)
+    await crud.get_tournament_standings(db, tournament_id, skip=100)
+    await crud.get_tournament_standings(db, uuid.uuid4())
+
+    assert len(counts) == 2
@@ -0,0 +1,67 @@
+import pytest
+from app import cache
+from app.cache import _MISSING, LocalCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic of the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_values_until_they_expire(clock):
+    local = LocalCache(max_entries=10)
+    local.set("a", {"id": 1}, ttl=5)
+
+    clock[0] += 4.9
+    assert local.get("a") == {"id": 1}
+
+    clock[0] += 0.1
+    assert local.get("a") is _MISSING
+    assert len(local) == 0
+
+
+def test_least_recently_used_entries_are_evicted_first(clock):
+    local = LocalCache(max_entries=2)
+    local.set("a", 1, ttl=60)
+    local.set("b", 2, ttl=60)
+    local.get("a")  # "b" is now the least recently used
+
+    local.set("c", 3, ttl=60)
+
+    assert local.get("a") == 1
+    assert local.get("b") is _MISSING
+    assert local.get("c") == 3
+
+
+def test_setting_an_existing_key_refreshes_its_value_and_ttl(clock):
+    local = LocalCache(max_entries=2)
+    local.set("a", 1, ttl=5)
+    clock[0] += 4
+    local.set("a", 2, ttl=5)
+
+    clock[0] += 4
+    assert local.get("a") == 2
+    assert len(local) == 1
+
+
+def test_delete_and_clear(clock):
+    local = LocalCache(max_entries=10)
+    for key in "abc":
+        local.set(key, key, ttl=60)
+
+    local.delete("a", "missing")
+    assert local.get("a") is _MISSING
+    assert len(local) == 2
+
+    local.clear()
+    assert len(local) == 0
+
+
+def test_a_zero_size_cache_stores_nothing(clock):
+    local = LocalCache(max_entries=0)
+    local.set("a", 1, ttl=60)
+
+    assert local.get("a") is _MISSING
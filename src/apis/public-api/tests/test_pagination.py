@@ -0,0 +1,105 @@
+import datetime
+import uuid
+
+import pytest
+from app.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    paginate_keyset,
+)
+from sqlalchemy import DateTime, String, Uuid, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Match(Base):
+    __tablename__ = "matches"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+    scheduled_time: Mapped[datetime.datetime] = mapped_column(DateTime)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = datetime.datetime(2026, 3, 1, 18, 0)
+    with Session(engine) as session:
+        session.add_all(
+            Match(
+                id=uuid.uuid4(),
+                name=f"match {i}",
+                # repeated times, so the id has to break ties
+                scheduled_time=start + datetime.timedelta(hours=i // 3),
+            )
+            for i in range(10)
+        )
+        session.commit()
+        yield session
+
+
+def test_cursor_round_trip_restores_column_types():
+    match_id = uuid.uuid4()
+    scheduled_time = datetime.datetime(2026, 3, 1, 18, 30)
+    columns = (Match.scheduled_time, Match.name, Match.id)
+
+    cursor = encode_cursor(scheduled_time, "Ténis: final", match_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, *columns) == (scheduled_time, "Ténis: final", match_id)
+
+
+def test_cursor_round_trip_keeps_nulls():
+    cursor = encode_cursor(None, "a")
+
+    assert decode_cursor(cursor, Match.scheduled_time, Match.name) == (None, "a")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        encode_cursor("only one value"),
+        "e30",  # {}
+        "bm90IGpzb24",  # not json
+    ],
+)
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, Match.name, Match.id)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_follow_each_other_without_gaps_or_duplicates(session, descending):
+    columns = (Match.scheduled_time, Match.id)
+    expected = session.scalars(
+        select(Match).order_by(*[c.desc() if descending else c.asc() for c in columns])
+    ).all()
+
+    pages, cursor = [], ""
+    while cursor is not None:
+        page = session.scalars(
+            paginate_keyset(select(Match), columns, cursor, 4, descending)
+        ).all()
+        pages.append(page)
+        cursor = next_cursor(page, columns, 4)
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert [match for page in pages for match in page] == expected
+
+
+def test_next_cursor_reads_cached_dicts_like_rows(session):
+    columns = (Match.scheduled_time, Match.id)
+    page = session.scalars(paginate_keyset(select(Match), columns, "", 4)).all()
+    cached = [
+        {"scheduled_time": match.scheduled_time, "id": match.id} for match in page
+    ]
+
+    assert next_cursor(cached, columns, 4) == next_cursor(page, columns, 4)
+    assert next_cursor(cached[:3], columns, 4) is None
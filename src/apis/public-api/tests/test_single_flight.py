@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from app import cache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_release_lock_only_deletes_its_own_lock(redis_client):
+    token = await cache._acquire_lock(redis_client, "match:list:abc")
+    assert token is not None
+    assert await cache._acquire_lock(redis_client, "match:list:abc") is None
+
+    await cache._release_lock(redis_client, "match:list:abc", "another-token")
+    assert await redis_client.get("match:list:abc:lock") == token.encode()
+
+    await cache._release_lock(redis_client, "match:list:abc", token)
+    assert await redis_client.get("match:list:abc:lock") is None
+
+
+async def test_release_lock_leaves_a_lock_taken_after_expiry(redis_client):
+    await redis_client.set("warmup:lock", "new-holder")
+
+    assert not await cache.release_lock(redis_client, "warmup:lock", "old-holder")
+    assert await redis_client.get("warmup:lock") == b"new-holder"
+
+
+async def test_concurrent_misses_query_the_database_once(redis_client):
+    calls = []
+
+    @cache.cached("team:list", ttl=60)
+    async def get_teams(db, page: int = 1):
+        calls.append(page)
+        await asyncio.sleep(0.1)
+        return [{"page": page}]
+
+    results = await asyncio.gather(*[get_teams(None, page=1) for _ in range(5)])
+
+    assert results == [[{"page": 1}]] * 5
+    assert calls == [1]
+
+
+async def test_stale_values_are_served_while_refreshed_once(redis_client):
+    calls = []
+
+    @cache.cached("match:list", ttl=60, stale_ttl=30)
+    async def get_matches(db):
+        calls.append(len(calls))
+        return {"version": len(calls)}
+
+    assert await get_matches(None) == {"version": 1}
+    # age the entry into its stale window
+    [key] = [k for k in await redis_client.keys("match:list:*") if b":lock" not in k]
+    await redis_client.pexpire(key, 10_000)
+
+    assert await get_matches(None) == {"version": 1}
+    await asyncio.gather(*cache._refresh_tasks)
+
+    assert await get_matches(None) == {"version": 2}
+    assert len(calls) == 2
@@ -0,0 +1,113 @@
+"""
+Public API cache payload encoding: stdlib json vs orjson.
+
+Encodes and decodes a page of MatchDetailView rows (the result of a cached list
+route) with the former stdlib json encoding (reproduced below) and with the
+current cache encoding (orjson), and reports the mean time of each and the
+encoded size.
+
+Run from the repository root (needs the public API requirements):
+
+    python tests/performance/cache_encoding.py
+    python tests/performance/cache_encoding.py --rows 500 --runs 200
+"""
+
+import argparse
+import datetime
+import json
+import sys
+import timeit
+import uuid
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src/apis/public-api"))
+
+import orjson  # noqa: E402
+from app import cache  # noqa: E402
+from app.models import MatchDetailView  # noqa: E402
+
+
+def stdlib_json_serializer(obj: Any) -> Any:
+    """The former `default` of json.dumps, walking __table__ for every row."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+
+    if hasattr(obj, "__table__"):
+        result = {}
+        for col in obj.__table__.columns:
+            val = getattr(obj, col.name, None)
+            if isinstance(val, uuid.UUID):
+                result[col.name] = str(val)
+            elif hasattr(val, "isoformat"):
+                result[col.name] = val.isoformat()
+            else:
+                result[col.name] = val
+        return result
+
+    return str(obj)
+
+
+def stdlib_serialize(result: Any) -> str:
+    return json.dumps(result, default=stdlib_json_serializer, separators=(",", ":"))
+
+
+def match_page(rows: int) -> tuple[list, int]:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    matches = [
+        MatchDetailView(
+            match_id=uuid.uuid4(),
+            location="Pavilhão Desportivo",
+            status="scheduled",
+            start_time=now + datetime.timedelta(hours=i),
+            tournament_id=uuid.uuid4(),
+            tournament_name="Torneio de Futsal",
+            modality_id=uuid.uuid4(),
+            modality_name="Futsal",
+            participants=[
+                {"team_id": str(uuid.uuid4()), "name": f"Equipa {j}", "score": j}
+                for j in range(2)
+            ],
+            results={"winner": None, "scores": [0, 0]},
+            participant_count=2,
+            comment_count=0,
+            nucleos_ids=[uuid.uuid4(), uuid.uuid4()],
+            courses_ids=[uuid.uuid4(), uuid.uuid4()],
+        )
+        for i in range(rows)
+    ]
+    return matches, rows * 10
+
+
+def mean_ms(function, runs: int) -> float:
+    return timeit.timeit(function, number=runs) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    page = match_page(args.rows)
+    before, after = stdlib_serialize(page), cache._serialize(page)
+    # both encodings decode to the same payload
+    assert json.loads(before) == orjson.loads(after)
+
+    print(f"{args.rows} MatchDetailView rows, mean of {args.runs} runs")
+    print(
+        f"  encode   json {mean_ms(lambda: stdlib_serialize(page), args.runs):6.2f} ms"
+        f"   orjson {mean_ms(lambda: cache._serialize(page), args.runs):6.2f} ms"
+    )
+    print(
+        f"  decode   json {mean_ms(lambda: json.loads(before), args.runs):6.2f} ms"
+        f"   orjson {mean_ms(lambda: orjson.loads(after), args.runs):6.2f} ms"
+    )
+    print(
+        f"  size     json {len(before.encode()) / 1000:6.1f} kB"
+        f"   orjson {len(after) / 1000:6.1f} kB"
+    )
+
+
+if __name__ == "__main__":
+    main()
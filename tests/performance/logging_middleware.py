@@ -0,0 +1,152 @@
+"""
+Public API logging middleware overhead: BaseHTTPMiddleware vs pure ASGI.
+
+Calls a small GET route directly through ASGI (no server, no network), with
+no middleware, with the former BaseHTTPMiddleware implementation of the
+request logging (reproduced below) and with the current StructlogMiddleware,
+and reports the per-request latency (p50/p99). Records go to a NullHandler, so
+only the middleware and structlog themselves are measured.
+
+Run from the repository root (needs the public API requirements):
+
+    python tests/performance/logging_middleware.py
+    python tests/performance/logging_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src/apis/public-api"))
+
+import structlog  # noqa: E402
+from app.logger import StructlogMiddleware  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+
+class BaseHTTPStructlogMiddleware(BaseHTTPMiddleware):
+    """The request logging as a BaseHTTPMiddleware, as before the pure ASGI rewrite."""
+
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        path = request.url.path
+        method = request.method
+        action = StructlogMiddleware._extract_action(None, path, method)
+
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id, method=method, path=path, action=action
+        )
+        logger = structlog.get_logger()
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+            logger.info(
+                "request_completed",
+                extra={
+                    "action": action,
+                    "status_code": response.status_code,
+                    "duration_ms": duration_ms,
+                },
+            )
+            response.headers["X-Request-ID"] = request_id
+            return response
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/teams")
+    async def list_teams():
+        return ORJSONResponse({"items": list(range(50))})
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "path": "/teams",
+    "raw_path": b"/teams",
+    "root_path": "",
+    "scheme": "http",
+    "query_string": b"",
+    "headers": [(b"host", b"localhost"), (b"x-request-id", b"benchmark")],
+    "server": ("localhost", 80),
+    "client": ("127.0.0.1", 50000),
+}
+
+
+async def call(app) -> list[dict]:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app(dict(SCOPE), receive, send)
+    return messages
+
+
+async def measure(app, requests: int, warmup: int = 300) -> list[float]:
+    """Latency of each request, in µs."""
+    for _ in range(warmup):
+        await call(app)
+
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await call(app)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+async def run(requests: int):
+    for name, middleware in (
+        ("no middleware", None),
+        ("BaseHTTPMiddleware", BaseHTTPStructlogMiddleware),
+        ("pure ASGI", StructlogMiddleware),
+    ):
+        app = build_app(middleware)
+        start = (await call(app))[0]
+        assert start["status"] == 200
+        if middleware is not None:
+            assert (b"x-request-id", b"benchmark") in start["headers"]
+
+        latencies = sorted(await measure(app, requests))
+        print(
+            f"  {name:20s} p50 {statistics.median(latencies):6.0f} us   "
+            f"p99 {latencies[int(len(latencies) * 0.99)]:6.0f} us"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    root = logging.getLogger()
+    root.handlers = [logging.NullHandler()]
+    root.setLevel(logging.INFO)
+
+    print(f"{args.requests} ASGI calls of GET /teams")
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
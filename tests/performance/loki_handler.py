@@ -0,0 +1,102 @@
+"""
+Loki handler emit latency: logging_loki.LokiHandler vs BatchedLokiHandler.
+
+Logs the same records through both handlers against a local Loki stub that
+answers every push after a fixed delay, and reports the time logger.info()
+blocks the caller (p50/p99), plus the pushes and records the stub received.
+
+Run from the repository root (needs the public API requirements):
+
+    python tests/performance/loki_handler.py
+    python tests/performance/loki_handler.py --records 1000 --delay 50
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src/apis/public-api"))
+
+import logging_loki  # noqa: E402
+from app.loki import BatchedLokiHandler  # noqa: E402
+
+
+class LokiStub(BaseHTTPRequestHandler):
+    """Accept Loki pushes after `delay` seconds, counting pushes and records."""
+
+    delay = 0.02
+    pushes = 0
+    records = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        records = sum(len(s["values"]) for s in json.loads(body)["streams"])
+        time.sleep(self.delay)
+        with self.lock:
+            LokiStub.pushes += 1
+            LokiStub.records += records
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(handler: logging.Handler, records: int) -> list[float]:
+    """Emit latency of each record, in ms."""
+    logger = logging.getLogger(f"loki-benchmark-{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    latencies = []
+    for i in range(records):
+        start = time.perf_counter()
+        logger.info("request_completed", extra={"status_code": 200, "i": i})
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    logger.removeHandler(handler)
+    handler.close()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=300)
+    parser.add_argument("--delay", type=float, default=20, help="Loki delay in ms")
+    args = parser.parse_args()
+
+    LokiStub.delay = args.delay / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LokiStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/loki/api/v1/push"
+    tags = {"application": "public-api"}
+
+    print(f"{args.records} records, Loki answering in {args.delay:g} ms")
+    for name, handler in (
+        ("LokiHandler", logging_loki.LokiHandler(url=url, tags=tags, version="1")),
+        ("BatchedLokiHandler", BatchedLokiHandler(url=url, tags=tags)),
+    ):
+        LokiStub.pushes = LokiStub.records = 0
+        latencies = sorted(measure(handler, args.records))
+        print(
+            f"  {name:20s} p50 {statistics.median(latencies):7.3f} ms   "
+            f"p99 {latencies[int(len(latencies) * 0.99)]:7.3f} ms   "
+            f"pushes {LokiStub.pushes:4d}   records received {LokiStub.records}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
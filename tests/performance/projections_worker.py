@@ -0,0 +1,138 @@
+"""
+Projections worker throughput: requests processed per second vs thread count.
+
+For each thread count, queues `--requests` match projection update requests
+(one per match, cycling through the matches of the database), runs a
+ProjectionsWorker with that many threads until they are all processed, and
+reports the requests processed per second. The requests of a run are deleted
+afterwards.
+
+It needs the competition API environment (Postgres populated with
+tools/populate_db2.py, Redis). Stop the projections worker first, or it takes
+part of the requests:
+
+    docker compose -f docker-compose.dev.yml stop competition-api-v3-projections-updater-worker
+    docker compose -f docker-compose.dev.yml run --rm \\
+        -v ./tests/performance:/benchmarks \\
+        competition-api-v3-projections-updater-worker \\
+        python /benchmarks/projections_worker.py --threads 1 2 4
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# the competition API sources: the working directory in its containers
+sys.path.insert(0, os.getcwd())
+sys.path.insert(
+    1, str(Path(__file__).resolve().parents[2] / "src/apis/competition-api-v3")
+)
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "config.settings_worker_projections_updater"
+)
+
+import django  # noqa: E402
+
+django.setup()
+
+from apps.matches.models import Match  # noqa: E402
+from django.db import connection  # noqa: E402
+from workers.projections_updater.models import (  # noqa: E402
+    ProjectionUpdateRequest,
+    ProjectionUpdateRequestTypes,
+)
+from workers.projections_updater.service import ProjectionsWorker  # noqa: E402
+
+KEY_PREFIX = "benchmark"
+
+
+def queue_requests(run: int, count: int) -> None:
+    match_ids = list(Match.objects.values_list("id", flat=True))
+    if not match_ids:
+        raise SystemExit("No matches: populate the database first.")
+
+    ProjectionUpdateRequest.objects.bulk_create(
+        [
+            ProjectionUpdateRequest(
+                projection_type=ProjectionUpdateRequestTypes.MATCH,
+                payload={"match_id": str(match_id)},
+                key=f"{KEY_PREFIX}_{run}_{i}",
+                status=ProjectionUpdateRequest.Status.PENDING,
+            )
+            for i, match_id in zip(range(count), itertools.cycle(match_ids))
+        ]
+    )
+
+
+def run_requests(run: int):
+    return ProjectionUpdateRequest.objects.filter(
+        key__startswith=f"{KEY_PREFIX}_{run}_"
+    )
+
+
+def measure(run: int, threads: int, batch_size: int) -> tuple[float, int]:
+    """Seconds to handle the queued requests, and how many of them failed."""
+    worker = ProjectionsWorker(threads=threads, batch_size=batch_size)
+    # requests that failed wait for a retry: they are not waited for
+    unfinished = run_requests(run).filter(
+        status__in=[
+            ProjectionUpdateRequest.Status.PENDING,
+            ProjectionUpdateRequest.Status.PROCESSING,
+        ],
+        retry_at__isnull=True,
+    )
+    elapsed = None
+
+    def stop_when_done():
+        nonlocal elapsed
+        while unfinished.exists():
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        worker.stop()
+        connection.close()
+
+    start = time.perf_counter()
+    monitor = threading.Thread(target=stop_when_done, daemon=True)
+    monitor.start()
+    # the worker handles signals: it runs on the main thread
+    worker.run()
+    monitor.join()
+
+    processed = run_requests(run).filter(
+        status=ProjectionUpdateRequest.Status.PROCESSED
+    )
+    return elapsed, run_requests(run).count() - processed.count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    run_id = int(time.time())
+    print(f"{args.requests} match projection requests, batches of {args.batch_size}")
+    for i, threads in enumerate(args.threads):
+        run = run_id * 100 + i
+        queue_requests(run, args.requests)
+        try:
+            elapsed, failed = measure(run, threads, args.batch_size)
+        finally:
+            run_requests(run).delete()
+
+        print(
+            f"  {threads:2d} threads   {elapsed:7.2f} s   "
+            f"{args.requests / elapsed:8.1f} requests/s   {failed} failed"
+        )
+
+
+if __name__ == "__main__":
+    main()